@@ -0,0 +1 @@
+"""Benchmarks for `discatcore`. These are ran from the root of the repository."""
@@ -0,0 +1,126 @@
+"""Helpers shared between the benchmarks."""
+
+import json
+import pathlib
+import typing as t
+
+
+def _discord_json(payload: dict[str, t.Any]) -> bytes:
+    # Discord sends compact JSON with the envelope before the data
+    ordered = {"t": payload.get("t"), "s": payload.get("s"), "op": payload["op"], "d": payload["d"]}
+    return json.dumps(ordered, separators=(",", ":")).encode("utf-8")
+
+
+def _user(i: int) -> dict[str, t.Any]:
+    return {
+        "id": str(1100000000000000000 + i),
+        "username": f"user{i}",
+        "discriminator": f"{i % 10000:04}",
+        "avatar": "a" * 32,
+        "bot": False,
+    }
+
+
+def _member(i: int) -> dict[str, t.Any]:
+    return {
+        "user": _user(i),
+        "roles": [str(1200000000000000000 + r) for r in range(i % 4)],
+        "joined_at": "2022-01-01T00:00:00.000000+00:00",
+        "deaf": False,
+        "mute": False,
+        "flags": 0,
+    }
+
+
+def _guild(i: int, member_count: int) -> dict[str, t.Any]:
+    guild_id = str(1000000000000000000 + i)
+    return {
+        "id": guild_id,
+        "name": f"guild {i}",
+        "icon": None,
+        "owner_id": _user(0)["id"],
+        "large": member_count > 250,
+        "member_count": member_count,
+        "roles": [
+            {"id": str(1200000000000000000 + r), "name": f"role {r}", "permissions": "0"}
+            for r in range(20)
+        ],
+        "channels": [
+            {"id": str(1300000000000000000 + c), "type": 0, "name": f"channel-{c}", "position": c}
+            for c in range(50)
+        ],
+        "members": [_member(m) for m in range(min(member_count, 100))],
+        "presences": [],
+        "voice_states": [],
+        "emojis": [],
+        "stickers": [],
+    }
+
+
+def _synthetic_corpus(count: int = 2000) -> list[bytes]:
+    guild_count = 20
+    payloads: list[dict[str, t.Any]] = [
+        {
+            "op": 0,
+            "t": "READY",
+            "d": {
+                "v": 10,
+                "user": _user(0),
+                "guilds": [
+                    {"id": str(1000000000000000000 + g), "unavailable": True}
+                    for g in range(guild_count)
+                ],
+                "session_id": "0" * 32,
+                "resume_gateway_url": "wss://gateway.discord.gg",
+                "application": {"id": _user(0)["id"], "flags": 0},
+            },
+        }
+    ]
+    payloads.extend(
+        {"op": 0, "t": "GUILD_CREATE", "d": _guild(g, 50 + g * 100)} for g in range(guild_count)
+    )
+
+    for i in range(count - len(payloads)):
+        guild_id = str(1000000000000000000 + i % guild_count)
+        if i % 3:
+            data: dict[str, t.Any] = {
+                "id": str(1400000000000000000 + i),
+                "channel_id": str(1300000000000000000 + i % 50),
+                "guild_id": guild_id,
+                "author": _user(i % 500),
+                "member": {k: v for k, v in _member(i % 500).items() if k != "user"},
+                "content": f"message number {i}",
+                "timestamp": "2022-01-01T00:00:00.000000+00:00",
+                "tts": False,
+                "mention_everyone": False,
+                "mentions": [],
+                "mention_roles": [],
+                "attachments": [],
+                "embeds": [],
+                "pinned": False,
+                "type": 0,
+            }
+            payloads.append({"op": 0, "t": "MESSAGE_CREATE", "d": data})
+        else:
+            data = {
+                "user": {"id": _user(i % 500)["id"]},
+                "guild_id": guild_id,
+                "status": ("online", "idle", "dnd")[i % 3],
+                "activities": [{"name": "a game", "type": 0, "created_at": 1640995200000}],
+                "client_status": {"desktop": "online"},
+            }
+            payloads.append({"op": 0, "t": "PRESENCE_UPDATE", "d": data})
+
+    for s, payload in enumerate(payloads, start=1):
+        payload["s"] = s
+    return [_discord_json(payload) for payload in payloads]
+
+
+def load_corpus(path: t.Optional[str]) -> list[bytes]:
+    """Loads a corpus of Gateway payloads. If no path is provided, then a synthetic corpus of READY,
+    GUILD_CREATE, MESSAGE_CREATE and PRESENCE_UPDATE payloads is generated.
+    """
+    if path is None:
+        return _synthetic_corpus()
+
+    return [line.encode("utf-8") for line in pathlib.Path(path).read_text().splitlines() if line]
@@ -0,0 +1,80 @@
+"""Benchmarks the Gateway transport decompressors against recorded frames.
+
+Usage:
+    python -m benchmarks.compression [--payloads FILE] [--rounds N]
+
+FILE is a JSON lines file with one Gateway payload per line (as it was received from the Gateway).
+Every payload is compressed the same way Discord does it (one flush per payload) so each backend
+decompresses identical data.
+"""
+
+import argparse
+import time
+import zlib
+
+from benchmarks.common import load_corpus
+from discatcore.gateway.compression import BaseDecompressor, get_decompressor, has_zstandard
+
+if has_zstandard:
+    import zstandard
+
+
+def compress_frames(name: str, payloads: list[bytes]) -> list[bytes]:
+    if name == "zlib-stream":
+        zlib_compressor = zlib.compressobj()
+        return [
+            zlib_compressor.compress(payload) + zlib_compressor.flush(zlib.Z_SYNC_FLUSH)
+            for payload in payloads
+        ]
+
+    zstd_compressor = zstandard.ZstdCompressor().compressobj()
+    return [
+        zstd_compressor.compress(payload) + zstd_compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        for payload in payloads
+    ]
+
+
+def bench_decompressor(decompressor: BaseDecompressor, frames: list[bytes]) -> float:
+    decompressor.reset()
+    start = time.perf_counter()
+    for frame in frames:
+        decompressor.decompress(frame)
+    return time.perf_counter() - start
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="benchmarks.compression",
+        description="Benchmarks the Gateway transport decompressors.",
+    )
+    parser.add_argument(
+        "--payloads", default=None, help="A JSON lines file of recorded Gateway payloads."
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="How many rounds to run.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    payloads = load_corpus(args.payloads)
+    raw_size = sum(len(payload) for payload in payloads)
+
+    names = ["zlib-stream"]
+    if has_zstandard:
+        names.append("zstd-stream")
+
+    for name in names:
+        frames = compress_frames(name, payloads)
+        decompressor = get_decompressor(name)
+        best = min(bench_decompressor(decompressor, frames) for _ in range(args.rounds))
+        compressed_size = sum(len(frame) for frame in frames)
+
+        print(
+            f"{name}: {len(frames) / best:,.0f} msgs/sec, "
+            f"{raw_size / best / 1024 / 1024:,.1f} MiB/sec, "
+            f"ratio {compressed_size / raw_size:.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
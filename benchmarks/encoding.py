@@ -0,0 +1,74 @@
+"""Benchmarks decoding Gateway payloads with JSON (`discatcore.utils.json`) and ETF (`discatcore.utils.etf`).
+
+Usage:
+    python -m benchmarks.encoding [--payloads FILE] [--rounds N]
+
+FILE is a JSON lines file with one Gateway payload per line. The ETF version of every payload
+is generated with snowflakes as integers, like the Gateway sends them.
+"""
+
+import argparse
+import json
+import time
+import typing as t
+from collections.abc import Callable
+
+from benchmarks.common import load_corpus
+from discatcore.utils import etf
+from discatcore.utils.json import has_orjson, loads
+
+
+def _is_snowflake(key: str, value: t.Any) -> bool:
+    return isinstance(value, str) and (key == "id" or key.endswith("_id")) and value.isdigit()
+
+
+def _snowflakes_to_ints(obj: t.Any) -> t.Any:
+    if isinstance(obj, dict):
+        return {
+            k: int(v) if _is_snowflake(k, v) else _snowflakes_to_ints(v)
+            for k, v in t.cast(dict[str, t.Any], obj).items()
+        }
+    if isinstance(obj, list):
+        return [_snowflakes_to_ints(item) for item in t.cast(list[t.Any], obj)]
+    return obj
+
+
+def bench_decoder(decoder: Callable[[t.Any], t.Any], payloads: list[t.Any]) -> float:
+    start = time.perf_counter()
+    for payload in payloads:
+        decoder(payload)
+    return time.perf_counter() - start
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="benchmarks.encoding",
+        description="Benchmarks decoding Gateway payloads with JSON and ETF.",
+    )
+    parser.add_argument(
+        "--payloads", default=None, help="A JSON lines file of recorded Gateway payloads."
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="How many rounds to run.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    json_payloads = load_corpus(args.payloads)
+    etf_payloads = [etf.dumps(_snowflakes_to_ints(json.loads(p))) for p in json_payloads]
+
+    decoders: list[tuple[str, Callable[[t.Any], t.Any], list[t.Any]]] = [
+        ("orjson" if has_orjson else "json", loads, json_payloads),
+        ("etf", etf.loads, etf_payloads),
+    ]
+
+    for name, decoder, payloads in decoders:
+        best = min(bench_decoder(decoder, payloads) for _ in range(args.rounds))
+        size = sum(len(payload) for payload in payloads)
+        print(
+            f"{name}: {len(payloads) / best:,.0f} msgs/sec, {size / len(payloads):,.0f} bytes/msg"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""Benchmarks the stages of the Gateway hot path in isolation.
+
+Usage:
+    python -m benchmarks.gateway [--payloads FILE] [--rounds N] [--compression NAME] [--lazy]
+
+FILE is a JSON lines file with one Gateway payload per line. If it is not provided, then a synthetic
+corpus of READY, GUILD_CREATE, MESSAGE_CREATE and PRESENCE_UPDATE payloads is used.
+
+Every stage reports msgs/sec (best of N rounds) and the average amount of memory (traced with
+tracemalloc) allocated while handling one message.
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+import typing as t
+import zlib
+from collections.abc import Callable
+
+import aiohttp
+
+from benchmarks.common import load_corpus
+from discatcore.errors import GatewayReconnect
+from discatcore.gateway import GatewayClient
+from discatcore.gateway.types import BaseTypedWSMessage
+from discatcore.http import HTTPClient
+from discatcore.utils import Dispatcher
+from discatcore.utils.json import loads
+
+_CLOSED = aiohttp.WSMessage(aiohttp.WSMsgType.CLOSED, None, None)
+
+
+class _AllocationTracker:
+    # measures the peak amount of memory allocated between two calls of step()
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.steps = 0
+        self._baseline = 0
+
+    def start(self) -> None:
+        tracemalloc.reset_peak()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+
+    def step(self) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        self.total += peak - self._baseline
+        self.steps += 1
+        tracemalloc.reset_peak()
+        self._baseline = current
+
+    @property
+    def per_step(self) -> float:
+        return self.total / self.steps if self.steps else 0.0
+
+
+class _ReplayWebSocket:
+    # a stand-in for aiohttp.ClientWebSocketResponse that replays websocket messages
+
+    def __init__(self, msgs: list[aiohttp.WSMessage], tracker: t.Optional[_AllocationTracker]):
+        self._msgs = iter(msgs)
+        self._tracker = tracker
+        self.closed = False
+
+    async def receive(self) -> aiohttp.WSMessage:
+        if self._tracker is not None:
+            self._tracker.step()
+        return next(self._msgs, _CLOSED)
+
+    async def close(self, *, code: int = 1000) -> None:
+        self.closed = True
+
+    async def send_json(self, data: t.Any, *, dumps: Callable[[t.Any], str]) -> None:
+        pass
+
+    async def send_bytes(self, data: bytes) -> None:
+        pass
+
+
+def compress_frames(payloads: list[bytes]) -> list[bytes]:
+    compressor = zlib.compressobj()
+    return [compressor.compress(p) + compressor.flush(zlib.Z_SYNC_FLUSH) for p in payloads]
+
+
+def make_client(dispatcher: Dispatcher, compression: t.Optional[str], lazy: bool) -> GatewayClient:
+    return GatewayClient(
+        HTTPClient("token"), dispatcher, compression=compression, lazy_dispatch=lazy
+    )
+
+
+def to_msgs(frames: list[bytes], compressed: bool) -> list[aiohttp.WSMessage]:
+    if compressed:
+        return [aiohttp.WSMessage(aiohttp.WSMsgType.BINARY, frame, None) for frame in frames]
+    return [
+        aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, frame.decode("utf-8"), None) for frame in frames
+    ]
+
+
+def bench_sync(func: Callable[[t.Any], t.Any], items: list[t.Any]) -> float:
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return time.perf_counter() - start
+
+
+def allocations_sync(func: Callable[[t.Any], t.Any], items: list[t.Any]) -> float:
+    tracker = _AllocationTracker()
+    tracker.start()
+    for item in items:
+        func(item)
+        tracker.step()
+    return tracker.per_step
+
+
+async def drain_tasks() -> None:
+    # let every dispatched callback run
+    while len(asyncio.all_tasks()) > 1:
+        await asyncio.sleep(0)
+
+
+async def run_connection_loop(
+    client: GatewayClient, msgs: list[aiohttp.WSMessage], tracker: t.Optional[_AllocationTracker]
+) -> float:
+    # the connection loop runs until the replayed messages run out, which looks like a dropped connection
+    client._ws = t.cast(t.Any, _ReplayWebSocket(msgs, tracker))
+    client._closing = False
+    if client.decompressor is not None:
+        client.decompressor.reset()
+
+    start = time.perf_counter()
+    try:
+        await client.connection_loop()
+    except GatewayReconnect:
+        pass
+    await drain_tasks()
+    return time.perf_counter() - start
+
+
+async def bench_dispatch(
+    dispatcher: Dispatcher, events: list[tuple[str, t.Any]], tracker: t.Optional[_AllocationTracker]
+) -> float:
+    start = time.perf_counter()
+    for name, data in events:
+        dispatcher.dispatch(name, data)
+        if tracker is not None:
+            tracker.step()
+
+    await drain_tasks()
+    return time.perf_counter() - start
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="benchmarks.gateway",
+        description="Benchmarks the stages of the Gateway hot path.",
+    )
+    parser.add_argument(
+        "--payloads", default=None, help="A JSON lines file of recorded Gateway payloads."
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="How many rounds to run.")
+    parser.add_argument(
+        "--compression",
+        choices=("zlib-stream", "none"),
+        default="zlib-stream",
+        help="The transport compression to benchmark with.",
+    )
+    parser.add_argument(
+        "--lazy", action="store_true", help="Enable lazy dispatching in the connection loop."
+    )
+    return parser.parse_args()
+
+
+def report(name: str, count: int, best: float, allocated: float) -> None:
+    print(f"{name}: {count / best:,.0f} msgs/sec, {allocated:,.0f} B/msg allocated")
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    payloads = load_corpus(args.payloads)
+    compression = None if args.compression == "none" else args.compression
+    frames = compress_frames(payloads) if compression is not None else payloads
+    msgs = to_msgs(frames, compression is not None)
+    count = len(payloads)
+
+    dispatcher = Dispatcher()
+    events = sorted({t.cast(str, loads(p).get("t")).lower() for p in payloads})
+    for event in events:
+
+        async def callback(data: t.Any) -> None:
+            pass
+
+        dispatcher.callback_for(event)(callback)
+
+    client = make_client(dispatcher, compression, args.lazy)
+    decoded = [(t.cast(str, p["t"]).lower(), p["d"]) for p in map(loads, payloads)]
+
+    def decompress(frame: bytes) -> t.Optional[bytes]:
+        return client._decompress_msg(frame)
+
+    def reset_decompressor() -> None:
+        if client.decompressor is not None:
+            client.decompressor.reset()
+
+    sync_stages: list[tuple[str, Callable[[t.Any], t.Any], list[t.Any]]] = [
+        ("convert_from_untyped", BaseTypedWSMessage.convert_from_untyped, msgs),
+        ("loads", loads, payloads),
+    ]
+    if compression is not None:
+        sync_stages.insert(0, ("_decompress_msg", decompress, frames))
+
+    # every stage is timed without tracemalloc, which slows everything down, and then traced once
+    for name, func, items in sync_stages:
+        rounds: list[float] = []
+        for _ in range(args.rounds):
+            reset_decompressor()
+            rounds.append(bench_sync(func, items))
+
+        reset_decompressor()
+        tracemalloc.start()
+        allocated = allocations_sync(func, items)
+        tracemalloc.stop()
+        report(name, count, min(rounds), allocated)
+
+    # the whole connection loop, including handing events over to the dispatcher
+    best = min([await run_connection_loop(client, msgs, None) for _ in range(args.rounds)])
+    tracemalloc.start()
+    tracker = _AllocationTracker()
+    tracker.start()
+    await run_connection_loop(client, msgs, tracker)
+    tracemalloc.stop()
+    report("connection_loop", count, best, tracker.per_step)
+
+    # dispatching decoded events to callbacks
+    best = min([await bench_dispatch(dispatcher, decoded, None) for _ in range(args.rounds)])
+    tracemalloc.start()
+    tracker = _AllocationTracker()
+    tracker.start()
+    await bench_dispatch(dispatcher, decoded, tracker)
+    tracemalloc.stop()
+    report("Dispatcher.dispatch", count, best, tracker.per_step)
+
+
+def main() -> None:
+    asyncio.run(main_async(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Benchmarks the REST client: the stages every request goes through and the whole request pipeline.
+
+Usage:
+    python -m benchmarks.rest [--rounds N] [--requests N]
+
+The request pipeline is measured against a local `discatcore.testing.FakeREST` server with limits high
+enough to never ratelimit. The same requests are also sent straight through aiohttp, and the difference
+between both is reported as the overhead of `HTTPClient.request` (p50 and p99).
+
+Finally, a burst of requests that is held up by the global limit of the client is sent, and the 429s
+`FakeREST` returned are reported. The ratelimiters should never let a request through that Discord would
+ratelimit, so this exits with an error if there were any.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import typing as t
+from collections.abc import Callable
+
+import aiohttp
+
+from discatcore.http import HTTPClient, Route, RouteTemplate
+from discatcore.http.client import _filter_dict_for_unset
+from discatcore.http.ratelimiter import Ratelimiter
+from discatcore.testing import BucketConfig, FakeREST
+from discatcore.types import Unset
+
+_ROUTE_URL = "/channels/{channel_id}/messages/{message_id}"
+_ROUTE_KEY = "GET " + _ROUTE_URL
+_ROUTE_TEMPLATE = RouteTemplate("GET", _ROUTE_URL)
+
+
+def bench_op(func: Callable[[], t.Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return time.perf_counter() - start
+
+
+def micro_stages() -> list[tuple[str, Callable[[], t.Any]]]:
+    route = Route("GET", _ROUTE_URL, channel_id=1000000000000000000, message_id=1000000000000000001)
+    params = {"content": "hello", "tts": False, "embeds": Unset, "nonce": Unset, "flags": Unset}
+    ratelimiter = Ratelimiter()
+    ratelimiter.learn_hash(route.template.key, route.major_params, "abcdef")
+
+    return [
+        (
+            "Route()",
+            lambda: Route(
+                "GET", _ROUTE_URL, channel_id=1000000000000000000, message_id=1000000000000000001
+            ),
+        ),
+        (
+            "Route(template)",
+            lambda: Route(
+                _ROUTE_TEMPLATE, channel_id=1000000000000000000, message_id=1000000000000000001
+            ),
+        ),
+        ("Route.endpoint", lambda: route.endpoint),
+        ("Route.bucket", lambda: route.bucket),
+        ("_filter_dict_for_unset", lambda: _filter_dict_for_unset(params)),
+        (
+            "Ratelimiter.get_route_bucket",
+            lambda: ratelimiter.get_route_bucket(route.template.key, route.major_params),
+        ),
+    ]
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def time_requests(send: Callable[[int], t.Awaitable[t.Any]], count: int) -> list[float]:
+    latencies: list[float] = []
+    for i in range(count):
+        start = time.perf_counter()
+        await send(i)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def bench_pipeline(count: int) -> None:
+    # limits high enough to never be hit, only the overhead is measured
+    routes = {_ROUTE_KEY: BucketConfig(limit=1_000_000, reset_after=60.0)}
+    async with FakeREST(routes, global_limit=None) as server:
+        http = HTTPClient("token", api_url=server.url, global_limit=1_000_000)
+        session = aiohttp.ClientSession()
+
+        async def raw(i: int) -> t.Any:
+            url = f"{server.url}/channels/1000000000000000000/messages/{i}"
+            async with session.get(url, headers=http.default_headers) as resp:
+                return await resp.json()
+
+        async def client(i: int) -> t.Any:
+            return await http.request(
+                Route(_ROUTE_TEMPLATE, channel_id=1000000000000000000, message_id=i)
+            )
+
+        # warm up the connection pools
+        await time_requests(raw, 50)
+        await time_requests(client, 50)
+
+        raw_latencies = await time_requests(raw, count)
+        client_latencies = await time_requests(client, count)
+
+        await session.close()
+        await http.close()
+
+    for name, fraction in (("p50", 0.5), ("p99", 0.99)):
+        raw_value = percentile(raw_latencies, fraction)
+        client_value = percentile(client_latencies, fraction)
+        print(
+            f"HTTPClient.request {name}: {client_value * 1e6:,.0f} us, "
+            f"aiohttp {raw_value * 1e6:,.0f} us, overhead {(client_value - raw_value) * 1e6:,.0f} us"
+        )
+    print(f"HTTPClient.request mean: {statistics.fmean(client_latencies) * 1e6:,.0f} us")
+
+
+async def check_ratelimits() -> None:
+    # a hot bucket and enough other channels that the global limit makes requests queue, so the hot
+    # bucket resets while its requests are waiting for the global limit
+    routes = {"GET /channels/{channel_id}": BucketConfig(limit=5, reset_after=1.0)}
+    async with FakeREST(routes, global_limit=None) as server:
+        http = HTTPClient("token", api_url=server.url, global_limit=50)
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(http.get_channel(1) for _ in range(20)),
+            *(http.get_channel(channel_id) for channel_id in range(2, 52)),
+        )
+        elapsed = time.perf_counter() - start
+        await http.close()
+
+    ratelimited = sum(server.ratelimited.values())
+    print(
+        f"Ratelimit check: {sum(server.requests.values())} requests in {elapsed:.2f} s, "
+        f"{ratelimited} 429s {dict(server.ratelimited)}"
+    )
+    if ratelimited:
+        raise SystemExit("The ratelimiters let requests through that were ratelimited.")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="benchmarks.rest",
+        description="Benchmarks the REST client.",
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="How many rounds to run.")
+    parser.add_argument(
+        "--requests", type=int, default=2000, help="How many requests to send per client."
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    iterations = 100_000
+
+    for name, func in micro_stages():
+        best = min(bench_op(func, iterations) for _ in range(args.rounds))
+        print(f"{name}: {best / iterations * 1e9:,.0f} ns/op")
+
+    asyncio.run(bench_pipeline(args.requests))
+    asyncio.run(check_ratelimits())
+
+
+if __name__ == "__main__":
+    main()
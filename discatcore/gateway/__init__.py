@@ -5,9 +5,19 @@ discatcore.gateway
 The Gateway modules for `discatcore`.
 """
 
+from .chunking import *
 from .client import *
+from .compression import *
+from .process import *
 from .ratelimiter import *
+from .session import *
+from .shard import *
 
 __all__ = ()
+__all__ += chunking.__all__
 __all__ += client.__all__
+__all__ += compression.__all__
+__all__ += process.__all__
 __all__ += ratelimiter.__all__
+__all__ += session.__all__
+__all__ += shard.__all__
@@ -0,0 +1,379 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+import time
+import typing as t
+from collections.abc import AsyncIterator, Mapping
+
+import discord_typings as dt
+
+if t.TYPE_CHECKING:
+    from ..utils.dispatcher import Dispatcher
+    from .client import GatewayClient
+
+__all__ = (
+    "MemberChunkRequest",
+    "GuildChunkScheduler",
+)
+
+_log = logging.getLogger(__name__)
+
+
+class MemberChunkRequest:
+    """Represents a request for the members of a guild that is waiting for its member chunks.
+
+    Iterate over this request with ``async for`` to receive the member chunks as they arrive, or use
+    :meth:`.collect` to wait for every chunk. If no chunk arrives within ``timeout`` seconds of sending the
+    request or of the previous chunk, then the request is given up on, even if nothing iterates over it,
+    and iterating raises :class:`asyncio.TimeoutError`. Requests are also given up on if their session ends.
+
+    Args:
+        parent (GatewayClient): The Gateway client the request was sent with.
+        guild_id (dt.Snowflake): The id of the guild the members are requested from.
+        timeout (float): How long (in seconds) to wait for the next chunk. Defaults to 10 seconds.
+
+    Attributes:
+        parent (GatewayClient): The Gateway client the request was sent with.
+        guild_id (dt.Snowflake): The id of the guild the members are requested from.
+        nonce (str): The nonce that identifies the chunks of this request.
+        timeout (float): How long (in seconds) to wait for the next chunk.
+        chunk_count (t.Optional[int]): The total amount of chunks. This is None until the first chunk arrives.
+        chunks_received (int): The amount of chunks received so far.
+        members (list[dt.GuildMemberData]): Every member received so far.
+        presences (list[dt.PresenceUpdateData]): Every presence received so far.
+        not_found (list[dt.Snowflake]): The requested user ids that were not found.
+        finished (bool): Whether every chunk has been received.
+        timed_out (bool): Whether the request stalled (or its session ended) and was given up on.
+    """
+
+    __slots__ = (
+        "parent",
+        "guild_id",
+        "nonce",
+        "timeout",
+        "chunk_count",
+        "chunks_received",
+        "members",
+        "presences",
+        "not_found",
+        "finished",
+        "timed_out",
+        "_queue",
+        "_timer",
+    )
+
+    def __init__(
+        self, parent: GatewayClient, guild_id: dt.Snowflake, timeout: float = 10.0
+    ) -> None:
+        self.parent: GatewayClient = parent
+        self.guild_id: dt.Snowflake = guild_id
+        # nonces can be at most 32 characters long
+        self.nonce: str = secrets.token_hex(16)
+        self.timeout: float = timeout
+        self.chunk_count: t.Optional[int] = None
+        self.chunks_received: int = 0
+        self.members: list[dt.GuildMemberData] = []
+        self.presences: list[dt.PresenceUpdateData] = []
+        self.not_found: list[dt.Snowflake] = []
+        self.finished: bool = False
+        self.timed_out: bool = False
+        self._queue: asyncio.Queue[t.Optional[dt.GuildMembersChunkData]] = asyncio.Queue()
+        self._timer: t.Optional[asyncio.TimerHandle] = None
+
+    def _reset_timer(self) -> None:
+        # called when the request is sent and for every chunk
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = asyncio.get_running_loop().call_later(self.timeout, self._give_up)
+
+    def feed(self, chunk: dt.GuildMembersChunkData) -> None:
+        """Adds a member chunk to this request. This is called by the Gateway client.
+
+        Args:
+            chunk (dt.GuildMembersChunkData): The member chunk.
+        """
+        if self.finished or self.timed_out:
+            return
+
+        self.chunk_count = chunk["chunk_count"]
+        self.chunks_received += 1
+        self.members.extend(chunk["members"])
+        self.presences.extend(chunk.get("presences", ()))
+        self.not_found.extend(chunk.get("not_found", ()))
+        self._queue.put_nowait(chunk)
+
+        # chunks can arrive out of order, so the received chunks are counted instead of checking chunk_index
+        if self.chunks_received >= self.chunk_count:
+            self.finished = True
+            self._end()
+        else:
+            self._reset_timer()
+
+    def _end(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        self._queue.put_nowait(None)
+        self.parent._chunk_requests.pop(self.nonce, None)  # pyright: ignore[reportPrivateUsage]
+
+    def _give_up(self, reason: str = "stalled") -> None:
+        if self.finished or self.timed_out:
+            return
+
+        self.timed_out = True
+        self._end()
+        _log.warning(
+            "Member request %s for guild %s %s after %d of %s chunks.",
+            self.nonce,
+            self.guild_id,
+            reason,
+            self.chunks_received,
+            self.chunk_count if self.chunk_count is not None else "?",
+        )
+
+    def __aiter__(self) -> AsyncIterator[dt.GuildMembersChunkData]:
+        return self._iter_chunks()
+
+    async def _iter_chunks(self) -> AsyncIterator[dt.GuildMembersChunkData]:
+        while True:
+            chunk = await self._queue.get()
+            if chunk is None:
+                # keep the end marker around so iterating again ends right away
+                self._queue.put_nowait(None)
+                if self.timed_out:
+                    raise asyncio.TimeoutError
+                return
+            yield chunk
+
+    async def collect(self) -> list[dt.GuildMemberData]:
+        """Waits for every chunk of this request to arrive.
+
+        Returns:
+            Every member of the request.
+        """
+        async for _ in self:
+            pass
+
+        return self.members
+
+
+class GuildChunkScheduler:
+    """Requests the members of every large guild that is received in GUILD_CREATE across shards.
+
+    Every shard gets its own queue and worker, which sends member requests as fast as the Gateway
+    ratelimiter of that shard allows. Member requests use the low priority lane of the ratelimiter, so they
+    never hold up heartbeats or other commands. Once a guild is done, ``guild_members_chunked`` is dispatched
+    with its :class:`MemberChunkRequest`.
+
+    Args:
+        dispatcher (Dispatcher): The dispatcher to receive GUILD_CREATE from.
+        shards (t.Union[GatewayClient, Mapping[int, GatewayClient]]): The Gateway client, or a mapping of
+            shard ids to Gateway clients (like :attr:`ShardManager.shards`).
+        presences (bool): Whether or not Discord should give us the presences of the members. Defaults to False.
+        timeout (float): How long (in seconds) to wait for the next chunk of a guild. Defaults to 10 seconds.
+        concurrency (int): The maximum amount of guilds to wait for at once per shard. Defaults to 10.
+        large_only (bool): Whether only large guilds should be chunked. Defaults to True.
+
+    Attributes:
+        dispatcher (Dispatcher): The dispatcher to receive GUILD_CREATE from.
+        shards (t.Union[GatewayClient, Mapping[int, GatewayClient]]): The Gateway clients to request members with.
+        presences (bool): Whether or not Discord should give us the presences of the members.
+        timeout (float): How long (in seconds) to wait for the next chunk of a guild.
+        concurrency (int): The maximum amount of guilds to wait for at once per shard.
+        large_only (bool): Whether only large guilds should be chunked.
+        total (int): The amount of guilds that have been scheduled.
+        completed (int): The amount of guilds that have been chunked.
+        failed (int): The amount of guilds that stalled or could not be requested.
+    """
+
+    __slots__ = (
+        "dispatcher",
+        "shards",
+        "presences",
+        "timeout",
+        "concurrency",
+        "large_only",
+        "total",
+        "completed",
+        "failed",
+        "_queues",
+        "_workers",
+        "_tasks",
+        "_scheduled",
+        "_started_at",
+        "_idle",
+    )
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        shards: t.Union[GatewayClient, Mapping[int, GatewayClient]],
+        *,
+        presences: bool = False,
+        timeout: float = 10.0,
+        concurrency: int = 10,
+        large_only: bool = True,
+    ) -> None:
+        self.dispatcher: Dispatcher = dispatcher
+        self.shards: t.Union[GatewayClient, Mapping[int, GatewayClient]] = shards
+        self.presences: bool = presences
+        self.timeout: float = timeout
+        self.concurrency: int = concurrency
+        self.large_only: bool = large_only
+        self.total: int = 0
+        self.completed: int = 0
+        self.failed: int = 0
+        self._queues: dict[int, asyncio.Queue[dt.Snowflake]] = {}
+        self._workers: dict[int, asyncio.Task[None]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._scheduled: set[int] = set()
+        self._started_at: t.Optional[float] = None
+        self._idle: asyncio.Event = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def remaining(self) -> int:
+        """The amount of guilds that are queued or waiting for their chunks."""
+        return self.total - self.completed - self.failed
+
+    @property
+    def progress(self) -> float:
+        """The fraction of scheduled guilds that are done, between 0 and 1."""
+        if not self.total:
+            return 1.0
+        return (self.completed + self.failed) / self.total
+
+    @property
+    def eta(self) -> t.Optional[float]:
+        """The estimated time (in seconds) until every scheduled guild is done,
+        based on how fast guilds have been done so far. This is None until the first guild is done.
+        """
+        done = self.completed + self.failed
+        if self._started_at is None or not done:
+            return None
+
+        rate = done / (time.monotonic() - self._started_at)
+        return self.remaining / rate
+
+    def _get_shard(self, guild_id: dt.Snowflake) -> t.Optional[GatewayClient]:
+        if not isinstance(self.shards, Mapping):
+            return self.shards
+
+        shard = next(iter(self.shards.values()), None)
+        if shard is None:
+            return None
+        return self.shards.get((int(guild_id) >> 22) % shard.shard_count)
+
+    def start(self) -> None:
+        """Starts scheduling guilds from GUILD_CREATE."""
+        self.dispatcher.callback_for("guild_create")(self._on_guild_create)
+
+    async def _on_guild_create(self, guild: dt.GuildCreateData) -> None:
+        if guild.get("unavailable") or (self.large_only and not guild.get("large")):
+            return
+        self.schedule(guild["id"])
+
+    def schedule(self, guild_id: dt.Snowflake) -> None:
+        """Queues a guild to be chunked. Guilds that are queued already are ignored.
+
+        Args:
+            guild_id (dt.Snowflake): The id of the guild.
+        """
+        shard = self._get_shard(guild_id)
+        if shard is None:
+            _log.warning("Guild %s is not in any of the shards of this scheduler.", guild_id)
+            return
+        if int(guild_id) in self._scheduled:
+            return
+
+        self._scheduled.add(int(guild_id))
+        self.total += 1
+        self._idle.clear()
+        if self._started_at is None:
+            self._started_at = time.monotonic()
+
+        queue = self._queues.get(shard.shard_id)
+        if queue is None:
+            queue = self._queues[shard.shard_id] = asyncio.Queue()
+        queue.put_nowait(guild_id)
+
+        if shard.shard_id not in self._workers:
+            self._workers[shard.shard_id] = asyncio.create_task(
+                self._work(shard.shard_id, queue), name=f"DisCatCore Chunker:{shard.shard_id}"
+            )
+
+    def pending(self, shard_id: int) -> int:
+        """Returns the amount of guilds that are queued for a shard, but have not been requested yet.
+
+        Args:
+            shard_id (int): The id of the shard.
+        """
+        queue = self._queues.get(shard_id)
+        return queue.qsize() if queue is not None else 0
+
+    async def _work(self, shard_id: int, queue: asyncio.Queue[dt.Snowflake]) -> None:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        while True:
+            guild_id = await queue.get()
+            await semaphore.acquire()
+
+            shard = self._get_shard(guild_id)
+            try:
+                if shard is None:
+                    raise RuntimeError(f"Shard {shard_id} does not exist anymore!")
+                # this waits on the ratelimiter of the shard, which paces the requests
+                request = await shard.chunk_guild(
+                    guild_id, presences=self.presences, timeout=self.timeout
+                )
+            except Exception as e:
+                _log.warning("Failed to request the members of guild %s.", guild_id, exc_info=e)
+                semaphore.release()
+                self._finish(guild_id, None)
+                continue
+
+            task = asyncio.create_task(self._collect(request, semaphore))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _collect(self, request: MemberChunkRequest, semaphore: asyncio.Semaphore) -> None:
+        try:
+            await request.collect()
+        except asyncio.TimeoutError:
+            self._finish(request.guild_id, None)
+        else:
+            self._finish(request.guild_id, request)
+        finally:
+            semaphore.release()
+
+    def _finish(self, guild_id: dt.Snowflake, request: t.Optional[MemberChunkRequest]) -> None:
+        self._scheduled.discard(int(guild_id))
+        if request is None:
+            self.failed += 1
+        else:
+            self.completed += 1
+            self.dispatcher.dispatch("guild_members_chunked", request)
+
+        if not self.remaining:
+            self._idle.set()
+
+    async def wait(self) -> None:
+        """Waits until every scheduled guild is done."""
+        await self._idle.wait()
+
+    async def close(self) -> None:
+        """Stops every worker. Guilds that have not been chunked yet are dropped."""
+        tasks = [*self._workers.values(), *self._tasks]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._workers.clear()
+        self._queues.clear()
+        self._scheduled.clear()
+        self.failed += self.remaining
+        self._idle.set()
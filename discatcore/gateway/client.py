@@ -3,23 +3,28 @@
 from __future__ import annotations
 
 import asyncio
-import datetime
 import logging
 import platform
 import random
+import time
 import typing as t
-import zlib
-from collections.abc import Mapping
+from collections import Counter, deque
+from collections.abc import AsyncIterator, Iterable, Mapping
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import aiohttp
 import discord_typings as dt
 
 from ..errors import GatewayReconnect
 from ..http import HTTPClient
+from ..utils import etf
 from ..utils.dispatcher import Dispatcher
 from ..utils.json import dumps, loads
-from .ratelimiter import Ratelimiter
-from .types import BaseTypedWSMessage, is_binary, is_text
+from .chunking import MemberChunkRequest
+from .compression import BaseDecompressor, get_decompressor
+from .ratelimiter import IdentifyRatelimiter, Ratelimiter
+from .session import BaseSessionStore, SessionInfo
+from .types import BaseTypedWSMessage, is_binary, is_text, parse_envelope
 
 __all__ = ("GatewayClient",)
 
@@ -29,42 +34,85 @@ _log = logging.getLogger(__name__)
 class HeartbeatHandler:
     """A class that helps keep the Gateway connection alive.
 
+    Heartbeats are sent from a single task that lives as long as the connection. The time between sending a heartbeat
+    and receiving its ack is measured with :func:`time.monotonic`. If an ack does not come in time, the connection
+    is considered zombified and closed.
+
     Args:
         parent (.GatewayClient): The parent reference of this heartbeat handler.
+        window (int): The amount of round trip times to keep. Defaults to 10.
 
     Attributes:
         parent (.GatewayClient): The parent reference of this heartbeat handler.
+        latencies (collections.deque[float]): The most recent round trip times (in seconds) of heartbeats.
     """
 
     __slots__ = (
         "parent",
+        "latencies",
         "_task",
-        "_first_heartbeat",
+        "_ack",
+        "_last_send",
     )
 
-    def __init__(self, parent: GatewayClient) -> None:
+    def __init__(self, parent: GatewayClient, window: int = 10) -> None:
         self.parent: GatewayClient = parent
-        self._first_heartbeat: bool = True
+        self.latencies: deque[float] = deque(maxlen=window)
+        self._task: t.Optional[asyncio.Task[None]] = None
+        self._ack: asyncio.Event = asyncio.Event()
+        self._last_send: t.Optional[float] = None
+
+    async def loop(self) -> None:
+        try:
+            interval = self.parent.heartbeat_interval
+            # the first heartbeat is jittered so that clients do not heartbeat in lockstep
+            await asyncio.sleep(interval * random.uniform(0.0, 1.0))
+
+            while not self.parent.is_closed:
+                self._ack.clear()
+                sent_at = self._last_send = time.monotonic()
+                await self.parent.heartbeat()
+                self.parent._save_session(periodic=True)  # pyright: ignore[reportPrivateUsage]
+
+                try:
+                    await asyncio.wait_for(
+                        self._ack.wait(), timeout=min(self.parent.heartbeat_timeout, interval)
+                    )
+                except asyncio.TimeoutError:
+                    _log.warning(
+                        "Zombified connection detected on shard %d. Closing connection with code 1008.",
+                        self.parent.shard_id,
+                    )
+                    # the connection loop notices the closure and reconnects
+                    await self.parent._close_ws(code=1008)  # pyright: ignore[reportPrivateUsage]
+                    return
 
-    def _get_delta(self) -> float:
-        delta = self.parent.heartbeat_interval
-        if self._first_heartbeat:
-            delta *= random.uniform(0.0, 1.0)
-            self._first_heartbeat = False
+                await asyncio.sleep(max(0.0, sent_at + interval - time.monotonic()))
+        except asyncio.CancelledError:
+            pass
 
-        return delta
+    def ack(self) -> None:
+        """Marks the last heartbeat as acknowledged and records its round trip time."""
+        if self._last_send is not None:
+            self.latencies.append(time.monotonic() - self._last_send)
+            self._last_send = None
 
-    async def loop(self) -> None:
-        await self.parent.heartbeat()
-        loop = asyncio.get_running_loop()
-        loop.call_later(self._get_delta(), self.start)
+        self._ack.set()
 
     def start(self) -> None:
-        self._task = asyncio.create_task(self.loop())
+        """Starts the heartbeat task."""
+        if self._task is None or self._task.done():
+            self._last_send = None
+            self._task = asyncio.create_task(self.loop())
 
     async def stop(self) -> None:
-        self._task.cancel()
-        await self._task
+        """Stops the heartbeat task. This does nothing if the task is not running."""
+        if self._task is None:
+            return
+
+        task, self._task = self._task, None
+        task.cancel()
+        await task
 
 
 DISPATCH = 0
@@ -79,6 +127,23 @@ INVALID_SESSION = 9
 HELLO = 10
 HEARTBEAT_ACK = 11
 
+# commands that keep the connection alive go before everything else, bulk requests go last
+_OP_PRIORITIES: dict[t.Any, int] = {
+    HEARTBEAT: Ratelimiter.HEARTBEAT,
+    IDENTIFY: Ratelimiter.CONNECTION,
+    RESUME: Ratelimiter.CONNECTION,
+    PRESENCE_UPDATE: Ratelimiter.LOW,
+    REQUEST_GUILD_MEMBERS: Ratelimiter.LOW,
+}
+
+# events the client needs the data of, even if nothing listens to them
+_ALWAYS_DECODED_EVENTS = frozenset(("ready", "resumed"))
+
+# close codes sent by the Gateway that would happen again on every new connection
+_FATAL_CLOSE_CODES = frozenset((4004, 4010, 4011, 4012, 4013, 4014))
+# close codes sent by the Gateway after which the session cannot be resumed
+_INVALID_SESSION_CLOSE_CODES = frozenset((4007, 4009))
+
 
 class GatewayClient:
     """The Gateway client that manages connections to and from the Discord API.
@@ -87,29 +152,89 @@ class GatewayClient:
         http (HTTPClient): The http client. This is used to create the websocket connection and to retrieve the token.
         dispatcher (Dispatcher): The dispatcher. This is used to dispatch events recieved over the gateway.
         heartbeat_timeout (int): The amount of time (in seconds) to wait for a heartbeat ack to come in.
-            Defaults to 30 seconds.
+            This is capped to the heartbeat interval. Defaults to 30 seconds.
         intents (int): The intents to use.
+        shard_id (int): The id of the shard this connection represents. Defaults to 0.
+        shard_count (int): The total amount of shards the bot is using. Defaults to 1.
+        identify_ratelimiter (t.Optional[IdentifyRatelimiter]): The ratelimiter to wait on before identifying.
+            This should be shared between all shards of a bot. Defaults to None.
+        compression (t.Optional[t.Union[str, BaseDecompressor]]): The transport compression to ask the Gateway for.
+            This is either the name of the compression ("zlib-stream" or "zstd-stream") or a decompressor.
+            Set this to None to disable transport compression. A decompressor cannot be shared between clients.
+            Defaults to "zlib-stream".
+        encoding (t.Literal["json", "etf"]): The encoding of the payloads sent to and from the Gateway.
+            ETF decodes snowflakes straight into ints, but its decoder is written in pure Python, which makes it
+            many times slower than JSON (especially with orjson installed). Defaults to "json".
+        lazy_dispatch (bool): Whether the data of dispatch payloads should only be decoded if the dispatcher
+            has callbacks for the event. This only works with the JSON encoding. Defaults to False.
+        event_allowlist (t.Optional[Iterable[str]]): The names of the only events that will be dispatched.
+            Every other dispatch payload is discarded before it is decoded. Defaults to None.
+        event_denylist (t.Optional[Iterable[str]]): The names of events that will be discarded before they
+            are decoded. Defaults to None.
+        session_store (t.Optional[BaseSessionStore]): The store to keep the session in, so the connection can be
+            resumed after a restart. The session is saved when it starts, when the connection is closed, and
+            at most every ``session_save_interval`` seconds in between. Defaults to None.
+        session_save_interval (float): The minimum time (in seconds) between saving the session while the
+            connection is running. Saving writes to the session store on the event loop, so this keeps many
+            shards from writing on every heartbeat. Defaults to 120 seconds.
 
     Attributes:
-        inflator (zlib.decompressobj): The compression inflator.
+        decompressor (t.Optional[BaseDecompressor]): The transport decompressor.
             This is used for messages that are compressed, which is enabled by default.
+            The decompressor is reset for every connection.
+        encoding (t.Literal["json", "etf"]): The encoding of the payloads sent to and from the Gateway.
+        lazy_dispatch (bool): Whether the data of dispatch payloads should only be decoded if the dispatcher
+            has callbacks for the event. Skipped payloads do not update the recent payload.
+        event_allowlist (t.Optional[frozenset[str]]): The names of the only events that will be dispatched.
+        event_denylist (frozenset[str]): The names of events that will be discarded before they are decoded.
+        skipped_payloads (collections.Counter[str]): The amount of dispatch payloads skipped per event name.
+            This includes payloads skipped because of the event filters and because of lazy dispatching.
+        skipped_bytes (collections.Counter[str]): The amount of (decompressed) bytes skipped per event name.
+        session_store (t.Optional[BaseSessionStore]): The store to keep the session in.
+        session_save_interval (float): The minimum time (in seconds) between saving the session while the
+            connection is running.
+        latency (t.Optional[float]): The average round trip time (in seconds) of the most recent heartbeats.
+        reconnects (int): The amount of times this client has reconnected with :meth:`.run_forever`.
+        downtime (float): The total amount of time (in seconds) spent between losing the connection and
+            receiving READY or RESUMED on the new connection with :meth:`.run_forever`.
         heartbeat_interval (float): The interval to heartbeat given by Discord. This is used with the heartbeat handler.
         session_id (str): The session id of this Gateway connection. This is also used when we resume connection.
         recent_payload (discord_typings.dt.GatewayEvent): The newest Gateway Payload.
         heartbeat_timeout (int): The amount of time (in seconds) to wait for a heartbeat ack to come in.
         ratelimiter (Ratelimiter): The ratelimiter for the Gateway connection.
-            This is used to limit the number of commands (except for heartbeats) so we don't get kicked off of the
-            gateway connection with opcode 9.
+            This is used to limit the number of commands so we don't get kicked off of the gateway connection.
+            Heartbeats, identifies and resumes are sent before other commands, and presence updates and
+            guild member requests are sent last.
         heartbeat_handler (t.Optional[HeartbeatHandler]): The heartbeat handler for the Gateway connection.
             This is used to keep the connection alive via Discord's guidelines.
+        shard_id (int): The id of the shard this connection represents.
+        shard_count (int): The total amount of shards the bot is using.
+        identify_ratelimiter (t.Optional[IdentifyRatelimiter]): The ratelimiter to wait on before identifying.
     """
 
     __slots__ = (
         "_ws",
-        "_inflator",
+        "decompressor",
+        "encoding",
+        "lazy_dispatch",
+        "event_allowlist",
+        "event_denylist",
+        "skipped_payloads",
+        "skipped_bytes",
+        "session_store",
+        "session_save_interval",
+        "_saved_session",
+        "_saved_at",
+        "reconnects",
+        "downtime",
+        "_disconnected_at",
+        "_reconnect_attempts",
         "_http",
         "_dispatcher",
         "intents",
+        "shard_id",
+        "shard_count",
+        "identify_ratelimiter",
         "heartbeat_interval",
         "sequence",
         "session_id",
@@ -118,7 +243,11 @@ class GatewayClient:
         "resume_url",
         "heartbeat_handler",
         "ratelimiter",
-        "_last_heartbeat_ack",
+        "_closing",
+        "_stopped",
+        "_coalesced",
+        "_drain_task",
+        "_chunk_requests",
         "heartbeat_timeout",
     )
 
@@ -129,18 +258,57 @@ class GatewayClient:
         *,
         heartbeat_timeout: float = 30.0,
         intents: int = 0,
+        shard_id: int = 0,
+        shard_count: int = 1,
+        identify_ratelimiter: t.Optional[IdentifyRatelimiter] = None,
+        compression: t.Optional[t.Union[str, BaseDecompressor]] = "zlib-stream",
+        encoding: t.Literal["json", "etf"] = "json",
+        lazy_dispatch: bool = False,
+        event_allowlist: t.Optional[Iterable[str]] = None,
+        event_denylist: t.Optional[Iterable[str]] = None,
+        session_store: t.Optional[BaseSessionStore] = None,
+        session_save_interval: float = 120.0,
     ) -> None:
         if heartbeat_timeout <= 0.0:
             raise ValueError(f"heartbeat_timeout parameter cannot be negative or 0!")
+        if not 0 <= shard_id < shard_count:
+            raise ValueError(f"shard_id parameter must be between 0 and {shard_count - 1}!")
+        if encoding not in ("json", "etf"):
+            raise ValueError(f"encoding parameter must be either json or etf!")
 
         # Internal attribs
         self._ws: t.Optional[aiohttp.ClientWebSocketResponse] = None
-        self._inflator = zlib.decompressobj()
         self._http: HTTPClient = http
         self._dispatcher: Dispatcher = dispatcher
 
         # Values for the Gateway
         self.intents: int = intents
+        self.shard_id: int = shard_id
+        self.shard_count: int = shard_count
+        self.identify_ratelimiter: t.Optional[IdentifyRatelimiter] = identify_ratelimiter
+        self.decompressor: t.Optional[BaseDecompressor] = (
+            get_decompressor(compression) if isinstance(compression, str) else compression
+        )
+        self.encoding: t.Literal["json", "etf"] = encoding
+        self.lazy_dispatch: bool = lazy_dispatch
+        self.event_allowlist: t.Optional[frozenset[str]] = (
+            frozenset(name.lower() for name in event_allowlist)
+            if event_allowlist is not None
+            else None
+        )
+        self.event_denylist: frozenset[str] = frozenset(
+            name.lower() for name in event_denylist or ()
+        )
+        self.skipped_payloads: Counter[str] = Counter()
+        self.skipped_bytes: Counter[str] = Counter()
+        self.session_store: t.Optional[BaseSessionStore] = session_store
+        self.session_save_interval: float = session_save_interval
+        self._saved_session: t.Optional[SessionInfo] = None
+        self._saved_at: float = 0.0
+        self.reconnects: int = 0
+        self.downtime: float = 0.0
+        self._disconnected_at: t.Optional[float] = None
+        self._reconnect_attempts: int = 0
 
         # Values from the Gateway
         self.heartbeat_interval: float = 0.0
@@ -155,23 +323,106 @@ class GatewayClient:
         self.ratelimiter: Ratelimiter = Ratelimiter(self)
 
         # Misc
-        self._last_heartbeat_ack: t.Optional[datetime.datetime] = None
+        self._closing: bool = False
+        self._stopped: asyncio.Event = asyncio.Event()
+        self._coalesced: dict[t.Hashable, Mapping[str, t.Any]] = {}
+        self._drain_task: t.Optional[asyncio.Task[None]] = None
+        self._chunk_requests: dict[str, MemberChunkRequest] = {}
         self.heartbeat_timeout: float = heartbeat_timeout
 
     # Internal functions
 
-    def _decompress_msg(self, msg: bytes) -> str:
-        ZLIB_SUFFIX = b"\x00\x00\xff\xff"
+    def _decompress_msg(self, msg: bytes) -> t.Optional[bytes]:
+        if self.decompressor is None:
+            return msg
 
-        out_str: str = ""
+        # A payload can be split across multiple frames, so this can be None
+        return self.decompressor.decompress(msg)
 
-        # Message should be compressed
-        if len(msg) < 4 or msg[-4:] != ZLIB_SUFFIX:
-            return out_str
+    def _is_always_decoded(self, event_name: str) -> bool:
+        if event_name == "guild_members_chunk":
+            # member requests need the chunks even if nothing else listens to them
+            return bool(self._chunk_requests)
+        return event_name in _ALWAYS_DECODED_EVENTS
 
-        buff = self._inflator.decompress(msg)
-        out_str = buff.decode("utf-8")
-        return out_str
+    def _is_filtered(self, event_name: str) -> bool:
+        if self._is_always_decoded(event_name):
+            return False
+        if self.event_allowlist is not None and event_name not in self.event_allowlist:
+            return True
+        return event_name in self.event_denylist
+
+    def _should_decode(self, event_name: str) -> bool:
+        return self._is_always_decoded(event_name) or self._dispatcher.has_callbacks(event_name)
+
+    def _record_skip(self, event_name: str, sequence: t.Optional[int], size: int) -> None:
+        if sequence is not None:
+            self.sequence = sequence
+        self.skipped_payloads[event_name] += 1
+        self.skipped_bytes[event_name] += size
+
+    def _skip_dispatch(self, event_name: str, sequence: t.Optional[int], size: int) -> bool:
+        if self._is_filtered(event_name.lower()):
+            _log.debug("Discarded filtered %s payload.", event_name)
+        elif self.lazy_dispatch and not self._should_decode(event_name.lower()):
+            _log.debug("Skipped decoding %s payload with no callbacks.", event_name)
+        else:
+            return False
+
+        self._record_skip(event_name.lower(), sequence, size)
+        return True
+
+    def _save_session(self, *, periodic: bool = False) -> None:
+        if self.session_store is None or not self.session_id:
+            return
+
+        session = SessionInfo(self.session_id, self.sequence, self.resume_url)
+        if session == self._saved_session:
+            return
+
+        now = time.monotonic()
+        if periodic and now - self._saved_at < self.session_save_interval:
+            return
+
+        self.session_store.save(self.shard_id, session)
+        self._saved_session = session
+        self._saved_at = now
+
+    def _delete_session(self) -> None:
+        self._saved_session = None
+        if self.session_store is not None:
+            self.session_store.delete(self.shard_id)
+
+    def _invalidate_session(self) -> None:
+        self.can_resume = False
+        self.session_id = ""
+        self.sequence = None
+        self._delete_session()
+
+    def _restore_session(self) -> bool:
+        if self.session_store is None:
+            return False
+
+        session = self.session_store.load(self.shard_id)
+        if session is None:
+            return False
+
+        self._saved_session = session
+        self.session_id = session.session_id
+        self.sequence = session.sequence
+        self.resume_url = session.resume_url
+        self.can_resume = True
+        _log.info("Restored session %s for shard %d.", self.session_id, self.shard_id)
+        return True
+
+    def _format_url(self, url: str) -> str:
+        parts = urlsplit(url)
+        query = dict(parse_qsl(parts.query))
+        query.update({"v": str(self._http.api_version), "encoding": self.encoding})
+        if self.decompressor is not None:
+            query["compress"] = self.decompressor.name
+
+        return urlunsplit(parts._replace(query=urlencode(query)))
 
     async def send(self, data: Mapping[str, t.Any]) -> None:
         """Sends a dict payload to the websocket connection.
@@ -182,9 +433,48 @@ class GatewayClient:
         if not self._ws:
             return
 
-        await self.ratelimiter.acquire()
-        await self._ws.send_json(data, dumps=dumps)
-        _log.debug("Sent JSON payload %s to the Gateway.", data)
+        await self.ratelimiter.acquire(_OP_PRIORITIES.get(data.get("op"), Ratelimiter.NORMAL))
+        await self._send_raw(data)
+
+    async def _send_raw(self, data: Mapping[str, t.Any]) -> None:
+        # sends a payload without waiting on the ratelimiter
+        if not self._ws:
+            return
+
+        if self.encoding == "etf":
+            await self._ws.send_bytes(etf.dumps(data))
+        else:
+            await self._ws.send_json(data, dumps=dumps)
+        _log.debug("Sent %s payload %s to the Gateway.", self.encoding.upper(), data)
+
+    def _send_coalesced(self, key: t.Hashable, data: Mapping[str, t.Any]) -> None:
+        # a pending payload with the same key is replaced, but keeps its place in the queue
+        self._coalesced[key] = data
+        self._start_draining()
+
+    def _start_draining(self) -> None:
+        if (
+            self._coalesced
+            and self._ws is not None
+            and not self._closing
+            and (self._drain_task is None or self._drain_task.done())
+        ):
+            self._drain_task = asyncio.create_task(self._drain_coalesced())
+
+    async def _drain_coalesced(self) -> None:
+        while self._coalesced and not self.is_closed and not self._closing:
+            key = next(iter(self._coalesced))
+            data = self._coalesced[key]
+            await self.ratelimiter.acquire(_OP_PRIORITIES.get(data.get("op"), Ratelimiter.NORMAL))
+
+            # a newer payload might have replaced this one while waiting on the ratelimiter
+            data = self._coalesced.pop(key, data)
+            try:
+                await self._send_raw(data)
+            except (ConnectionError, asyncio.CancelledError):
+                # keep the payload for the next connection, unless it was replaced already
+                self._coalesced.setdefault(key, data)
+                return
 
     async def receive(self) -> t.Optional[bool]:
         """Receives a message from the websocket connection and decompresses the message.
@@ -208,20 +498,97 @@ class GatewayClient:
         _log.debug("Received WS message from Gateway with type %s", typed_msg.type.name)
 
         if is_text(typed_msg) or is_binary(typed_msg):
-            received_msg: str
+            received_msg: t.Union[str, bytes]
             if is_binary(typed_msg):
-                received_msg = self._decompress_msg(typed_msg.data)
+                decompressed_msg = self._decompress_msg(typed_msg.data)
+                if decompressed_msg is None:
+                    # wait for the rest of the payload
+                    return False
+                received_msg = decompressed_msg
             else:
                 received_msg = t.cast(str, typed_msg.data)
 
-            self.recent_payload = t.cast(dt.GatewayEvent, loads(received_msg))
+            payload: t.Any = None
+            # dispatches can only be skipped before decoding if the envelope can be read from the raw JSON
+            if self.encoding == "json" and (
+                self.lazy_dispatch or self.event_allowlist is not None or self.event_denylist
+            ):
+                raw = (
+                    received_msg.encode("utf-8") if isinstance(received_msg, str) else received_msg
+                )
+                envelope = parse_envelope(raw)
+                if (
+                    envelope is not None
+                    and envelope.op == DISPATCH
+                    and envelope.event_name is not None
+                ):
+                    if self._skip_dispatch(envelope.event_name, envelope.sequence, len(raw)):
+                        return False
+
+                    # the envelope has been read already, so only the data is left to decode
+                    payload = {
+                        "op": envelope.op,
+                        "t": envelope.event_name,
+                        "s": envelope.sequence,
+                        "d": loads(envelope.data),
+                    }
+
+            if payload is None:
+                # the payload is parsed straight from the bytes, it is never decoded into a str
+                payload = (
+                    etf.loads(t.cast(bytes, received_msg))
+                    if self.encoding == "etf"
+                    else loads(received_msg)
+                )
+
+            event_name = payload.get("t")
+            if (
+                payload.get("op") == DISPATCH
+                and event_name is not None
+                and self._is_filtered(event_name.lower())
+            ):
+                self._record_skip(event_name.lower(), payload.get("s"), len(received_msg))
+                return False
+
+            self.recent_payload = t.cast(dt.GatewayEvent, payload)
             _log.debug("Received payload from the Gateway: %s", self.recent_payload)
-            self.sequence = self.recent_payload.get("s")
+            # only dispatches have a sequence number
+            sequence = self.recent_payload.get("s")
+            if sequence is not None:
+                self.sequence = sequence
             return True
         elif typed_msg.type == aiohttp.WSMsgType.CLOSE:
-            await self.close(reconnect=False)
+            await self._handle_close_frame(t.cast(int, typed_msg.data))
+            return False
+        elif typed_msg.type in (aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED):
+            # the websocket was closed without going through close(), either by the heartbeat handler
+            # because the connection is zombified or because the connection dropped
+            if not self._closing:
+                await self.close(code=1008)
             return False
 
+    async def _handle_close_frame(self, code: int) -> None:
+        if code in _FATAL_CLOSE_CODES:
+            _log.error(
+                "Gateway closed the connection on shard %d with code %d. This cannot be fixed by reconnecting.",
+                self.shard_id,
+                code,
+            )
+            self._stopped.set()
+            await self._close(code=code, reconnect=False, keep_session=True)
+            return
+
+        if code in _INVALID_SESSION_CLOSE_CODES:
+            self._invalidate_session()
+
+        _log.warning(
+            "Gateway closed the connection on shard %d with code %d. Reconnecting.",
+            self.shard_id,
+            code,
+        )
+        # only closing with 1000 or 1001 ourselves invalidates the session, not the Gateway doing so
+        await self._close(code=code, reconnect=True, keep_session=True)
+
     # Connection management
 
     async def connect(self, url: t.Optional[str] = None) -> None:
@@ -230,11 +597,24 @@ class GatewayClient:
         Args:
             url (t.Optional[str]): The url to connect to the Gateway with. This should only be used if we are resuming.
                 If this is not provided, then the url will be fetched via the Get Gateway Bot endpoint. Defaults to None.
+                If a session is restored from the session store, then its resume url is used instead.
         """
+        if not self.session_id and self._restore_session():
+            url = self.resume_url
+
         if not url:
             url = (await self._http.get_gateway_bot())["url"]
 
-        self._ws = await self._http.ws_connect(url)
+        # compression contexts only live as long as the connection
+        if self.decompressor is not None:
+            self.decompressor.reset()
+
+        self._ws = await self._http.ws_connect(self._format_url(url))
+        self._closing = False
+
+        if self._stopped.is_set():
+            # the client was closed while the connection was being made
+            return await self._close_ws(code=4000)
 
         res = await self.receive()
         if res and self.recent_payload is not None and self.recent_payload["op"] == HELLO:
@@ -244,7 +624,8 @@ class GatewayClient:
             # Disconnect and DO NOT ATTEMPT a reconnection
             return await self.close(reconnect=False)
 
-        self.ratelimiter.start()
+        # the command limit is per connection
+        self.ratelimiter.reset()
 
         self.heartbeat_handler.start()
         if self.can_resume:
@@ -252,29 +633,23 @@ class GatewayClient:
         else:
             await self.identify()
 
+        # send the updates that were made while disconnected
+        self._start_draining()
+
         return await self.connection_loop()
 
     async def connection_loop(self) -> None:
         """Executes the main Gateway loop, which is the following:
 
-        - compare the last time the heartbeat ack was sent from the server to current time
-            - if that comparison is greater than the heartbeat timeout, then we reconnect
         - receive the latest message from the server via :meth:`.receive`
         - poll the latest message and perform an action based on that payload
+
+        Zombified connections are detected by the heartbeat handler, which closes the websocket.
         """
         if not self._ws:
             return
 
-        while not self.is_closed:
-            if (
-                self._last_heartbeat_ack
-                and (datetime.datetime.now() - self._last_heartbeat_ack).total_seconds()
-                > self.heartbeat_timeout
-            ):
-                _log.debug("Zombified connection detected. Closing connection with code 1008.")
-                await self.close(code=1008)
-                return
-
+        while not self.is_closed and not self._closing:
             res = await self.receive()
 
             if res and self.recent_payload is not None:
@@ -287,6 +662,17 @@ class GatewayClient:
                         ready_data = t.cast(dt.ReadyData, data)
                         self.session_id = ready_data["session_id"]
                         self.resume_url = ready_data["resume_gateway_url"]
+                        self.can_resume = True
+                        self._save_session()
+
+                    if event_name in ("ready", "resumed"):
+                        self._mark_connected()
+
+                    if event_name == "guild_members_chunk":
+                        chunk = t.cast(dt.GuildMembersChunkData, data)
+                        request = self._chunk_requests.get(chunk.get("nonce", ""))
+                        if request is not None:
+                            request.feed(chunk)
 
                     args = (data,)
                     if data is None:
@@ -304,22 +690,93 @@ class GatewayClient:
 
                 elif op == INVALID_SESSION:
                     self.can_resume = bool(self.recent_payload.get("d"))
+                    if not self.can_resume:
+                        self._invalidate_session()
                     self._dispatcher.dispatch("invalid_session", self.can_resume)
                     await self.close(code=1012)
                     return
 
                 elif op == HEARTBEAT_ACK:
-                    self._last_heartbeat_ack = datetime.datetime.now()
+                    self.heartbeat_handler.ack()
+
+    def _mark_connected(self) -> None:
+        # a session has been established, so the backoff starts over
+        self._reconnect_attempts = 0
+        if self._disconnected_at is not None:
+            self.downtime += time.monotonic() - self._disconnected_at
+            self._disconnected_at = None
+
+    async def run_forever(
+        self,
+        url: t.Optional[str] = None,
+        *,
+        base_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        """Connects to the Gateway and reconnects every time the connection is lost.
+        This will run until the client is closed without reconnecting, or until the Gateway closes the
+        connection with a close code that reconnecting cannot fix (like 4004, authentication failed).
+
+        Reconnects are delayed with exponential backoff and full jitter, so many shards losing their connection
+        at once do not reconnect at once. The backoff is reset once a session is established.
+
+        Args:
+            url (t.Optional[str]): The url to connect to the Gateway with. If this is not provided, then the url
+                will be fetched via the Get Gateway Bot endpoint. Defaults to None.
+            base_backoff (float): The base delay (in seconds) of the backoff. Defaults to 1 second.
+            max_backoff (float): The maximum delay (in seconds) of the backoff. Defaults to 60 seconds.
+        """
+        self._stopped.clear()
+        connect_url = url
+        while not self._stopped.is_set():
+            try:
+                await self.connect(connect_url)
+                return
+            except GatewayReconnect as e:
+                connect_url = e.url if e.resume else url
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+                _log.warning("Gateway connection failed on shard %d.", self.shard_id, exc_info=e)
+                connect_url = self.resume_url if self.can_resume else url
+
+            if self._disconnected_at is None:
+                self._disconnected_at = time.monotonic()
+
+            delay = random.uniform(
+                0.0, min(max_backoff, base_backoff * 2**self._reconnect_attempts)
+            )
+            self._reconnect_attempts += 1
+            self.reconnects += 1
+            _log.info(
+                "Reconnecting shard %d in %.2f seconds (attempt %d, %d reconnects in total).",
+                self.shard_id,
+                delay,
+                self._reconnect_attempts,
+                self.reconnects,
+            )
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
 
     async def close(self, *, code: int = 1000, reconnect: bool = True) -> None:
         """Closes the connection with the websocket.
 
+        Closing with code 1000 or 1001 invalidates the session, so it is removed from the session store.
+        Close with any other code (like 4000) to keep the session resumable after a restart.
+
         Args:
             code (int): The websocket code to close with. Defaults to 1000.
             reconnect (bool): If we should reconnect or not. Defaults to True.
+                Closing without reconnecting also stops :meth:`.run_forever`, even while it is waiting to reconnect.
         """
-        if not self._ws or self._ws.closed:
+        if not reconnect:
+            self._stopped.set()
+        await self._close(code=code, reconnect=reconnect, keep_session=code not in (1000, 1001))
+
+    async def _close(self, *, code: int, reconnect: bool, keep_session: bool) -> None:
+        if not self._ws or self._closing:
             return
+        self._closing = True
 
         _log.info(
             "Closing Gateway connection with code %d that %s reconnect.",
@@ -327,18 +784,35 @@ class GatewayClient:
             "will" if reconnect else "will not",
         )
 
-        # Close the websocket connection
-        await self._ws.close(code=code)
+        # Close the websocket connection, unless it was closed already
+        await self._close_ws(code=code)
+
+        if keep_session:
+            self._save_session()
+        else:
+            self.can_resume = False
+            self._delete_session()
+
+        # chunks of member requests are only replayed if the session is resumed
+        if not reconnect or not self.can_resume:
+            for request in list(self._chunk_requests.values()):
+                request._give_up("ended with its session")  # pyright: ignore[reportPrivateUsage]
 
         # Clean up lingering tasks (this will throw exceptions if we get the client to do it)
-        await self.ratelimiter.stop()
         await self.heartbeat_handler.stop()
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            await asyncio.gather(self._drain_task, return_exceptions=True)
+            self._drain_task = None
 
         # if we need to reconnect, set the event
         if reconnect:
-            self._last_heartbeat_ack = None
             raise GatewayReconnect(self.resume_url, self.can_resume)
 
+    async def _close_ws(self, *, code: int) -> None:
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close(code=code)
+
     # Payloads
 
     @property
@@ -355,6 +829,7 @@ class GatewayClient:
                     "device": "discatcore",
                 },
                 "large_threshold": 250,
+                "shard": [self.shard_id, self.shard_count],
             },
         }
 
@@ -386,7 +861,15 @@ class GatewayClient:
         await self.send(self.heartbeat_payload)
 
     async def identify(self) -> None:
-        """Sends the identify payload to the Gateway."""
+        """Sends the identify payload to the Gateway.
+        If this client has an identify ratelimiter, this will wait until the shard is allowed to identify.
+        """
+        if self.identify_ratelimiter is not None:
+            await self.identify_ratelimiter.acquire(self.shard_id)
+            if self.is_closed:
+                # the connection was closed while waiting
+                return
+
         await self.send(self.identify_payload)
 
     async def resume(self) -> None:
@@ -401,6 +884,7 @@ class GatewayClient:
         limit: int = 0,
         query: str = "",
         presences: bool = False,
+        nonce: t.Optional[str] = None,
     ) -> None:
         """Sends the request guild members payload to the Gateway.
 
@@ -411,6 +895,7 @@ class GatewayClient:
             query (str): The string the username starts with. Defaults to "".
             presences (bool): Whether or not Discord should give us the presences of the members.
                 Defaults to False.
+            nonce (t.Optional[str]): The nonce to identify the member chunks with. Defaults to None.
         """
         payload: dict[str, t.Any] = {
             "op": REQUEST_GUILD_MEMBERS,
@@ -424,11 +909,101 @@ class GatewayClient:
 
         if user_ids is not None:
             payload["d"]["user_ids"] = user_ids
+        if nonce is not None:
+            payload["d"]["nonce"] = nonce
 
         await self.send(payload)
 
+    async def chunk_guild(
+        self,
+        guild_id: dt.Snowflake,
+        *,
+        user_ids: t.Optional[t.Union[dt.Snowflake, list[dt.Snowflake]]] = None,
+        limit: int = 0,
+        query: str = "",
+        presences: bool = False,
+        timeout: float = 10.0,
+    ) -> MemberChunkRequest:
+        """Requests the members of a guild and returns the request that receives the member chunks.
+
+        Args:
+            guild_id (int): The guild ID we are requesting members from.
+            user_ids (t.Optional[t.Union[int, List[int]]]): The user id(s) to request. Defaults to None.
+            limit (int): The maximum amount of members to grab. Defaults to 0.
+            query (str): The string the username starts with. Defaults to "".
+            presences (bool): Whether or not Discord should give us the presences of the members.
+                Defaults to False.
+            timeout (float): How long (in seconds) to wait for the next chunk. Defaults to 10 seconds.
+
+        Returns:
+            The member request. Iterate over it to receive the chunks, or use :meth:`MemberChunkRequest.collect`.
+        """
+        request = MemberChunkRequest(self, guild_id, timeout)
+        # the request is registered first so no chunk arrives before it
+        self._chunk_requests[request.nonce] = request
+        try:
+            await self.request_guild_members(
+                guild_id,
+                user_ids=user_ids,
+                limit=limit,
+                query=query,
+                presences=presences,
+                nonce=request.nonce,
+            )
+        except BaseException:
+            self._chunk_requests.pop(request.nonce, None)
+            raise
+
+        request._reset_timer()  # pyright: ignore[reportPrivateUsage]
+        return request
+
+    async def chunk_guilds(
+        self,
+        guild_ids: Iterable[dt.Snowflake],
+        *,
+        presences: bool = False,
+        timeout: float = 10.0,
+        concurrency: int = 10,
+    ) -> AsyncIterator[MemberChunkRequest]:
+        """Requests every member of multiple guilds. The requests are sent through the ratelimiter,
+        so the member requests never use up the commands needed to keep the connection alive.
+
+        Args:
+            guild_ids (Iterable[dt.Snowflake]): The ids of the guilds to request the members of.
+            presences (bool): Whether or not Discord should give us the presences of the members.
+                Defaults to False.
+            timeout (float): How long (in seconds) to wait for the next chunk of a guild. Defaults to 10 seconds.
+            concurrency (int): The maximum amount of guilds to wait for at once. Defaults to 10.
+
+        Yields:
+            The member request of every guild once it is done, in the order they are done.
+            Requests that stalled have :attr:`MemberChunkRequest.timed_out` set.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def chunk(guild_id: dt.Snowflake) -> MemberChunkRequest:
+            async with semaphore:
+                request = await self.chunk_guild(guild_id, presences=presences, timeout=timeout)
+                try:
+                    await request.collect()
+                except asyncio.TimeoutError:
+                    pass
+                return request
+
+        tasks = [asyncio.create_task(chunk(guild_id)) for guild_id in guild_ids]
+        try:
+            for next_request in asyncio.as_completed(tasks):
+                yield await next_request
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def update_presence(self, *, since: int, status: str, afk: bool) -> None:
-        """Sends the update presence payload to the Gateway.
+        """Queues the update presence payload to be sent to the Gateway.
+
+        Only the latest presence update is kept while waiting on the ratelimiter, so a burst of updates
+        only uses up one command.
 
         Args:
             since (int): When the bot went AFK.
@@ -447,7 +1022,7 @@ class GatewayClient:
 
         # TODO: Activities
 
-        await self.send(payload)
+        self._send_coalesced(PRESENCE_UPDATE, payload)
 
     async def update_voice_state(
         self,
@@ -457,7 +1032,9 @@ class GatewayClient:
         self_mute: bool,
         self_deaf: bool,
     ) -> None:
-        """Sends the update voice state payload to the Gateway.
+        """Queues the update voice state payload to be sent to the Gateway.
+
+        Only the latest voice state update of every guild is kept while waiting on the ratelimiter.
 
         Args:
             guild_id (dt.Snowflake): The id of the guild where the voice channel is in.
@@ -465,7 +1042,8 @@ class GatewayClient:
             self_mute (bool): Whether the bot is muted or not.
             self_deaf (bool): Whether the bot is deafened or not.
         """
-        await self.send(
+        self._send_coalesced(
+            (VOICE_STATE_UPDATE, int(guild_id)),
             {
                 "op": VOICE_STATE_UPDATE,
                 "d": {
@@ -474,11 +1052,22 @@ class GatewayClient:
                     "self_mute": self_mute,
                     "self_deaf": self_deaf,
                 },
-            }
+            },
         )
 
     # Misc
 
+    @property
+    def latency(self) -> t.Optional[float]:
+        """The average round trip time (in seconds) of the most recent heartbeats.
+        This is None if no heartbeat has been acknowledged yet.
+        """
+        latencies = self.heartbeat_handler.latencies
+        if not latencies:
+            return None
+
+        return sum(latencies) / len(latencies)
+
     @property
     def is_closed(self) -> bool:
         if not self._ws:
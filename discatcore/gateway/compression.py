@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: MIT
+
+import typing as t
+import zlib
+
+has_zstandard: bool = False
+try:
+    import zstandard
+
+    has_zstandard = True
+except ImportError:
+    pass
+
+__all__ = (
+    "BaseDecompressor",
+    "ZlibStreamDecompressor",
+    "ZstdStreamDecompressor",
+    "get_decompressor",
+)
+
+ZLIB_SUFFIX = b"\x00\x00\xff\xff"
+
+
+class BaseDecompressor:
+    """The base class for all Gateway transport decompressors.
+
+    Decompressors only work with raw websocket frames, so they can be used without a Gateway connection
+    (for example, to benchmark them against recorded frames).
+
+    Attributes:
+        name (str): The name of the compression. This is used as the ``compress`` query parameter.
+    """
+
+    __slots__ = ()
+
+    name: t.ClassVar[str]
+
+    def reset(self) -> None:
+        """Resets the decompression context. This is called every time a new connection is made."""
+        raise NotImplementedError
+
+    def decompress(self, data: bytes) -> t.Optional[bytes]:
+        """Decompresses a websocket frame.
+
+        Args:
+            data (bytes): The raw websocket frame.
+
+        Returns:
+            The decompressed payload, none if the payload has not been fully received yet.
+        """
+        raise NotImplementedError
+
+
+class ZlibStreamDecompressor(BaseDecompressor):
+    """A decompressor for the zlib-stream transport compression.
+
+    Payloads can be split across multiple frames, so frames are buffered until the zlib suffix arrives.
+    """
+
+    __slots__ = ("_inflator", "_buffer")
+
+    name = "zlib-stream"
+
+    def __init__(self) -> None:
+        self._inflator = zlib.decompressobj()
+        self._buffer: bytearray = bytearray()
+
+    def reset(self) -> None:
+        self._inflator = zlib.decompressobj()
+        self._buffer.clear()
+
+    def decompress(self, data: bytes) -> t.Optional[bytes]:
+        self._buffer.extend(data)
+
+        if not self._buffer.endswith(ZLIB_SUFFIX):
+            return None
+
+        out = self._inflator.decompress(self._buffer)
+        self._buffer.clear()
+        return out
+
+
+class ZstdStreamDecompressor(BaseDecompressor):
+    """A decompressor for the zstd-stream transport compression. This requires the ``zstandard`` package."""
+
+    __slots__ = ("_decompressor", "_inflator")
+
+    name = "zstd-stream"
+
+    def __init__(self) -> None:
+        if not has_zstandard:
+            raise RuntimeError("The zstandard package is required for zstd-stream compression.")
+
+        self._decompressor = zstandard.ZstdDecompressor()
+        self._inflator = self._decompressor.decompressobj()
+
+    def reset(self) -> None:
+        self._inflator = self._decompressor.decompressobj()
+
+    def decompress(self, data: bytes) -> t.Optional[bytes]:
+        # every frame is flushed by Discord, so each one holds at least one whole payload
+        out = self._inflator.decompress(data)
+        if not out:
+            # the frame only held part of the compressed stream, so wait for the rest of it
+            return None
+        return out
+
+
+_DECOMPRESSORS: dict[str, type[BaseDecompressor]] = {
+    ZlibStreamDecompressor.name: ZlibStreamDecompressor,
+    ZstdStreamDecompressor.name: ZstdStreamDecompressor,
+}
+
+
+def get_decompressor(name: str) -> BaseDecompressor:
+    """Creates a new decompressor from the name of a transport compression.
+
+    Args:
+        name (str): The name of the transport compression. This is either "zlib-stream" or "zstd-stream".
+
+    Returns:
+        The new decompressor.
+    """
+    decompressor_cls = _DECOMPRESSORS.get(name)
+    if decompressor_cls is None:
+        raise ValueError(f"Unknown transport compression {name}!")
+
+    return decompressor_cls()
@@ -0,0 +1,337 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+import logging
+import math
+import multiprocessing
+import multiprocessing.process
+import secrets
+import typing as t
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from ..http import HTTPClient
+from ..utils.dispatcher import Dispatcher
+from ..utils.frames import encode_frame, read_frame, write_frame
+from .ratelimiter import IdentifyRatelimiter
+from .shard import ShardManager
+
+__all__ = ("ShardProcessPool",)
+
+_log = logging.getLogger(__name__)
+
+# frame types, see discatcore.utils.frames
+_EVENT = 0
+_IDENTIFY_REQUEST = 1
+_IDENTIFY_GRANT = 2
+_CLOSE = 3
+_HELLO = 4
+
+# the secret is the only thing a worker sends before it is trusted
+_MAX_HELLO_LENGTH = 256
+_HELLO_TIMEOUT = 10.0
+
+
+@dataclass
+class _WorkerConfig:
+    token: str
+    api_version: int
+    port: int
+    secret: str
+    shard_ids: list[int]
+    shard_count: int
+    max_concurrency: int
+    events: list[str]
+    gateway_kwargs: dict[str, t.Any] = field(default_factory=dict[str, t.Any])
+
+
+class _ForwardingDispatcher(Dispatcher):
+    """A dispatcher that forwards selected events to the parent process.
+
+    Events are written one at a time, waiting for the socket to drain in between. Dispatching cannot wait,
+    so at most ``max_pending`` events are buffered, and events are dropped if the parent process falls
+    further behind than that.
+    """
+
+    __slots__ = ("_writer", "_forwarded_events", "_pending", "_max_pending", "_task", "dropped")
+
+    def __init__(
+        self,
+        writer: asyncio.StreamWriter,
+        forwarded_events: Iterable[str],
+        max_pending: int = 10000,
+    ) -> None:
+        super().__init__()
+        self._writer: asyncio.StreamWriter = writer
+        self._forwarded_events: frozenset[str] = frozenset(forwarded_events)
+        self._pending: deque[bytes] = deque()
+        self._max_pending: int = max_pending
+        self._task: t.Optional[asyncio.Task[None]] = None
+        self.dropped: int = 0
+
+    def dispatch(self, name: str, *args: t.Any, **kwargs: t.Any) -> None:
+        if name in self._forwarded_events and not self._writer.is_closing():
+            self._forward(encode_frame(_EVENT, [name, list(args)]))
+
+        super().dispatch(name, *args, **kwargs)
+
+    def _forward(self, frame: bytes) -> None:
+        if len(self._pending) >= self._max_pending:
+            self.dropped += 1
+            if self.dropped == 1 or not self.dropped % 1000:
+                _log.warning(
+                    "The parent process is not keeping up, %d forwarded events have been dropped.",
+                    self.dropped,
+                )
+            return
+
+        self._pending.append(frame)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._write_pending())
+
+    async def _write_pending(self) -> None:
+        try:
+            while self._pending:
+                self._writer.write(self._pending.popleft())
+                await self._writer.drain()
+        except ConnectionError:
+            # the parent process has gone away
+            self._pending.clear()
+
+    def has_callbacks(self, name: str) -> bool:
+        return name in self._forwarded_events or super().has_callbacks(name)
+
+
+class _BridgeIdentifyRatelimiter(IdentifyRatelimiter):
+    """An identify ratelimiter that asks the parent process for permission to identify."""
+
+    __slots__ = ("_writer", "_grants")
+
+    def __init__(self, writer: asyncio.StreamWriter, max_concurrency: int) -> None:
+        super().__init__(max_concurrency)
+        self._writer: asyncio.StreamWriter = writer
+        self._grants: dict[int, asyncio.Future[None]] = {}
+
+    async def acquire(self, shard_id: int) -> None:
+        grant = asyncio.get_running_loop().create_future()
+        self._grants[shard_id] = grant
+        write_frame(self._writer, _IDENTIFY_REQUEST, shard_id)
+        await grant
+
+    def grant(self, shard_id: int) -> None:
+        grant = self._grants.pop(shard_id, None)
+        if grant is not None and not grant.done():
+            grant.set_result(None)
+
+
+async def _worker(config: _WorkerConfig) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", config.port)
+    write_frame(writer, _HELLO, config.secret)
+
+    http = HTTPClient(config.token, api_version=config.api_version)
+    dispatcher = _ForwardingDispatcher(writer, config.events)
+    identify_ratelimiter = _BridgeIdentifyRatelimiter(writer, config.max_concurrency)
+    manager = ShardManager(
+        http,
+        dispatcher,
+        shard_count=config.shard_count,
+        shard_ids=config.shard_ids,
+        max_concurrency=config.max_concurrency,
+        identify_ratelimiter=identify_ratelimiter,
+        **config.gateway_kwargs,
+    )
+
+    async def read_parent() -> None:
+        try:
+            while True:
+                frame_type, payload = await read_frame(reader)
+                if frame_type == _IDENTIFY_GRANT:
+                    identify_ratelimiter.grant(payload)
+                elif frame_type == _CLOSE:
+                    break
+        except asyncio.IncompleteReadError:
+            # the parent process has gone away
+            pass
+
+        await manager.close()
+
+    reader_task = asyncio.create_task(read_parent())
+    try:
+        await manager.start()
+    finally:
+        reader_task.cancel()
+        writer.close()
+        await http.close()
+
+
+def _run_worker(config: _WorkerConfig) -> None:
+    asyncio.run(_worker(config))
+
+
+class ShardProcessPool:
+    """A class that runs shards across multiple worker processes, each with their own event loop.
+
+    Every worker process runs a :class:`ShardManager` for a contiguous range of shard ids.
+    Selected events are forwarded from the workers to the dispatcher of this process over a local socket,
+    and identifies are scheduled by this process so that the max concurrency is respected across every worker.
+    Workers have to send a secret that is only passed to the processes spawned by this pool before they are
+    trusted.
+
+    Args:
+        http (HTTPClient): The http client. This is used to fetch the gateway information, and its token
+            and API version are passed into every worker.
+        dispatcher (Dispatcher): The dispatcher that forwarded events will be dispatched to.
+        events (Iterable[str]): The names of the events that will be forwarded to this process.
+        processes (t.Optional[int]): The amount of worker processes. Defaults to the amount of CPUs.
+        shard_count (t.Optional[int]): The total amount of shards. If this is not provided, then
+            the recommended amount of shards from the Get Gateway Bot endpoint will be used. Defaults to None.
+        **gateway_kwargs (t.Any): Extra keyword arguments to pass into every :class:`GatewayClient`.
+            These must be picklable.
+
+    Attributes:
+        events (frozenset[str]): The names of the events that will be forwarded to this process.
+        processes (int): The amount of worker processes.
+        shard_count (t.Optional[int]): The total amount of shards. This is set after :meth:`.start` is called
+            if it was not provided.
+        identify_ratelimiter (t.Optional[IdentifyRatelimiter]): The identify ratelimiter shared by all workers.
+    """
+
+    __slots__ = (
+        "_http",
+        "_dispatcher",
+        "_gateway_kwargs",
+        "_server",
+        "_secret",
+        "_workers",
+        "_writers",
+        "_grant_tasks",
+        "events",
+        "processes",
+        "shard_count",
+        "identify_ratelimiter",
+    )
+
+    def __init__(
+        self,
+        http: HTTPClient,
+        dispatcher: Dispatcher,
+        *,
+        events: Iterable[str],
+        processes: t.Optional[int] = None,
+        shard_count: t.Optional[int] = None,
+        **gateway_kwargs: t.Any,
+    ) -> None:
+        self._http: HTTPClient = http
+        self._dispatcher: Dispatcher = dispatcher
+        self._gateway_kwargs: dict[str, t.Any] = gateway_kwargs
+        self._server: t.Optional[asyncio.AbstractServer] = None
+        # workers prove they were spawned by this pool with this, since any local process can connect
+        self._secret: str = secrets.token_hex(32)
+        self._workers: list[multiprocessing.process.BaseProcess] = []
+        self._writers: list[asyncio.StreamWriter] = []
+        self._grant_tasks: set[asyncio.Task[None]] = set()
+
+        self.events: frozenset[str] = frozenset(events)
+        self.processes: int = processes or multiprocessing.cpu_count()
+        self.shard_count: t.Optional[int] = shard_count
+        self.identify_ratelimiter: t.Optional[IdentifyRatelimiter] = None
+
+    async def _grant_identify(self, writer: asyncio.StreamWriter, shard_id: int) -> None:
+        if self.identify_ratelimiter is None:
+            return
+
+        await self.identify_ratelimiter.acquire(shard_id)
+        if not writer.is_closing():
+            write_frame(writer, _IDENTIFY_GRANT, shard_id)
+
+    async def _authenticate(self, reader: asyncio.StreamReader) -> bool:
+        try:
+            frame_type, payload = await asyncio.wait_for(
+                read_frame(reader, _MAX_HELLO_LENGTH), _HELLO_TIMEOUT
+            )
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError, ValueError):
+            return False
+
+        return (
+            frame_type == _HELLO
+            and isinstance(payload, str)
+            and hmac.compare_digest(payload.encode("utf-8"), self._secret.encode("utf-8"))
+        )
+
+    async def _handle_worker(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        if not await self._authenticate(reader):
+            _log.warning("Rejected a connection that did not come from a worker process.")
+            writer.close()
+            return
+
+        self._writers.append(writer)
+        try:
+            while True:
+                frame_type, payload = await read_frame(reader)
+                if frame_type == _EVENT:
+                    name, args = payload
+                    self._dispatcher.dispatch(name, *args)
+                elif frame_type == _IDENTIFY_REQUEST:
+                    task = asyncio.create_task(self._grant_identify(writer, payload))
+                    # the event loop only keeps weak references to tasks
+                    self._grant_tasks.add(task)
+                    task.add_done_callback(self._grant_tasks.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writers.remove(writer)
+            writer.close()
+
+    async def start(self) -> None:
+        """Spawns every worker process and starts forwarding events.
+        This will run until every worker process has exited.
+        """
+        gateway_info = await self._http.get_gateway_bot()
+        if self.shard_count is None:
+            self.shard_count = gateway_info["shards"]
+
+        max_concurrency = gateway_info["session_start_limit"]["max_concurrency"]
+        self.identify_ratelimiter = IdentifyRatelimiter(max_concurrency)
+
+        self._server = await asyncio.start_server(self._handle_worker, "127.0.0.1", 0)
+        port: int = self._server.sockets[0].getsockname()[1]
+
+        shard_ids = list(range(self.shard_count))
+        per_process = math.ceil(len(shard_ids) / self.processes)
+        ctx = multiprocessing.get_context("spawn")
+
+        for i in range(0, len(shard_ids), per_process):
+            config = _WorkerConfig(
+                token=self._http.token,
+                api_version=self._http.api_version,
+                port=port,
+                secret=self._secret,
+                shard_ids=shard_ids[i : i + per_process],
+                shard_count=self.shard_count,
+                max_concurrency=max_concurrency,
+                events=list(self.events),
+                gateway_kwargs=self._gateway_kwargs,
+            )
+            worker = ctx.Process(target=_run_worker, args=(config,), daemon=True)
+            worker.start()
+            self._workers.append(worker)
+            _log.info("Started worker process %d with shards %s.", worker.pid, config.shard_ids)
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(None, worker.join) for worker in self._workers))
+
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def close(self) -> None:
+        """Asks every worker process to close their shards and exit."""
+        for writer in self._writers:
+            if not writer.is_closing():
+                write_frame(writer, _CLOSE, None)
+                await writer.drain()
@@ -4,75 +4,110 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 import typing as t
 
-from ..utils.ratelimit import BaseRatelimiter
+from ..utils.ratelimit import TokenBucketRatelimiter
 
 if t.TYPE_CHECKING:
     from .client import GatewayClient
 
-__all__ = ("Ratelimiter",)
+__all__ = (
+    "Ratelimiter",
+    "IdentifyRatelimiter",
+)
 
 _log = logging.getLogger(__name__)
 
 
-class Ratelimiter(BaseRatelimiter):
-    """Represents a ratelimiter for a Gateway Client."""
+class Ratelimiter(TokenBucketRatelimiter):
+    """Represents a ratelimiter for a Gateway Client.
 
-    __slots__ = (
-        "commands_used",
-        "parent",
-        "_task",
-        "_lock",
-        "limit",
-        "reset_after",
-    )
+    Discord allows 120 commands every 60 seconds per connection. A few of those are reserved for heartbeats,
+    identifies and resumes, so they are never held up by other commands.
+
+    Args:
+        parent (GatewayClient): The Gateway client this ratelimiter belongs to.
+        limit (int): The amount of commands that can be sent every ``reset_after`` seconds. Defaults to 120.
+        reset_after (float): How long (in seconds) it takes for every command to be available again.
+            Defaults to 60 seconds.
+        reserved (int): The amount of commands reserved for heartbeats, identifies and resumes. Defaults to 3.
+
+    Attributes:
+        parent (GatewayClient): The Gateway client this ratelimiter belongs to.
+    """
 
-    def __init__(self, parent: GatewayClient, limit: int = 120, reset_after: float = 60.0) -> None:
-        super().__init__()
+    __slots__ = ("parent",)
 
-        self.commands_used: int = 0
-        self.limit: int = limit
-        self.reset_after: float = reset_after
+    HEARTBEAT: t.Final[int] = 0
+    CONNECTION: t.Final[int] = 1
+    NORMAL: t.Final[int] = 2
+    LOW: t.Final[int] = 3
+
+    def __init__(
+        self,
+        parent: GatewayClient,
+        limit: int = 120,
+        reset_after: float = 60.0,
+        reserved: int = 3,
+    ) -> None:
+        super().__init__(limit, reset_after, reserved=reserved, reserved_priority=self.CONNECTION)
         self.parent: GatewayClient = parent
-        self._task: t.Optional[asyncio.Task[t.Any]] = None
-
-    async def ratelimit_loop(self) -> None:
-        """Updates the amount of commands used per minute."""
-        while not self.parent.is_closed:
-            try:
-                self._lock.clear()
-
-                await asyncio.sleep(self.reset_after)
-
-                self._lock.set()
-                self.commands_used = 0
-            except asyncio.CancelledError:
-                break
-
-    def start(self) -> None:
-        """Starts the ratelimiter task which updates the commands used per minute."""
-        if not self._task:
-            self._task = asyncio.create_task(self.ratelimit_loop())
-            _log.info("Started Gateway ratelimiting task.")
-
-    async def stop(self) -> None:
-        """Stops the ratelimiter task."""
-        if self._task:
-            self._task.cancel()
-            await self._task
-            _log.info("Stopped Gateway ratelimiting task.")
-
-    def add_command_usage(self) -> None:
-        self.commands_used += 1
-        _log.debug("A Gateway command has been used.")
-
-    def is_ratelimited(self) -> bool:
-        return self.commands_used == self.limit - 1
-
-    async def acquire(self) -> None:
-        """Waits for the lock to be unlocked."""
-        if not self.is_ratelimited():
-            return
-
-        return await super().acquire()
+
+
+class IdentifyRatelimiter:
+    """Represents a ratelimiter for IDENTIFY payloads shared between multiple shards.
+
+    Discord allows ``max_concurrency`` shards to identify at once. Each shard falls into the
+    ratelimit key ``shard_id % max_concurrency`` and every key can be used once per ``delay`` seconds.
+
+    Args:
+        max_concurrency (int): The amount of shards that can identify at once. Defaults to 1.
+        delay (float): How long (in seconds) a ratelimit key is locked after an identify. Defaults to 5 seconds.
+
+    Attributes:
+        max_concurrency (int): The amount of shards that can identify at once.
+        delay (float): How long (in seconds) a ratelimit key is locked after an identify.
+    """
+
+    __slots__ = (
+        "max_concurrency",
+        "delay",
+        "_locks",
+        "_last_identify",
+    )
+
+    def __init__(self, max_concurrency: int = 1, delay: float = 5.0) -> None:
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency parameter cannot be negative or 0!")
+
+        self.max_concurrency: int = max_concurrency
+        self.delay: float = delay
+        self._locks: dict[int, asyncio.Lock] = {}
+        self._last_identify: dict[int, float] = {}
+
+    async def acquire(self, shard_id: int) -> None:
+        """Waits until the shard provided is allowed to identify.
+
+        Args:
+            shard_id (int): The id of the shard that will identify.
+        """
+        key = shard_id % self.max_concurrency
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+
+        async with lock:
+            last_identify = self._last_identify.get(key)
+            if last_identify is not None:
+                delay = self.delay - (time.monotonic() - last_identify)
+                if delay > 0:
+                    _log.debug(
+                        "Shard %d is waiting %f seconds to identify with ratelimit key %d.",
+                        shard_id,
+                        delay,
+                        key,
+                    )
+                    await asyncio.sleep(delay)
+
+            self._last_identify[key] = time.monotonic()
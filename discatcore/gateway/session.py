@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: MIT
+
+import logging
+import os
+import pathlib
+import typing as t
+from dataclasses import asdict, dataclass
+
+from ..utils.files import write_atomic
+from ..utils.json import dumps_bytes, loads
+
+__all__ = (
+    "SessionInfo",
+    "BaseSessionStore",
+    "FileSessionStore",
+)
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class SessionInfo:
+    """Represents the information needed to resume a Gateway session.
+
+    Attributes:
+        session_id (str): The session id of the Gateway connection.
+        sequence (t.Optional[int]): The last sequence number received.
+        resume_url (str): The url to resume the Gateway connection with.
+    """
+
+    session_id: str
+    sequence: t.Optional[int]
+    resume_url: str
+
+
+class BaseSessionStore:
+    """The base class for all session stores. Session stores keep Gateway sessions around between restarts
+    so shards can resume instead of identifying again.
+
+    A session store can be shared between multiple shards, sessions are stored per shard id.
+    """
+
+    __slots__ = ()
+
+    def load(self, shard_id: int) -> t.Optional[SessionInfo]:
+        """Loads the stored session of a shard.
+
+        Args:
+            shard_id (int): The id of the shard.
+
+        Returns:
+            The stored session, none if there is no stored session.
+        """
+        raise NotImplementedError
+
+    def save(self, shard_id: int, session: SessionInfo) -> None:
+        """Stores the session of a shard.
+
+        Args:
+            shard_id (int): The id of the shard.
+            session (SessionInfo): The session to store.
+        """
+        raise NotImplementedError
+
+    def delete(self, shard_id: int) -> None:
+        """Removes the stored session of a shard. This is called when the session cannot be resumed.
+
+        Args:
+            shard_id (int): The id of the shard.
+        """
+        raise NotImplementedError
+
+
+class FileSessionStore(BaseSessionStore):
+    """A session store that keeps every session in a JSON file inside of a directory.
+
+    Args:
+        directory (t.Union[str, os.PathLike[str]]): The directory to store the sessions in.
+            This will be created if it does not exist. Defaults to ".sessions".
+
+    Attributes:
+        directory (pathlib.Path): The directory the sessions are stored in.
+    """
+
+    __slots__ = ("directory",)
+
+    def __init__(self, directory: t.Union[str, "os.PathLike[str]"] = ".sessions") -> None:
+        self.directory: pathlib.Path = pathlib.Path(directory)
+
+    def _path(self, shard_id: int) -> pathlib.Path:
+        return self.directory / f"session-{shard_id}.json"
+
+    def load(self, shard_id: int) -> t.Optional[SessionInfo]:
+        path = self._path(shard_id)
+        try:
+            return SessionInfo(**loads(path.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError):
+            _log.warning("Ignoring malformed session file %s.", path)
+            return None
+
+    def save(self, shard_id: int, session: SessionInfo) -> None:
+        write_atomic(self._path(shard_id), dumps_bytes(asdict(session)))
+
+    def delete(self, shard_id: int) -> None:
+        try:
+            self._path(shard_id).unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing as t
+from collections.abc import Sequence
+
+from ..http import HTTPClient
+from ..utils.dispatcher import Dispatcher
+from .client import GatewayClient
+from .ratelimiter import IdentifyRatelimiter
+
+__all__ = ("ShardManager",)
+
+_log = logging.getLogger(__name__)
+
+
+class ShardManager:
+    """A class that manages multiple Gateway connections (shards) for the same bot.
+
+    All shards share the same http client and dispatcher. Identifies are scheduled via an
+    :class:`IdentifyRatelimiter` so shards start up as fast as Discord allows.
+
+    Args:
+        http (HTTPClient): The http client. This is shared between all shards.
+        dispatcher (Dispatcher): The dispatcher. This is shared between all shards.
+        shard_count (t.Optional[int]): The total amount of shards. If this is not provided, then
+            the recommended amount of shards from the Get Gateway Bot endpoint will be used. Defaults to None.
+        shard_ids (t.Optional[Sequence[int]]): The ids of the shards this manager should run.
+            If this is not provided, then every shard will be ran. Defaults to None.
+        max_concurrency (t.Optional[int]): The amount of shards that can identify at once. If this is not provided,
+            then the value from the Get Gateway Bot endpoint will be used. Defaults to None.
+        identify_ratelimiter (t.Optional[IdentifyRatelimiter]): The identify ratelimiter to share between all shards.
+            If this is not provided, then one will be created with the max concurrency. Defaults to None.
+        **gateway_kwargs (t.Any): Extra keyword arguments to pass into every :class:`GatewayClient`.
+
+    Attributes:
+        shard_count (t.Optional[int]): The total amount of shards. This is set after :meth:`.start` is called
+            if it was not provided.
+        shard_ids (t.Optional[list[int]]): The ids of the shards this manager runs. This is set after
+            :meth:`.start` is called if it was not provided.
+        max_concurrency (t.Optional[int]): The amount of shards that can identify at once. This is set after
+            :meth:`.start` is called if it was not provided.
+        shards (dict[int, GatewayClient]): A mapping of shard ids to the Gateway client of that shard.
+        identify_ratelimiter (t.Optional[IdentifyRatelimiter]): The identify ratelimiter shared by all shards.
+    """
+
+    __slots__ = (
+        "_http",
+        "_dispatcher",
+        "_gateway_kwargs",
+        "_tasks",
+        "shard_count",
+        "shard_ids",
+        "max_concurrency",
+        "shards",
+        "identify_ratelimiter",
+    )
+
+    def __init__(
+        self,
+        http: HTTPClient,
+        dispatcher: Dispatcher,
+        *,
+        shard_count: t.Optional[int] = None,
+        shard_ids: t.Optional[Sequence[int]] = None,
+        max_concurrency: t.Optional[int] = None,
+        identify_ratelimiter: t.Optional[IdentifyRatelimiter] = None,
+        **gateway_kwargs: t.Any,
+    ) -> None:
+        if shard_ids is not None and shard_count is None:
+            raise ValueError("shard_count parameter must be provided if shard_ids is provided!")
+
+        self._http: HTTPClient = http
+        self._dispatcher: Dispatcher = dispatcher
+        self._gateway_kwargs: dict[str, t.Any] = gateway_kwargs
+        self._tasks: list[asyncio.Task[None]] = []
+
+        self.shard_count: t.Optional[int] = shard_count
+        self.shard_ids: t.Optional[list[int]] = list(shard_ids) if shard_ids is not None else None
+        self.max_concurrency: t.Optional[int] = max_concurrency
+        self.shards: dict[int, GatewayClient] = {}
+        self.identify_ratelimiter: t.Optional[IdentifyRatelimiter] = identify_ratelimiter
+
+    async def start(self) -> None:
+        """Creates every shard and starts their connections with the Gateway.
+        This will run until every shard has been closed without reconnecting.
+        """
+        gateway_info = await self._http.get_gateway_bot()
+        session_start_limit = gateway_info["session_start_limit"]
+
+        if self.shard_count is None:
+            self.shard_count = gateway_info["shards"]
+        if self.shard_ids is None:
+            self.shard_ids = list(range(self.shard_count))
+        if self.max_concurrency is None:
+            self.max_concurrency = session_start_limit["max_concurrency"]
+
+        if session_start_limit["remaining"] < len(self.shard_ids):
+            _log.warning(
+                "Only %d session starts are remaining but %d shards will be started. "
+                "The session start limit resets in %d milliseconds.",
+                session_start_limit["remaining"],
+                len(self.shard_ids),
+                session_start_limit["reset_after"],
+            )
+
+        if self.identify_ratelimiter is None:
+            self.identify_ratelimiter = IdentifyRatelimiter(self.max_concurrency)
+        url = gateway_info["url"]
+
+        for shard_id in self.shard_ids:
+            shard = GatewayClient(
+                self._http,
+                self._dispatcher,
+                shard_id=shard_id,
+                shard_count=self.shard_count,
+                identify_ratelimiter=self.identify_ratelimiter,
+                **self._gateway_kwargs,
+            )
+            self.shards[shard_id] = shard
+            self._tasks.append(
+                asyncio.create_task(shard.run_forever(url), name=f"DisCatCore Shard:{shard_id}")
+            )
+
+        _log.info(
+            "Started %d shards out of %d with a max concurrency of %d.",
+            len(self.shard_ids),
+            self.shard_count,
+            self.max_concurrency,
+        )
+        await asyncio.gather(*self._tasks)
+
+    async def close(self, code: int = 4000, timeout: float = 10.0) -> None:
+        """Closes every shard without reconnecting.
+
+        Args:
+            code (int): The websocket code to close every shard with. Closing with 1000 or 1001 invalidates
+                the sessions. Defaults to 4000, which keeps the sessions resumable, so a restart can resume
+                them with a session store.
+            timeout (float): The time (in seconds) to wait for the shards to stop before they are cancelled.
+                Defaults to 10 seconds.
+        """
+        for shard in self.shards.values():
+            await shard.close(code=code, reconnect=False)
+
+        if self._tasks:
+            _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def get_shard(self, guild_id: int) -> t.Optional[GatewayClient]:
+        """Returns the shard that receives events for a guild.
+
+        Args:
+            guild_id (int): The id of the guild.
+
+        Returns:
+            The shard, none if the shard is not ran by this manager.
+        """
+        if self.shard_count is None:
+            return None
+
+        return self.shards.get((int(guild_id) >> 22) % self.shard_count)
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MIT
 
 import builtins
+import re
 import typing as t
 from dataclasses import dataclass
 
@@ -15,6 +16,8 @@ __all__ = (
     "BinaryTypedWSMessage",
     "is_text",
     "is_binary",
+    "PayloadEnvelope",
+    "parse_envelope",
 )
 
 
@@ -43,3 +46,62 @@ def is_text(base: BaseTypedWSMessage[t.Any]) -> TypeGuard[TextTypedWSMessage]:
 
 def is_binary(base: BaseTypedWSMessage[t.Any]) -> TypeGuard[BinaryTypedWSMessage]:
     return base.type is aiohttp.WSMsgType.BINARY
+
+
+@dataclass
+class PayloadEnvelope:
+    """Represents the envelope of a JSON Gateway payload whose data has not been decoded yet.
+
+    Attributes:
+        op (int): The opcode of the payload (``op``).
+        event_name (t.Optional[str]): The event name of the payload (``t``).
+        sequence (t.Optional[int]): The sequence number of the payload (``s``).
+        data (memoryview): The raw JSON data of the payload (``d``), which can be decoded on its own.
+    """
+
+    op: int
+    event_name: t.Optional[str]
+    sequence: t.Optional[int]
+    data: memoryview
+
+
+_ENVELOPE_FIELD = re.compile(rb'"(t|s|op)":(null|"[A-Za-z0-9_]*"|-?[0-9]+),')
+
+
+def parse_envelope(raw: bytes) -> t.Optional[PayloadEnvelope]:
+    """Extracts the envelope of a JSON Gateway payload without decoding its data.
+
+    This only works if the ``t``, ``s`` and ``op`` fields come before the ``d`` field without any whitespace,
+    which is how Discord sends payloads.
+
+    Args:
+        raw (bytes): The raw JSON payload.
+
+    Returns:
+        The envelope, none if the payload is not laid out as expected and has to be fully decoded instead.
+    """
+    if not raw.startswith(b"{") or not raw.endswith(b"}"):
+        return None
+
+    fields: dict[bytes, bytes] = {}
+    pos = 1
+    for _ in range(3):
+        match = _ENVELOPE_FIELD.match(raw, pos)
+        if match is None:
+            return None
+        fields[match.group(1)] = match.group(2)
+        pos = match.end()
+
+    if len(fields) != 3 or not raw.startswith(b'"d":', pos):
+        return None
+
+    raw_op, raw_t, raw_s = fields[b"op"], fields[b"t"], fields[b"s"]
+    if raw_op == b"null" or raw_op.startswith(b'"') or raw_s.startswith(b'"'):
+        return None
+
+    return PayloadEnvelope(
+        op=int(raw_op),
+        event_name=None if raw_t == b"null" else raw_t[1:-1].decode("ascii"),
+        sequence=None if raw_s == b"null" else int(raw_s),
+        data=memoryview(raw)[pos + 4 : -1],
+    )
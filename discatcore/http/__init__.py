@@ -5,11 +5,17 @@ discatcore.http
 The HTTP modules for `discatcore`.
 """
 
+from .backend import *
+from .broker import *
+from .bucket_store import *
 from .client import *
 from .ratelimiter import *
 from .route import *
 
 __all__ = ()
+__all__ += backend.__all__
+__all__ += broker.__all__
+__all__ += bucket_store.__all__
 __all__ += client.__all__
 __all__ += ratelimiter.__all__
 __all__ += route.__all__
@@ -0,0 +1,180 @@
+# SPDX-License-Identifier: MIT
+
+import typing as t
+from collections.abc import Mapping
+
+from .ratelimiter import Bucket, Ratelimiter
+
+__all__ = (
+    "RATELIMIT_HEADERS",
+    "RatelimitPermit",
+    "BaseRatelimitBackend",
+    "LocalRatelimitBackend",
+)
+
+RATELIMIT_HEADERS: t.Final[tuple[str, ...]] = (
+    "X-RateLimit-Limit",
+    "X-RateLimit-Remaining",
+    "X-RateLimit-Reset",
+    "X-RateLimit-Reset-After",
+    "X-RateLimit-Bucket",
+    "X-RateLimit-Scope",
+)
+"""The response headers ratelimit backends are given."""
+
+
+class RatelimitPermit:
+    """Represents the permission to send one request, handed out by a ratelimit backend.
+
+    Args:
+        route_key (str): The key of the route (see :attr:`RouteTemplate.key`).
+        major_params (tuple[str, ...]): The major parameters of the route (see :attr:`Route.major_params`).
+
+    Attributes:
+        route_key (str): The key of the route.
+        major_params (tuple[str, ...]): The major parameters of the route.
+    """
+
+    __slots__ = ("route_key", "major_params")
+
+    def __init__(self, route_key: str, major_params: tuple[str, ...]) -> None:
+        self.route_key: str = route_key
+        self.major_params: tuple[str, ...] = major_params
+
+
+class BaseRatelimitBackend:
+    """The base class for all ratelimit backends. Ratelimit backends decide when :class:`HTTPClient` is
+    allowed to send a request, and learn about the ratelimits from the responses.
+
+    For every try of a request, :class:`HTTPClient` calls :meth:`.acquire`, sends the request, calls
+    :meth:`.update` with the response (and :meth:`.lock` if it was ratelimited), and finally calls
+    :meth:`.release`.
+    """
+
+    __slots__ = ()
+
+    async def acquire(self, route_key: str, major_params: tuple[str, ...]) -> RatelimitPermit:
+        """Waits until a request to a route can be sent, both for the bucket of the route and the global limit.
+
+        Args:
+            route_key (str): The key of the route (see :attr:`RouteTemplate.key`).
+            major_params (tuple[str, ...]): The major parameters of the route (see :attr:`Route.major_params`).
+
+        Returns:
+            The permit to send the request with.
+        """
+        raise NotImplementedError
+
+    async def update(
+        self, permit: RatelimitPermit, status: int, headers: Mapping[str, str]
+    ) -> None:
+        """Updates the ratelimits with the response to a request.
+
+        Args:
+            permit (RatelimitPermit): The permit the request was sent with.
+            status (int): The status code of the response.
+            headers (Mapping[str, str]): The ratelimit headers of the response (see :data:`RATELIMIT_HEADERS`).
+        """
+        raise NotImplementedError
+
+    async def lock(self, permit: RatelimitPermit, retry_after: float, *, is_global: bool) -> None:
+        """Holds back requests after a request was ratelimited.
+
+        Args:
+            permit (RatelimitPermit): The permit the request was sent with.
+            retry_after (float): How long (in seconds) to hold back requests for.
+            is_global (bool): Whether every request has to be held back, instead of the bucket of the request.
+        """
+        raise NotImplementedError
+
+    async def release(self, permit: RatelimitPermit) -> None:
+        """Gives a permit back once its request is done.
+
+        Args:
+            permit (RatelimitPermit): The permit to give back.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Cleans up the resources of this backend."""
+        pass
+
+
+class _LocalPermit(RatelimitPermit):
+    __slots__ = ("bucket", "buckets")
+
+    def __init__(self, route_key: str, major_params: tuple[str, ...], bucket: Bucket) -> None:
+        super().__init__(route_key, major_params)
+        # the bucket the permit was taken from, and the buckets that learned from the response
+        self.bucket: Bucket = bucket
+        self.buckets: list[Bucket] = [bucket]
+
+
+class LocalRatelimitBackend(BaseRatelimitBackend):
+    """A ratelimit backend that keeps the ratelimits in this process. This is the default backend.
+
+    Args:
+        ratelimiter (t.Optional[Ratelimiter]): The ratelimiter to keep the buckets in.
+            If this is not provided, then a new one is created. Defaults to None.
+
+    Attributes:
+        ratelimiter (Ratelimiter): The ratelimiter the buckets are kept in.
+    """
+
+    __slots__ = ("ratelimiter",)
+
+    def __init__(self, ratelimiter: t.Optional[Ratelimiter] = None) -> None:
+        self.ratelimiter: Ratelimiter = ratelimiter or Ratelimiter()
+
+    async def acquire(self, route_key: str, major_params: tuple[str, ...]) -> RatelimitPermit:
+        global_bucket = self.ratelimiter.global_bucket
+
+        bucket = await self.ratelimiter.acquire(route_key, major_params)
+        window = bucket.window
+        # the global permit is taken last, so it is never held by a request that is still waiting
+        try:
+            await global_bucket.acquire()
+        except BaseException:
+            bucket.release(used=False)
+            raise
+
+        if bucket.window != window:
+            # the bucket reset while waiting for the global permit, so the bucket permit belongs to a window
+            # that is over and a permit of the new window is needed
+            bucket.release()
+            try:
+                bucket = await self.ratelimiter.acquire(route_key, major_params)
+            except BaseException:
+                global_bucket.release()
+                raise
+
+        return _LocalPermit(route_key, major_params, bucket)
+
+    async def update(
+        self, permit: RatelimitPermit, status: int, headers: Mapping[str, str]
+    ) -> None:
+        permit = t.cast(_LocalPermit, permit)
+
+        bucket_hash = headers.get("X-RateLimit-Bucket")
+        if bucket_hash is not None:
+            hashed_bucket = self.ratelimiter.learn_hash(
+                permit.route_key, permit.major_params, bucket_hash
+            )
+            if hashed_bucket is not permit.bucket:
+                permit.buckets.append(hashed_bucket)
+
+        for bucket in permit.buckets:
+            bucket.update_headers(status, headers)
+
+    async def lock(self, permit: RatelimitPermit, retry_after: float, *, is_global: bool) -> None:
+        if is_global:
+            self.ratelimiter.global_bucket.lock_for(retry_after)
+            return
+
+        # the retry waits for the next window of the bucket
+        for bucket in t.cast(_LocalPermit, permit).buckets:
+            bucket.lock_for(retry_after)
+
+    async def release(self, permit: RatelimitPermit) -> None:
+        t.cast(_LocalPermit, permit).bucket.release()
+        self.ratelimiter.global_bucket.release()
@@ -0,0 +1,333 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import pathlib
+import typing as t
+from collections.abc import Mapping
+
+from ..utils.frames import read_frame, write_frame
+from .backend import BaseRatelimitBackend, LocalRatelimitBackend, RatelimitPermit
+
+__all__ = (
+    "RatelimitBroker",
+    "BrokerRatelimitBackend",
+)
+
+_log = logging.getLogger(__name__)
+
+# frame types, see discatcore.utils.frames
+_ACQUIRE = 0
+_GRANT = 1
+_CANCEL = 2
+_UPDATE = 3
+_LOCK = 4
+_RELEASE = 5
+
+
+class _BrokerConnection:
+    __slots__ = ("writer", "permits", "acquires")
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer: asyncio.StreamWriter = writer
+        # permits and pending acquires by the id the process gave them
+        self.permits: dict[int, RatelimitPermit] = {}
+        self.acquires: dict[int, asyncio.Task[None]] = {}
+
+
+class RatelimitBroker:
+    """A server that keeps the ratelimits for every process that uses the same bot token on one machine.
+
+    One process (or a separate supervisor process) runs the broker, and every process points its
+    :class:`HTTPClient` at it with ``HTTPClient(token, ratelimit_backend=BrokerRatelimitBackend(path))``.
+    The permits of a process are given back automatically if it disconnects. Only processes of the user
+    that runs the broker can connect to it.
+
+    Args:
+        path (t.Union[str, os.PathLike[str]]): The path of the unix socket to listen on.
+        backend (t.Optional[LocalRatelimitBackend]): The backend to keep the ratelimits in.
+            If this is not provided, then a new one is created. Defaults to None.
+
+    Attributes:
+        path (pathlib.Path): The path of the unix socket to listen on.
+        backend (LocalRatelimitBackend): The backend the ratelimits are kept in.
+    """
+
+    __slots__ = ("path", "backend", "_server", "_connections")
+
+    def __init__(
+        self,
+        path: t.Union[str, "os.PathLike[str]"],
+        *,
+        backend: t.Optional[LocalRatelimitBackend] = None,
+    ) -> None:
+        self.path: pathlib.Path = pathlib.Path(path)
+        self.backend: LocalRatelimitBackend = backend or LocalRatelimitBackend()
+        self._server: t.Optional[asyncio.AbstractServer] = None
+        self._connections: set[_BrokerConnection] = set()
+
+    @property
+    def connections(self) -> int:
+        """The amount of processes that are connected."""
+        return len(self._connections)
+
+    async def start(self) -> None:
+        """Starts listening for processes.
+
+        Raises:
+            RuntimeError: Another broker is already listening on the path.
+        """
+        if self.path.is_socket():
+            try:
+                _, writer = await asyncio.open_unix_connection(self.path)
+            except ConnectionRefusedError:
+                # a socket file left behind by a broker that crashed would make binding fail
+                self.path.unlink()
+            else:
+                writer.close()
+                raise RuntimeError(f"Another ratelimit broker is already listening on {self.path}!")
+
+        # only processes of the same user can share the ratelimits, so the socket is never created with
+        # looser permissions
+        old_umask = os.umask(0o177)
+        try:
+            self._server = await asyncio.start_unix_server(self._handle, self.path)
+        finally:
+            os.umask(old_umask)
+        _log.info("Ratelimit broker listening on %s.", self.path)
+
+    async def close(self) -> None:
+        """Disconnects every process and stops listening."""
+        if self._server is None:
+            return
+
+        self._server.close()
+        for connection in list(self._connections):
+            connection.writer.close()
+        await self._server.wait_closed()
+        self._server = None
+
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    async def __aenter__(self) -> RatelimitBroker:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        await self.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = _BrokerConnection(writer)
+        self._connections.add(connection)
+
+        try:
+            while True:
+                frame_type, payload = await read_frame(reader)
+                await self._handle_frame(connection, frame_type, payload)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            # the process has gone away
+            pass
+        finally:
+            self._connections.discard(connection)
+            for task in connection.acquires.values():
+                task.cancel()
+            for permit in connection.permits.values():
+                await self.backend.release(permit)
+            connection.permits.clear()
+            writer.close()
+
+    async def _handle_frame(
+        self, connection: _BrokerConnection, frame_type: int, payload: t.Any
+    ) -> None:
+        if frame_type == _ACQUIRE:
+            id_, route_key, major_params = payload
+            connection.acquires[id_] = asyncio.create_task(
+                self._acquire(connection, id_, route_key, tuple(major_params))
+            )
+            return
+
+        if frame_type == _CANCEL:
+            task = connection.acquires.pop(payload, None)
+            if task is not None:
+                task.cancel()
+            return
+
+        if frame_type == _UPDATE:
+            id_, status, headers = payload
+            permit = connection.permits.get(id_)
+            if permit is not None:
+                await self.backend.update(permit, status, headers)
+        elif frame_type == _LOCK:
+            id_, retry_after, is_global = payload
+            permit = connection.permits.get(id_)
+            if permit is not None:
+                await self.backend.lock(permit, retry_after, is_global=is_global)
+        elif frame_type == _RELEASE:
+            permit = connection.permits.pop(payload, None)
+            if permit is not None:
+                await self.backend.release(permit)
+
+    async def _acquire(
+        self,
+        connection: _BrokerConnection,
+        id_: int,
+        route_key: str,
+        major_params: tuple[str, ...],
+    ) -> None:
+        try:
+            permit = await self.backend.acquire(route_key, major_params)
+        finally:
+            connection.acquires.pop(id_, None)
+
+        if connection.writer.is_closing():
+            await self.backend.release(permit)
+            return
+
+        connection.permits[id_] = permit
+        write_frame(connection.writer, _GRANT, id_)
+
+
+class _BrokerClientConnection:
+    __slots__ = ("writer", "grants", "read_task")
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer: asyncio.StreamWriter = writer
+        # pending acquires by the id this process gave them
+        self.grants: dict[int, asyncio.Future[None]] = {}
+        self.read_task: t.Optional[asyncio.Task[None]] = None
+
+    def send(self, frame_type: int, payload: t.Any) -> None:
+        # permits of a lost connection are given back by the broker, so there is nothing left to tell it
+        if not self.writer.is_closing():
+            write_frame(self.writer, frame_type, payload)
+
+
+class _BrokerPermit(RatelimitPermit):
+    __slots__ = ("id", "connection")
+
+    def __init__(
+        self,
+        route_key: str,
+        major_params: tuple[str, ...],
+        id_: int,
+        connection: _BrokerClientConnection,
+    ) -> None:
+        super().__init__(route_key, major_params)
+        self.id: int = id_
+        self.connection: _BrokerClientConnection = connection
+
+
+class BrokerRatelimitBackend(BaseRatelimitBackend):
+    """A ratelimit backend that asks a :class:`RatelimitBroker` for permits, so the ratelimits are shared
+    with every other process connected to the broker.
+
+    The connection to the broker is made when the first permit is needed, and made again if it is lost.
+    Requests that are waiting for a permit when the connection is lost fail with :class:`ConnectionError`.
+
+    Args:
+        path (t.Union[str, os.PathLike[str]]): The path of the unix socket the broker listens on.
+
+    Attributes:
+        path (pathlib.Path): The path of the unix socket the broker listens on.
+    """
+
+    __slots__ = ("path", "_connection", "_connect_lock", "_counter")
+
+    def __init__(self, path: t.Union[str, "os.PathLike[str]"]) -> None:
+        self.path: pathlib.Path = pathlib.Path(path)
+        self._connection: t.Optional[_BrokerClientConnection] = None
+        self._connect_lock: asyncio.Lock = asyncio.Lock()
+        self._counter: int = 0
+
+    @property
+    def connected(self) -> bool:
+        """Whether this backend is connected to the broker."""
+        return self._connection is not None and not self._connection.writer.is_closing()
+
+    async def _connect(self) -> _BrokerClientConnection:
+        async with self._connect_lock:
+            connection = self._connection
+            if connection is None or connection.writer.is_closing():
+                reader, writer = await asyncio.open_unix_connection(self.path)
+                connection = self._connection = _BrokerClientConnection(writer)
+                connection.read_task = asyncio.create_task(self._read_broker(connection, reader))
+                _log.debug("Connected to the ratelimit broker at %s.", self.path)
+
+            return connection
+
+    async def _read_broker(
+        self, connection: _BrokerClientConnection, reader: asyncio.StreamReader
+    ) -> None:
+        try:
+            while True:
+                frame_type, payload = await read_frame(reader)
+                if frame_type != _GRANT:
+                    continue
+
+                grant = connection.grants.pop(payload, None)
+                if grant is None or grant.done():
+                    # the acquire was cancelled before the permit arrived
+                    connection.send(_RELEASE, payload)
+                else:
+                    grant.set_result(None)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            _log.warning("Lost the connection to the ratelimit broker at %s.", self.path)
+        finally:
+            connection.writer.close()
+            # a new connection can already have been made if this one was closed from elsewhere
+            if self._connection is connection:
+                self._connection = None
+
+            for grant in connection.grants.values():
+                if not grant.done():
+                    grant.set_exception(
+                        ConnectionError("Lost the connection to the ratelimit broker.")
+                    )
+            connection.grants.clear()
+
+    async def acquire(self, route_key: str, major_params: tuple[str, ...]) -> RatelimitPermit:
+        connection = await self._connect()
+
+        self._counter += 1
+        id_ = self._counter
+        grant: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        connection.grants[id_] = grant
+        write_frame(connection.writer, _ACQUIRE, [id_, route_key, list(major_params)])
+
+        try:
+            await grant
+        except asyncio.CancelledError:
+            if connection.grants.pop(id_, None) is not None:
+                connection.send(_CANCEL, id_)
+            else:
+                # the permit arrived right before the acquire was cancelled
+                connection.send(_RELEASE, id_)
+            raise
+
+        return _BrokerPermit(route_key, major_params, id_, connection)
+
+    async def update(
+        self, permit: RatelimitPermit, status: int, headers: Mapping[str, str]
+    ) -> None:
+        broker_permit = t.cast(_BrokerPermit, permit)
+        broker_permit.connection.send(_UPDATE, [broker_permit.id, status, dict(headers)])
+
+    async def lock(self, permit: RatelimitPermit, retry_after: float, *, is_global: bool) -> None:
+        broker_permit = t.cast(_BrokerPermit, permit)
+        broker_permit.connection.send(_LOCK, [broker_permit.id, retry_after, is_global])
+
+    async def release(self, permit: RatelimitPermit) -> None:
+        broker_permit = t.cast(_BrokerPermit, permit)
+        broker_permit.connection.send(_RELEASE, broker_permit.id)
+
+    async def close(self) -> None:
+        connection = self._connection
+        if connection is not None and connection.read_task is not None:
+            connection.read_task.cancel()
+            await asyncio.gather(connection.read_task, return_exceptions=True)
@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: MIT
+
+import logging
+import os
+import pathlib
+import typing as t
+from collections.abc import Mapping
+
+from ..utils.files import write_atomic
+from ..utils.json import dumps_bytes, loads
+
+__all__ = (
+    "BaseBucketHashStore",
+    "FileBucketHashStore",
+)
+
+_log = logging.getLogger(__name__)
+
+
+class BaseBucketHashStore:
+    """The base class for all bucket hash stores. Bucket hash stores keep the bucket hashes Discord sends
+    for every route around between restarts, so routes that share a ratelimit are known before the first
+    request is sent.
+
+    Hashes are stored per route key (see :attr:`RouteTemplate.key`).
+    """
+
+    __slots__ = ()
+
+    def load(self) -> dict[str, str]:
+        """Loads the stored bucket hashes.
+
+        Returns:
+            A mapping of route keys to bucket hashes, which is empty if nothing is stored.
+        """
+        raise NotImplementedError
+
+    def save(self, hashes: Mapping[str, str]) -> None:
+        """Stores the bucket hashes.
+
+        Args:
+            hashes (Mapping[str, str]): A mapping of route keys to bucket hashes.
+        """
+        raise NotImplementedError
+
+
+class FileBucketHashStore(BaseBucketHashStore):
+    """A bucket hash store that keeps every bucket hash in a JSON file.
+
+    Args:
+        path (t.Union[str, os.PathLike[str]]): The file to store the bucket hashes in. Its directory will be
+            created if it does not exist. Defaults to ".bucket_hashes.json".
+
+    Attributes:
+        path (pathlib.Path): The file the bucket hashes are stored in.
+    """
+
+    __slots__ = ("path",)
+
+    def __init__(self, path: t.Union[str, "os.PathLike[str]"] = ".bucket_hashes.json") -> None:
+        self.path: pathlib.Path = pathlib.Path(path)
+
+    def load(self) -> dict[str, str]:
+        try:
+            hashes = loads(self.path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            _log.warning("Ignoring malformed bucket hash file %s.", self.path)
+            return {}
+
+        if not isinstance(hashes, dict):
+            _log.warning("Ignoring malformed bucket hash file %s.", self.path)
+            return {}
+
+        # JSON object keys are always strings, but the values can be anything
+        return {
+            key: value
+            for key, value in t.cast(dict[str, t.Any], hashes).items()
+            if isinstance(value, str)
+        }
+
+    def save(self, hashes: Mapping[str, str]) -> None:
+        write_atomic(self.path, dumps_bytes(dict(hashes)))
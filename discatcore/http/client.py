@@ -15,7 +15,9 @@ from .. import __version__
 from ..errors import HTTPException, UnsupportedAPIVersionWarning
 from ..file import BasicFile
 from ..types import Unset, UnsetOr
-from ..utils.json import dumps, loads
+from ..utils.json import dumps, dumps_bytes, loads
+from .backend import RATELIMIT_HEADERS, BaseRatelimitBackend, LocalRatelimitBackend
+from .bucket_store import BaseBucketHashStore
 from .endpoints import (
     ApplicationCommandEndpoints,
     AuditLogEndpoints,
@@ -47,7 +49,7 @@ _log = logging.getLogger(__name__)
 
 @dataclass
 class _PreparedData:
-    json: UnsetOr[t.Any] = Unset
+    json: UnsetOr[bytes] = Unset
     multipart_content: UnsetOr[aiohttp.FormData] = Unset
 
 
@@ -81,6 +83,18 @@ class HTTPClient(
         api_version (t.Optional[int]): The Discord API version to use.
             It's not recommended to set this argument because this library will only
             be able to handle one API version at a time. Defaults to None.
+        api_url (t.Optional[str]): The base url of the REST API, including the API version.
+            This is meant for testing against a local server (like :class:`discatcore.testing.FakeREST`).
+            If this is not provided, then the Discord API url will be used. Defaults to None.
+        bucket_hash_store (t.Optional[BaseBucketHashStore]): The store to keep the bucket hashes of routes in,
+            so routes that share a ratelimit are known right after a restart. This is only used if
+            ``ratelimit_backend`` is not provided. Defaults to None.
+        global_limit (int): The amount of requests that can be sent every second. Raise this if Discord raised
+            the global ratelimit of the bot. This is only used if ``ratelimit_backend`` is not provided.
+            Defaults to 50.
+        ratelimit_backend (t.Optional[BaseRatelimitBackend]): The backend that keeps the ratelimits, for example
+            a :class:`BrokerRatelimitBackend` to share the ratelimits with other processes. If this is not
+            provided, then the ratelimits are kept in this process. Defaults to None.
 
     Attributes:
         token (str): The bot token to use when sending a request to the Discord API.
@@ -92,7 +106,7 @@ class HTTPClient(
 
     __slots__ = (
         "token",
-        "_ratelimiter",
+        "_ratelimit_backend",
         "_api_version",
         "_api_url",
         "__session",
@@ -101,9 +115,20 @@ class HTTPClient(
         "_request_id",
     )
 
-    def __init__(self, token: str, *, api_version: t.Optional[int] = None) -> None:
+    def __init__(
+        self,
+        token: str,
+        *,
+        api_version: t.Optional[int] = None,
+        api_url: t.Optional[str] = None,
+        bucket_hash_store: t.Optional[BaseBucketHashStore] = None,
+        global_limit: int = 50,
+        ratelimit_backend: t.Optional[BaseRatelimitBackend] = None,
+    ) -> None:
         self.token: str = token
-        self._ratelimiter: Ratelimiter = Ratelimiter()
+        self._ratelimit_backend: BaseRatelimitBackend = ratelimit_backend or LocalRatelimitBackend(
+            Ratelimiter(global_limit=global_limit, hash_store=bucket_hash_store)
+        )
         self._api_version: int = DEFAULT_API_VERSION
 
         if api_version is not None and api_version not in VALID_API_VERSIONS:
@@ -114,7 +139,9 @@ class HTTPClient(
         elif api_version is not None:
             self._api_version = api_version
 
-        self._api_url: str = BASE_API_URL.format(self._api_version)
+        self._api_url: str = (
+            api_url.rstrip("/") if api_url is not None else BASE_API_URL.format(self._api_version)
+        )
 
         self.__session: t.Optional[aiohttp.ClientSession] = None
         self.user_agent: str = "DiscordBot (https://github.com/discatpy-dev/core, {0}) Python/{1.major}.{1.minor}.{1.micro}".format(
@@ -137,6 +164,13 @@ class HTTPClient(
         """The Discord API version to use."""
         return self._api_version
 
+    @property
+    def ratelimit_backend(self) -> BaseRatelimitBackend:
+        """The backend that keeps the ratelimits of this client. For the default :class:`LocalRatelimitBackend`,
+        use ``ratelimit_backend.ratelimiter.stats()`` to see how many buckets are tracked.
+        """
+        return self._ratelimit_backend
+
     async def ws_connect(self, url: str) -> aiohttp.ClientWebSocketResponse:
         """Starts a websocket connection.
 
@@ -160,6 +194,7 @@ class HTTPClient(
         """
         if self.__session and not self.__session.closed:
             await self._session.close()
+        await self._ratelimit_backend.close()
 
     @staticmethod
     def _prepare_data(
@@ -168,16 +203,17 @@ class HTTPClient(
         pd = _PreparedData()
 
         if json is not Unset and files is Unset:
-            pd.json = _filter_dict_for_unset(json) if isinstance(json, dict) else json
+            pd.json = dumps_bytes(_filter_dict_for_unset(json) if isinstance(json, dict) else json)
 
         if json is not Unset and files is not Unset:
             if t.TYPE_CHECKING:
                 files = t.cast(list[BasicFile], files)
 
             form_dat = aiohttp.FormData()
+            # a str, because aiohttp turns bytes fields into file attachments
             form_dat.add_field(
                 "payload_json",
-                _filter_dict_for_unset(json) if isinstance(json, dict) else json,
+                dumps(_filter_dict_for_unset(json) if isinstance(json, dict) else json),
                 content_type="application/json",
             )
 
@@ -192,12 +228,13 @@ class HTTPClient(
 
     @staticmethod
     async def _text_or_json(resp: aiohttp.ClientResponse) -> t.Union[t.Any, str]:
-        text = await resp.text()
+        body = await resp.read()
 
         if resp.content_type == "application/json":
-            return loads(text)
+            # parse the raw body, it doesn't need to be decoded into a str first
+            return loads(body)
 
-        return text
+        return body.decode(resp.get_encoding())
 
     async def request(
         self,
@@ -239,8 +276,8 @@ class HTTPClient(
 
         query_params = _filter_dict_for_unset(query_params or {})
         max_tries = 5
-        headers: dict[str, str] = self.default_headers
-        bucket_hash: t.Optional[str] = None
+        # copied so per-request headers don't leak into the default headers
+        headers: dict[str, str] = {**self.default_headers}
 
         if reason:
             headers["X-Audit-Log-Reason"] = _urlquote(reason, safe="/ ")
@@ -249,93 +286,90 @@ class HTTPClient(
         kwargs: dict[str, t.Any] = extras or {}
 
         if data.json is not Unset:
-            kwargs["json"] = data.json
+            kwargs["data"] = data.json
+            headers["Content-Type"] = "application/json"
 
         if data.multipart_content is not Unset:
             kwargs["data"] = data.multipart_content
 
         for try_ in range(max_tries):
-            bucket = self._ratelimiter.get_bucket((route.bucket, bucket_hash))
-
-            async with self._ratelimiter.global_bucket:
-                _log.debug("REQUEST:%d The global ratelimit bucket has been acquired!", rid)
-                async with bucket:
-                    _log.debug("REQUEST:%d The route ratelimit bucket has been acquired!", rid)
-
-                    response = await self._session.request(
-                        route.method,
-                        f"{self._api_url}{url}",
-                        params=query_params,
-                        headers=headers,
-                        **kwargs,
-                    )
-                    _log.debug(
-                        "REQUEST:%d Made request to %s with method %s and got status code %d.",
-                        rid,
-                        f"{self._api_url}{url}",
-                        route.method,
-                        response.status,
-                    )
-
-                    bucket_hash = response.headers.get("X-RateLimit-Bucket")
-                    if bucket_hash is not None and bucket_hash != bucket.bucket:
-                        _log.debug(
-                            "REQUEST:%d Migrating from bucket (%s, %s) to bucket (%s, %s).",
+            permit = await self._ratelimit_backend.acquire(route.template.key, route.major_params)
+            _log.debug("REQUEST:%d The ratelimit permit has been acquired!", rid)
+
+            retry_delay = 0.0
+            try:
+                response = await self._session.request(
+                    route.method,
+                    f"{self._api_url}{url}",
+                    params=query_params,
+                    headers=headers,
+                    **kwargs,
+                )
+                _log.debug(
+                    "REQUEST:%d Made request to %s with method %s and got status code %d.",
+                    rid,
+                    f"{self._api_url}{url}",
+                    route.method,
+                    response.status,
+                )
+
+                await self._ratelimit_backend.update(
+                    permit,
+                    response.status,
+                    {
+                        name: response.headers[name]
+                        for name in RATELIMIT_HEADERS
+                        if name in response.headers
+                    },
+                )
+
+                # Everything is ok
+                if 200 <= response.status < 300:
+                    return await self._text_or_json(response)
+
+                # Ratelimited
+                if response.status == 429:
+                    if "Via" not in response.headers:
+                        # something about Cloudflare and Google responding and adding something to the headers
+                        # it means we're Cloudflare banned
+                        raise HTTPException(response, await self._text_or_json(response))
+
+                    retry_after = float(response.headers["Retry-After"])
+                    is_global = response.headers["X-RateLimit-Scope"] == "global"
+
+                    if is_global:
+                        _log.info(
+                            "REQUEST:%d All requests have hit a global ratelimit! Retrying in %f.",
+                            rid,
+                            retry_after,
+                        )
+                    else:
+                        _log.info(
+                            "REQUEST:%d All requests with bucket (%s, %s) have hit a ratelimit! Retrying in %f.",
                             rid,
                             route.bucket,
-                            bucket.bucket,
-                            route.bucket,
-                            bucket_hash,
+                            response.headers.get("X-RateLimit-Bucket"),
+                            retry_after,
                         )
-                        bucket = self._ratelimiter.get_bucket((route.bucket, bucket_hash))
-
-                    # Everything is ok
-                    if 200 <= response.status < 300:
-                        bucket.update_info(response)
-                        return await self._text_or_json(response)
-
-                    # Ratelimited
-                    if response.status == 429:
-                        if "Via" not in response.headers:
-                            # something about Cloudflare and Google responding and adding something to the headers
-                            # it means we're Cloudflare banned
-                            raise HTTPException(response, await self._text_or_json(response))
-
-                        retry_after = float(response.headers["Retry-After"])
-                        is_global = response.headers["X-RateLimit-Scope"] == "global"
-
-                        if is_global:
-                            _log.info(
-                                "REQUEST:%d All requests have hit a global ratelimit! Retrying in %f.",
-                                rid,
-                                retry_after,
-                            )
-                            self._ratelimiter.global_bucket.lock_for(retry_after)
-                            await self._ratelimiter.global_bucket.acquire()
-                        else:
-                            _log.info(
-                                "REQUEST:%d All requests with bucket (%s, %s) have hit a ratelimit! Retrying in %f.",
-                                rid,
-                                route.bucket,
-                                bucket.bucket,
-                                retry_after,
-                            )
-                            bucket.lock_for(retry_after)
-                            await bucket.acquire()
-
-                        _log.info("REQUEST:%d Ratelimit is over. Continuing with the request.", rid)
-                        continue
-
-                    # Specific Server Errors, retry after some time
-                    if response.status in {500, 502, 504}:
-                        wait_time = 1 + try_ * 2
-                        _log.info("REQUEST:%d Got a server error! Retrying in %d.", rid, wait_time)
-                        await asyncio.sleep(wait_time)
-                        continue
-
-                    # Client/Server errors
-                    if response.status >= 400:
-                        raise HTTPException(response, await self._text_or_json(response))
+
+                    # the retry waits until the ratelimit is over
+                    await self._ratelimit_backend.lock(permit, retry_after, is_global=is_global)
+                    continue
+
+                # Specific Server Errors, retry after some time
+                if response.status in {500, 502, 504}:
+                    retry_delay = 1 + try_ * 2
+                    _log.info("REQUEST:%d Got a server error! Retrying in %d.", rid, retry_delay)
+
+                # Client/Server errors
+                elif response.status >= 400:
+                    raise HTTPException(response, await self._text_or_json(response))
+            finally:
+                await self._ratelimit_backend.release(permit)
+
+            # the permit is given back first, so the backoff does not hold up other requests to the bucket
+            if retry_delay:
+                await asyncio.sleep(retry_delay)
 
         _log.error(
             'REQUEST:%d Tried sending request to "%s" with method %s %d times.',
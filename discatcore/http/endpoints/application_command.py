@@ -7,18 +7,57 @@ import typing as t
 import discord_typings as dt
 
 from ...types import Unset, UnsetOr
-from ..route import Route
+from ..route import Route, RouteTemplate
 from .core import EndpointMixin
 
 __all__ = ("ApplicationCommandEndpoints",)
 
+GET_GLOBAL_APPLICATION_COMMANDS = RouteTemplate("GET", "/applications/{application_id}/commands")
+CREATE_GLOBAL_APPLICATION_COMMAND = RouteTemplate("POST", "/applications/{application_id}/commands")
+GET_GLOBAL_APPLICATION_COMMAND = RouteTemplate(
+    "GET", "/applications/{application_id}/commands/{command_id}"
+)
+EDIT_GLOBAL_APPLICATION_COMMAND = RouteTemplate(
+    "PATCH", "/applications/{application_id}/commands/{command_id}"
+)
+DELETE_GLOBAL_APPLICATION_COMMAND = RouteTemplate(
+    "DELETE", "/applications/{application_id}/commands/{command_id}"
+)
+BULK_OVERWRITE_GLOBAL_APPLICATION_COMMANDS = RouteTemplate(
+    "PUT", "/applications/{application_id}/commands"
+)
+GET_GUILD_APPLICATION_COMMANDS = RouteTemplate(
+    "GET", "/applications/{application_id}/guilds/{guild_id}/commands"
+)
+CREATE_GUILD_APPLICATION_COMMAND = RouteTemplate(
+    "POST", "/applications/{application_id}/guilds/{guild_id}/commands"
+)
+GET_GUILD_APPLICATION_COMMAND = RouteTemplate(
+    "GET", "/applications/{application_id}/guilds/{guild_id}/commands/{command_id}"
+)
+EDIT_GUILD_APPLICATION_COMMAND = RouteTemplate(
+    "PATCH", "/applications/{application_id}/guilds/{guild_id}/commands/{command_id}"
+)
+DELETE_GUILD_APPLICATION_COMMAND = RouteTemplate(
+    "DELETE", "/applications/{application_id}/guilds/{guild_id}/commands/{command_id}"
+)
+BULK_OVERWRITE_GUILD_APPLICATION_COMMANDS = RouteTemplate(
+    "PUT", "/applications/{application_id}/guilds/{guild_id}/commands"
+)
+GET_GUILD_APPLICATION_COMMAND_PERMISSIONS = RouteTemplate(
+    "GET", "/applications/{application_id}/guilds/{guild_id}/commands/permissions"
+)
+GET_APPLICATION_COMMAND_PERMISSIONS = RouteTemplate(
+    "GET", "/applications/{application_id}/guilds/{guild_id}/commands/{command_id}/permissions"
+)
+
 
 class ApplicationCommandEndpoints(EndpointMixin):
     def get_global_application_commands(
         self, application_id: dt.Snowflake, *, with_localizations: UnsetOr[bool] = Unset
     ):
         return self.request(
-            Route("GET", "/applications/{application_id}/commands", application_id=application_id),
+            Route(GET_GLOBAL_APPLICATION_COMMANDS, application_id=application_id),
             query_params={"with_localizations": with_localizations},
         )
 
@@ -36,7 +75,7 @@ class ApplicationCommandEndpoints(EndpointMixin):
         type: dt.ApplicationCommandTypes = 1,
     ):
         return self.request(
-            Route("POST", "/applications/{application_id}/commands", application_id=application_id),
+            Route(CREATE_GLOBAL_APPLICATION_COMMAND, application_id=application_id),
             json_params={
                 "name": name,
                 "name_localizations": name_localizations,
@@ -54,10 +93,7 @@ class ApplicationCommandEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "GET",
-                "/applications/{application_id}/commands/{command_id}",
-                application_id=application_id,
-                command_id=command_id,
+                GET_GLOBAL_APPLICATION_COMMAND, application_id=application_id, command_id=command_id
             )
         )
 
@@ -76,8 +112,7 @@ class ApplicationCommandEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "PATCH",
-                "/applications/{application_id}/commands/{command_id}",
+                EDIT_GLOBAL_APPLICATION_COMMAND,
                 application_id=application_id,
                 command_id=command_id,
             ),
@@ -97,8 +132,7 @@ class ApplicationCommandEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "DELETE",
-                "/applications/{application_id}/commands/{command_id}",
+                DELETE_GLOBAL_APPLICATION_COMMAND,
                 application_id=application_id,
                 command_id=command_id,
             )
@@ -108,7 +142,7 @@ class ApplicationCommandEndpoints(EndpointMixin):
         self, application_id: dt.Snowflake, *, commands: list[dt.ApplicationCommandData]
     ):
         return self.request(
-            Route("PUT", "/applications/{application_id}/commands", application_id=application_id),
+            Route(BULK_OVERWRITE_GLOBAL_APPLICATION_COMMANDS, application_id=application_id),
             json_params=commands,
         )
 
@@ -120,12 +154,7 @@ class ApplicationCommandEndpoints(EndpointMixin):
         with_localizations: UnsetOr[bool] = Unset,
     ):
         return self.request(
-            Route(
-                "GET",
-                "/applications/{application_id}/guilds/{guild_id}/commands",
-                application_id=application_id,
-                guild_id=guild_id,
-            ),
+            Route(GET_GUILD_APPLICATION_COMMANDS, application_id=application_id, guild_id=guild_id),
             query_params={"with_localizations": with_localizations},
         )
 
@@ -145,10 +174,7 @@ class ApplicationCommandEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "POST",
-                "/applications/{application_id}/guilds/{guild_id}/commands",
-                application_id=application_id,
-                guild_id=guild_id,
+                CREATE_GUILD_APPLICATION_COMMAND, application_id=application_id, guild_id=guild_id
             ),
             json_params={
                 "name": name,
@@ -167,8 +193,7 @@ class ApplicationCommandEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "GET",
-                "/applications/{application_id}/guilds/{guild_id}/commands/{command_id}",
+                GET_GUILD_APPLICATION_COMMAND,
                 application_id=application_id,
                 guild_id=guild_id,
                 command_id=command_id,
@@ -191,8 +216,7 @@ class ApplicationCommandEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "PATCH",
-                "/applications/{application_id}/guilds/{guild_id}/commands/{command_id}",
+                EDIT_GUILD_APPLICATION_COMMAND,
                 application_id=application_id,
                 guild_id=guild_id,
                 command_id=command_id,
@@ -213,8 +237,7 @@ class ApplicationCommandEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "DELETE",
-                "/applications/{application_id}/guilds/{guild_id}/commands/{command_id}",
+                DELETE_GUILD_APPLICATION_COMMAND,
                 application_id=application_id,
                 guild_id=guild_id,
                 command_id=command_id,
@@ -230,8 +253,7 @@ class ApplicationCommandEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "PUT",
-                "/applications/{application_id}/guilds/{guild_id}/commands",
+                BULK_OVERWRITE_GUILD_APPLICATION_COMMANDS,
                 application_id=application_id,
                 guild_id=guild_id,
             ),
@@ -243,8 +265,7 @@ class ApplicationCommandEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "GET",
-                "/applications/{application_id}/guilds/{guild_id}/commands/permissions",
+                GET_GUILD_APPLICATION_COMMAND_PERMISSIONS,
                 application_id=application_id,
                 guild_id=guild_id,
             )
@@ -255,8 +276,7 @@ class ApplicationCommandEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "GET",
-                "/applications/{application_id}/guilds/{guild_id}/commands/{command_id}/permissions",
+                GET_APPLICATION_COMMAND_PERMISSIONS,
                 application_id=application_id,
                 guild_id=guild_id,
                 command_id=command_id,
@@ -5,11 +5,13 @@
 import discord_typings as dt
 
 from ...types import Unset, UnsetOr
-from ..route import Route
+from ..route import Route, RouteTemplate
 from .core import EndpointMixin
 
 __all__ = ("AuditLogEndpoints",)
 
+GET_GUILD_AUDIT_LOG = RouteTemplate("GET", "/guilds/{guild_id}/audit-logs")
+
 
 class AuditLogEndpoints(EndpointMixin):
     def get_guild_audit_log(
@@ -22,7 +24,7 @@ class AuditLogEndpoints(EndpointMixin):
         limit: UnsetOr[int] = Unset,
     ):
         return self.request(
-            Route("GET", "/guilds/{guild_id}/audit-logs", guild_id=guild_id),
+            Route(GET_GUILD_AUDIT_LOG, guild_id=guild_id),
             query_params={
                 "user_id": user_id,
                 "action_type": action_type,
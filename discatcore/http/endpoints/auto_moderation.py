@@ -7,25 +7,34 @@ import typing as t
 import discord_typings as dt
 
 from ...types import Unset, UnsetOr
-from ..route import Route
+from ..route import Route, RouteTemplate
 from .core import EndpointMixin
 
 __all__ = ("AutoModerationEndpoints",)
 
+LIST_AUTO_MODERATION_RULES = RouteTemplate("GET", "/guilds/{guild_id}/auto-moderation/rules")
+GET_AUTO_MODERATION_RULE = RouteTemplate(
+    "GET", "/guilds/{guild_id}/auto-moderation/rules/{auto_moderation_rule_id}"
+)
+CREATE_AUTO_MODERATION_RULE = RouteTemplate("POST", "/guilds/{guild_id}/auto-moderation/rules")
+MODIFY_AUTO_MODERATION_RULE = RouteTemplate(
+    "PATCH", "/guilds/{guild_id}/auto-moderation/rules/{auto_moderation_rule_id}"
+)
+DELETE_AUTO_MODERATION_RULE = RouteTemplate(
+    "DELETE", "/guilds/{guild_id}/auto-moderation/rules/{auto_moderation_rule_id}"
+)
+
 
 class AutoModerationEndpoints(EndpointMixin):
     def list_auto_moderation_rules(self, guild_id: dt.Snowflake):
-        return self.request(
-            Route("GET", "/guilds/{guild_id}/auto-moderation/rules", guild_id=guild_id)
-        )
+        return self.request(Route(LIST_AUTO_MODERATION_RULES, guild_id=guild_id))
 
     def get_auto_moderation_rule(
         self, guild_id: dt.Snowflake, auto_moderation_rule_id: dt.Snowflake
     ):
         return self.request(
             Route(
-                "GET",
-                "/guilds/{guild_id}/auto-moderation/rules/{auto_moderation_rule_id}",
+                GET_AUTO_MODERATION_RULE,
                 guild_id=guild_id,
                 auto_moderation_rule_id=auto_moderation_rule_id,
             )
@@ -46,7 +55,7 @@ class AutoModerationEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("POST", "/guilds/{guild_id}/auto-moderation/rules", guild_id=guild_id),
+            Route(CREATE_AUTO_MODERATION_RULE, guild_id=guild_id),
             json_params={
                 "name": name,
                 "event_type": event_type,
@@ -76,8 +85,7 @@ class AutoModerationEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "PATCH",
-                "/guilds/{guild_id}/auto-moderation/rules/{auto_moderation_rule_id}",
+                MODIFY_AUTO_MODERATION_RULE,
                 guild_id=guild_id,
                 auto_moderation_rule_id=auto_moderation_rule_id,
             ),
@@ -101,8 +109,7 @@ class AutoModerationEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "DELETE",
-                "/guilds/{guild_id}/auto-moderation/rules/{auto_moderation_rule_id}",
+                DELETE_AUTO_MODERATION_RULE,
                 guild_id=guild_id,
                 auto_moderation_rule_id=auto_moderation_rule_id,
             ),
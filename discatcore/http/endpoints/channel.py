@@ -8,15 +8,76 @@ import discord_typings as dt
 
 from ...file import BasicFile
 from ...types import Unset, UnsetOr
-from ..route import Route
+from ..route import Route, RouteTemplate
 from .core import EndpointMixin
 
 __all__ = ("ChannelEndpoints",)
 
+GET_CHANNEL = RouteTemplate("GET", "/channels/{channel_id}")
+MODIFY_CHANNEL = RouteTemplate("PATCH", "/channels/{channel_id}")
+MODIFY_THREAD = RouteTemplate("PATCH", "/channels/{channel_id}")
+DELETE_CHANNEL = RouteTemplate("DELETE", "/channels/{channel_id}")
+GET_CHANNEL_MESSAGES = RouteTemplate("GET", "/channels/{channel_id}/messages")
+GET_CHANNEL_MESSAGE = RouteTemplate("GET", "/channels/{channel_id}/messages/{message_id}")
+CREATE_MESSAGE = RouteTemplate("POST", "/channels/{channel_id}/messages")
+CROSSPOST_MESSAGE = RouteTemplate("POST", "/channels/{channel_id}/messages/{message_id}/crosspost")
+CREATE_REACTION = RouteTemplate(
+    "PUT", "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me"
+)
+DELETE_OWN_REACTION = RouteTemplate(
+    "DELETE", "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me"
+)
+DELETE_USER_REACTION = RouteTemplate(
+    "DELETE", "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/{user_id}"
+)
+GET_REACTIONS = RouteTemplate(
+    "GET", "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}"
+)
+DELETE_ALL_REACTIONS = RouteTemplate(
+    "DELETE", "/channels/{channel_id}/messages/{message_id}/reactions"
+)
+DELETE_ALL_REACTIONS_FOR_EMOJI = RouteTemplate(
+    "DELETE", "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}"
+)
+EDIT_MESSAGE = RouteTemplate("PATCH", "/channels/{channel_id}/messages/{message_id}")
+DELETE_MESSAGE = RouteTemplate("DELETE", "/channels/{channel_id}/messages/{message_id}")
+BULK_DELETE_MESSAGES = RouteTemplate("POST", "/channels/{channel_id}/messages/bulk-delete")
+EDIT_CHANNEL_PERMISSIONS = RouteTemplate("PUT", "/channels/{channel_id}/permissions/{overwrite_id}")
+GET_CHANNEL_INVITES = RouteTemplate("GET", "/channels/{channel_id}/invites")
+CREATE_CHANNEL_INVITE = RouteTemplate("POST", "/channels/{channel_id}/invites")
+DELETE_CHANNEL_PERMISSION = RouteTemplate(
+    "DELETE", "/channels/{channel_id}/permissions/{overwrite_id}"
+)
+FOLLOW_ANNOUNCEMENT_CHANNEL = RouteTemplate("POST", "/channels/{channel_id}/followers")
+TRIGGER_TYPING_INDICATOR = RouteTemplate("POST", "/channels/{channel_id}/typing")
+GET_PINNED_MESSAGES = RouteTemplate("GET", "/channels/{channel_id}/pins")
+PIN_MESSAGE = RouteTemplate("PUT", "/channels/{channel_id}/pins/{message_id}")
+UNPIN_MESSAGE = RouteTemplate("DELETE", "/channels/{channel_id}/pins/{message_id}")
+START_THREAD_FROM_MESSAGE = RouteTemplate(
+    "POST", "/channels/{channel_id}/messages/{message_id}/threads"
+)
+START_THREAD_WITHOUT_MESSAGE = RouteTemplate("POST", "/channels/{channel_id}/threads")
+START_THREAD_IN_FORUM_CHANNEL = RouteTemplate("POST", "/channels/{channel_id}/threads")
+JOIN_THREAD = RouteTemplate("PUT", "/channels/{channel_id}/thread-members/@me")
+ADD_THREAD_MEMBER = RouteTemplate("PUT", "/channels/{channel_id}/thread-members/{user_id}")
+LEAVE_THREAD = RouteTemplate("DELETE", "/channels/{channel_id}/thread-members/@me")
+REMOVE_THREAD_MEMBER = RouteTemplate("DELETE", "/channels/{channel_id}/thread-members/{user_id}")
+GET_THREAD_MEMBER = RouteTemplate("GET", "/channels/{channel_id}/thread-members/{user_id}")
+LIST_THREAD_MEMBERS = RouteTemplate("GET", "/channels/{channel_id}/thread-members")
+LIST_PUBLIC_ARCHIVED_THREADS = RouteTemplate(
+    "GET", "/channels/{channel_id}/threads/archived/public"
+)
+LIST_PRIVATE_ARCHIVED_THREADS = RouteTemplate(
+    "GET", "/channels/{channel_id}/threads/archived/private"
+)
+LIST_JOINED_PRIVATE_ARCHIVED_THREADS = RouteTemplate(
+    "GET", "/channels/{channel_id}/users/@me/threads/archived/private"
+)
+
 
 class ChannelEndpoints(EndpointMixin):
     def get_channel(self, channel_id: dt.Snowflake):
-        return self.request(Route("GET", "/channels/{channel_id}", channel_id=channel_id))
+        return self.request(Route(GET_CHANNEL, channel_id=channel_id))
 
     def modify_channel(
         self,
@@ -43,7 +104,7 @@ class ChannelEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("PATCH", "/channels/{channel_id}", channel_id=channel_id),
+            Route(MODIFY_CHANNEL, channel_id=channel_id),
             json_params={
                 "name": name,
                 "type": type,
@@ -82,7 +143,7 @@ class ChannelEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("PATCH", "/channels/{channel_id}", channel_id=channel_id),
+            Route(MODIFY_THREAD, channel_id=channel_id),
             json_params={
                 "name": name,
                 "archived": archived,
@@ -97,9 +158,7 @@ class ChannelEndpoints(EndpointMixin):
         )
 
     def delete_channel(self, channel_id: dt.Snowflake, reason: t.Optional[str] = None):
-        return self.request(
-            Route("DELETE", "/channels/{channel_id}", channel_id=channel_id), reason=reason
-        )
+        return self.request(Route(DELETE_CHANNEL, channel_id=channel_id), reason=reason)
 
     def get_channel_messages(
         self,
@@ -111,18 +170,13 @@ class ChannelEndpoints(EndpointMixin):
         limit: int = 50,
     ):
         return self.request(
-            Route("GET", "/channels/{channel_id}/messages", channel_id=channel_id),
+            Route(GET_CHANNEL_MESSAGES, channel_id=channel_id),
             query_params={"around": around, "before": before, "after": after, "limit": limit},
         )
 
     def get_channel_message(self, channel_id: dt.Snowflake, message_id: dt.Snowflake):
         return self.request(
-            Route(
-                "GET",
-                "/channels/{channel_id}/messages/{message_id}",
-                channel_id=channel_id,
-                message_id=message_id,
-            )
+            Route(GET_CHANNEL_MESSAGE, channel_id=channel_id, message_id=message_id)
         )
 
     def create_message(
@@ -142,7 +196,7 @@ class ChannelEndpoints(EndpointMixin):
         files: UnsetOr[list[BasicFile]] = Unset,
     ):
         return self.request(
-            Route("POST", "/channels/{channel_id}/messages", channel_id=channel_id),
+            Route(CREATE_MESSAGE, channel_id=channel_id),
             json_params={
                 "content": content,
                 "nonce": nonce,
@@ -159,35 +213,16 @@ class ChannelEndpoints(EndpointMixin):
         )
 
     def crosspost_message(self, channel_id: dt.Snowflake, message_id: dt.Snowflake):
-        return self.request(
-            Route(
-                "POST",
-                "/channels/{channel_id}/messages/{message_id}/crosspost",
-                channel_id=channel_id,
-                message_id=message_id,
-            )
-        )
+        return self.request(Route(CROSSPOST_MESSAGE, channel_id=channel_id, message_id=message_id))
 
     def create_reaction(self, channel_id: dt.Snowflake, message_id: dt.Snowflake, emoji: str):
         return self.request(
-            Route(
-                "PUT",
-                "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me",
-                channel_id=channel_id,
-                message_id=message_id,
-                emoji=emoji,
-            )
+            Route(CREATE_REACTION, channel_id=channel_id, message_id=message_id, emoji=emoji)
         )
 
     def delete_own_reaction(self, channel_id: dt.Snowflake, message_id: dt.Snowflake, emoji: str):
         return self.request(
-            Route(
-                "DELETE",
-                "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me",
-                channel_id=channel_id,
-                message_id=message_id,
-                emoji=emoji,
-            )
+            Route(DELETE_OWN_REACTION, channel_id=channel_id, message_id=message_id, emoji=emoji)
         )
 
     def delete_user_reaction(
@@ -195,8 +230,7 @@ class ChannelEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "DELETE",
-                "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/{user_id}",
+                DELETE_USER_REACTION,
                 channel_id=channel_id,
                 message_id=message_id,
                 emoji=emoji,
@@ -214,24 +248,13 @@ class ChannelEndpoints(EndpointMixin):
         limit: int = 25,
     ):
         return self.request(
-            Route(
-                "GET",
-                "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}",
-                channel_id=channel_id,
-                message_id=message_id,
-                emoji=emoji,
-            ),
+            Route(GET_REACTIONS, channel_id=channel_id, message_id=message_id, emoji=emoji),
             query_params={"after": after, "limit": limit},
         )
 
     def delete_all_reactions(self, channel_id: dt.Snowflake, message_id: dt.Snowflake):
         return self.request(
-            Route(
-                "DELETE",
-                "/channels/{channel_id}/messages/{message_id}/reactions",
-                channel_id=channel_id,
-                message_id=message_id,
-            )
+            Route(DELETE_ALL_REACTIONS, channel_id=channel_id, message_id=message_id)
         )
 
     def delete_all_reactions_for_emoji(
@@ -239,8 +262,7 @@ class ChannelEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "DELETE",
-                "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}",
+                DELETE_ALL_REACTIONS_FOR_EMOJI,
                 channel_id=channel_id,
                 message_id=message_id,
                 emoji=emoji,
@@ -261,12 +283,7 @@ class ChannelEndpoints(EndpointMixin):
         files: UnsetOr[list[BasicFile]] = Unset,
     ):
         return self.request(
-            Route(
-                "PATCH",
-                "/channels/{channel_id}/messages/{message_id}",
-                channel_id=channel_id,
-                message_id=message_id,
-            ),
+            Route(EDIT_MESSAGE, channel_id=channel_id, message_id=message_id),
             json_params={
                 "content": content,
                 "embeds": embeds,
@@ -282,13 +299,7 @@ class ChannelEndpoints(EndpointMixin):
         self, channel_id: dt.Snowflake, message_id: dt.Snowflake, reason: t.Optional[str] = None
     ):
         return self.request(
-            Route(
-                "DELETE",
-                "/channels/{channel_id}/messages/{message_id}",
-                channel_id=channel_id,
-                message_id=message_id,
-            ),
-            reason=reason,
+            Route(DELETE_MESSAGE, channel_id=channel_id, message_id=message_id), reason=reason
         )
 
     def bulk_delete_messages(
@@ -299,7 +310,7 @@ class ChannelEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("POST", "/channels/{channel_id}/messages/bulk-delete", channel_id=channel_id),
+            Route(BULK_DELETE_MESSAGES, channel_id=channel_id),
             json_params={"messages": messages},
             reason=reason,
         )
@@ -315,18 +326,13 @@ class ChannelEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route(
-                "PUT",
-                "/channels/{channel_id}/permissions/{overwrite_id}",
-                channel_id=channel_id,
-                overwrite_id=overwrite_id,
-            ),
+            Route(EDIT_CHANNEL_PERMISSIONS, channel_id=channel_id, overwrite_id=overwrite_id),
             json_params={"allow": allow, "deny": deny, "type": type},
             reason=reason,
         )
 
     def get_channel_invites(self, channel_id: dt.Snowflake):
-        return self.request(Route("GET", "/channels/{channel_id}/invites", channel_id=channel_id))
+        return self.request(Route(GET_CHANNEL_INVITES, channel_id=channel_id))
 
     def create_channel_invite(
         self,
@@ -342,7 +348,7 @@ class ChannelEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("POST", "/channels/{channel_id}/invites", channel_id=channel_id),
+            Route(CREATE_CHANNEL_INVITE, channel_id=channel_id),
             json_params={
                 "max_age": max_age,
                 "max_uses": max_uses,
@@ -359,12 +365,7 @@ class ChannelEndpoints(EndpointMixin):
         self, channel_id: dt.Snowflake, overwrite_id: dt.Snowflake, reason: t.Optional[str] = None
     ):
         return self.request(
-            Route(
-                "DELETE",
-                "/channels/{channel_id}/permissions/{overwrite_id}",
-                channel_id=channel_id,
-                overwrite_id=overwrite_id,
-            ),
+            Route(DELETE_CHANNEL_PERMISSION, channel_id=channel_id, overwrite_id=overwrite_id),
             reason=reason,
         )
 
@@ -372,40 +373,28 @@ class ChannelEndpoints(EndpointMixin):
         self, channel_id: dt.Snowflake, *, webhook_channel_id: dt.Snowflake
     ):
         return self.request(
-            Route("POST", "/channels/{channel_id}/followers", channel_id=channel_id),
+            Route(FOLLOW_ANNOUNCEMENT_CHANNEL, channel_id=channel_id),
             json_params={"webhook_channel_id": webhook_channel_id},
         )
 
     def trigger_typing_indicator(self, channel_id: dt.Snowflake):
-        return self.request(Route("POST", "/channels/{channel_id}/typing", channel_id=channel_id))
+        return self.request(Route(TRIGGER_TYPING_INDICATOR, channel_id=channel_id))
 
     def get_pinned_messages(self, channel_id: dt.Snowflake):
-        return self.request(Route("GET", "/channels/{channel_id}/pins", channel_id=channel_id))
+        return self.request(Route(GET_PINNED_MESSAGES, channel_id=channel_id))
 
     def pin_message(
         self, channel_id: dt.Snowflake, message_id: dt.Snowflake, reason: t.Optional[str] = None
     ):
         return self.request(
-            Route(
-                "PUT",
-                "/channels/{channel_id}/pins/{message_id}",
-                channel_id=channel_id,
-                message_id=message_id,
-            ),
-            reason=reason,
+            Route(PIN_MESSAGE, channel_id=channel_id, message_id=message_id), reason=reason
         )
 
     def unpin_message(
         self, channel_id: dt.Snowflake, message_id: dt.Snowflake, reason: t.Optional[str] = None
     ):
         return self.request(
-            Route(
-                "DELETE",
-                "/channels/{channel_id}/pins/{message_id}",
-                channel_id=channel_id,
-                message_id=message_id,
-            ),
-            reason=reason,
+            Route(UNPIN_MESSAGE, channel_id=channel_id, message_id=message_id), reason=reason
         )
 
     def start_thread_from_message(
@@ -419,12 +408,7 @@ class ChannelEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route(
-                "POST",
-                "/channels/{channel_id}/messages/{message_id}/threads",
-                channel_id=channel_id,
-                message_id=message_id,
-            ),
+            Route(START_THREAD_FROM_MESSAGE, channel_id=channel_id, message_id=message_id),
             json_params={
                 "name": name,
                 "auto_archive_duration": auto_archive_duration,
@@ -445,7 +429,7 @@ class ChannelEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("POST", "/channels/{channel_id}/threads", channel_id=channel_id),
+            Route(START_THREAD_WITHOUT_MESSAGE, channel_id=channel_id),
             json_params={
                 "name": name,
                 "auto_archive_duration": auto_archive_duration,
@@ -475,7 +459,7 @@ class ChannelEndpoints(EndpointMixin):
         files: UnsetOr[list[BasicFile]] = Unset,
     ):
         return self.request(
-            Route("POST", "/channels/{channel_id}/threads", channel_id=channel_id),
+            Route(START_THREAD_IN_FORUM_CHANNEL, channel_id=channel_id),
             json_params={
                 "name": name,
                 "auto_archive_duration": auto_archive_duration,
@@ -494,55 +478,28 @@ class ChannelEndpoints(EndpointMixin):
         )
 
     def join_thread(self, channel_id: dt.Snowflake):
-        return self.request(
-            Route("PUT", "/channels/{channel_id}/thread-members/@me", channel_id=channel_id)
-        )
+        return self.request(Route(JOIN_THREAD, channel_id=channel_id))
 
     def add_thread_member(self, channel_id: dt.Snowflake, user_id: dt.Snowflake):
-        return self.request(
-            Route(
-                "PUT",
-                "/channels/{channel_id}/thread-members/{user_id}",
-                channel_id=channel_id,
-                user_id=user_id,
-            )
-        )
+        return self.request(Route(ADD_THREAD_MEMBER, channel_id=channel_id, user_id=user_id))
 
     def leave_thread(self, channel_id: dt.Snowflake):
-        return self.request(
-            Route("DELETE", "/channels/{channel_id}/thread-members/@me", channel_id=channel_id)
-        )
+        return self.request(Route(LEAVE_THREAD, channel_id=channel_id))
 
     def remove_thread_member(self, channel_id: dt.Snowflake, user_id: dt.Snowflake):
-        return self.request(
-            Route(
-                "DELETE",
-                "/channels/{channel_id}/thread-members/{user_id}",
-                channel_id=channel_id,
-                user_id=user_id,
-            )
-        )
+        return self.request(Route(REMOVE_THREAD_MEMBER, channel_id=channel_id, user_id=user_id))
 
     def get_thread_member(self, channel_id: dt.Snowflake, user_id: dt.Snowflake):
-        return self.request(
-            Route(
-                "GET",
-                "/channels/{channel_id}/thread-members/{user_id}",
-                channel_id=channel_id,
-                user_id=user_id,
-            )
-        )
+        return self.request(Route(GET_THREAD_MEMBER, channel_id=channel_id, user_id=user_id))
 
     def list_thread_members(self, channel_id: dt.Snowflake):
-        return self.request(
-            Route("GET", "/channels/{channel_id}/thread-members", channel_id=channel_id)
-        )
+        return self.request(Route(LIST_THREAD_MEMBERS, channel_id=channel_id))
 
     def list_public_archived_threads(
         self, channel_id: dt.Snowflake, *, before: UnsetOr[str] = Unset, limit: UnsetOr[int] = Unset
     ):
         return self.request(
-            Route("GET", "/channels/{channel_id}/threads/archived/public", channel_id=channel_id),
+            Route(LIST_PUBLIC_ARCHIVED_THREADS, channel_id=channel_id),
             query_params={"before": before, "limit": limit},
         )
 
@@ -550,7 +507,7 @@ class ChannelEndpoints(EndpointMixin):
         self, channel_id: dt.Snowflake, *, before: UnsetOr[str] = Unset, limit: UnsetOr[int] = Unset
     ):
         return self.request(
-            Route("GET", "/channels/{channel_id}/threads/archived/private", channel_id=channel_id),
+            Route(LIST_PRIVATE_ARCHIVED_THREADS, channel_id=channel_id),
             query_params={"before": before, "limit": limit},
         )
 
@@ -558,10 +515,6 @@ class ChannelEndpoints(EndpointMixin):
         self, channel_id: dt.Snowflake, *, before: UnsetOr[str] = Unset, limit: UnsetOr[int] = Unset
     ):
         return self.request(
-            Route(
-                "GET",
-                "/channels/{channel_id}/users/@me/threads/archived/private",
-                channel_id=channel_id,
-            ),
+            Route(LIST_JOINED_PRIVATE_ARCHIVED_THREADS, channel_id=channel_id),
             query_params={"before": before, "limit": limit},
         )
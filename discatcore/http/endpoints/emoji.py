@@ -7,22 +7,24 @@ import typing as t
 import discord_typings as dt
 
 from ...types import Unset, UnsetOr
-from ..route import Route
+from ..route import Route, RouteTemplate
 from .core import EndpointMixin
 
 __all__ = ("EmojiEndpoints",)
 
+LIST_GUILD_EMOJIS = RouteTemplate("GET", "/guilds/{guild_id}/emojis")
+GET_GUILD_EMOJI = RouteTemplate("GET", "/guilds/{guild_id}/emojis/{emoji_id}")
+CREATE_GUILD_EMOJI = RouteTemplate("POST", "/guilds/{guild_id}/emojis")
+MODIFY_GUILD_EMOJI = RouteTemplate("PATCH", "/guilds/{guild_id}/emojis/{emoji_id}")
+DELETE_GUILD_EMOJI = RouteTemplate("DELETE", "/guilds/{guild_id}/emojis/{emoji_id}")
+
 
 class EmojiEndpoints(EndpointMixin):
     def list_guild_emojis(self, guild_id: dt.Snowflake):
-        return self.request(Route("GET", "/guilds/{guild_id}/emojis", guild_id=guild_id))
+        return self.request(Route(LIST_GUILD_EMOJIS, guild_id=guild_id))
 
     def get_guild_emoji(self, guild_id: dt.Snowflake, emoji_id: dt.Snowflake):
-        return self.request(
-            Route(
-                "GET", "/guilds/{guild_id}/emojis/{emoji_id}", guild_id=guild_id, emoji_id=emoji_id
-            )
-        )
+        return self.request(Route(GET_GUILD_EMOJI, guild_id=guild_id, emoji_id=emoji_id))
 
     def create_guild_emoji(
         self,
@@ -34,7 +36,7 @@ class EmojiEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("POST", "/guilds/{guild_id}/emojis", guild_id=guild_id),
+            Route(CREATE_GUILD_EMOJI, guild_id=guild_id),
             json_params={"name": name, "image": image, "roles": roles},
             reason=reason,
         )
@@ -49,12 +51,7 @@ class EmojiEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route(
-                "PATCH",
-                "/guilds/{guild_id}/emojis/{emoji_id}",
-                guild_id=guild_id,
-                emoji_id=emoji_id,
-            ),
+            Route(MODIFY_GUILD_EMOJI, guild_id=guild_id, emoji_id=emoji_id),
             json_params={"name": name, "roles": roles},
             reason=reason,
         )
@@ -63,11 +60,5 @@ class EmojiEndpoints(EndpointMixin):
         self, guild_id: dt.Snowflake, emoji_id: dt.Snowflake, reason: t.Optional[str] = None
     ):
         return self.request(
-            Route(
-                "DELETE",
-                "/guilds/{guild_id}/emojis/{emoji_id}",
-                guild_id=guild_id,
-                emoji_id=emoji_id,
-            ),
-            reason=reason,
+            Route(DELETE_GUILD_EMOJI, guild_id=guild_id, emoji_id=emoji_id), reason=reason
         )
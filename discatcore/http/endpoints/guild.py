@@ -7,11 +7,59 @@ import typing as t
 import discord_typings as dt
 
 from ...types import Unset, UnsetOr
-from ..route import Route
+from ..route import Route, RouteTemplate
 from .core import EndpointMixin
 
 __all__ = ("GuildEndpoints",)
 
+CREATE_GUILD = RouteTemplate("POST", "/guilds")
+GET_GUILD = RouteTemplate("GET", "/guilds/{guild_id}")
+GET_GUILD_PREVIEW = RouteTemplate("GET", "/guilds/{guild_id}/preview")
+MODIFY_GUILD = RouteTemplate("PATCH", "/guilds/{guild_id}")
+DELETE_GUILD = RouteTemplate("DELETE", "/guilds/{guild_id}")
+GET_GUILD_CHANNELS = RouteTemplate("GET", "/guilds/{guild_id}/channels")
+CREATE_GUILD_CHANNEL = RouteTemplate("POST", "/guilds/{guild_id}/channels")
+MODIFY_GUILD_CHANNEL_POSITIONS = RouteTemplate("PATCH", "/guilds/{guild_id}/channels")
+LIST_ACTIVE_GUILD_THREADS = RouteTemplate("GET", "/guilds/{guild_id}/threads/active")
+GET_GUILD_MEMBER = RouteTemplate("GET", "/guilds/{guild_id}/members/{user_id}")
+LIST_GUILD_MEMBERS = RouteTemplate("GET", "/guilds/{guild_id}/members")
+SEARCH_GUILD_MEMBERS = RouteTemplate("GET", "/guilds/{guild_id}/members/search")
+ADD_GUILD_MEMBER = RouteTemplate("PUT", "/guilds/{guild_id}/members/{user_id}")
+MODIFY_GUILD_MEMBER = RouteTemplate("PATCH", "/guilds/{guild_id}/members/{user_id}")
+MODIFY_CURRENT_MEMBER = RouteTemplate("PATCH", "/guilds/{guild_id}/members/@me")
+ADD_GUILD_MEMBER_ROLE = RouteTemplate("PUT", "/guilds/{guild_id}/members/{user_id}/roles/{role_id}")
+REMOVE_GUILD_MEMBER_ROLE = RouteTemplate(
+    "DELETE", "/guilds/{guild_id}/members/{user_id}/roles/{role_id}"
+)
+REMOVE_GUILD_MEMBER = RouteTemplate("DELETE", "/guilds/{guild_id}/members/{user_id}")
+GET_GUILD_BANS = RouteTemplate("GET", "/guilds/{guild_id}/bans")
+GET_GUILD_BAN = RouteTemplate("GET", "/guilds/{guild_id}/bans/{user_id}")
+CREATE_GUILD_BAN = RouteTemplate("PUT", "/guilds/{guild_id}/bans/{user_id}")
+REMOVE_GUILD_BAN = RouteTemplate("DELETE", "/guilds/{guild_id}/bans/{user_id}")
+GET_GUILD_ROLES = RouteTemplate("GET", "/guilds/{guild_id}/roles")
+CREATE_GUILD_ROLE = RouteTemplate("POST", "/guilds/{guild_id}/roles")
+MODIFY_GUILD_ROLE_POSITIONS = RouteTemplate("PATCH", "/guilds/{guild_id}/roles")
+MODIFY_GUILD_ROLE = RouteTemplate("PATCH", "/guilds/{guild_id}/roles/{role_id}")
+MODIFY_GUILD_MFA_LEVEL = RouteTemplate("POST", "/guilds/{guild_id}/mfa")
+DELETE_GUILD_ROLE = RouteTemplate("DELETE", "/guilds/{guild_id}/roles/{role_id}")
+GET_GUILD_PRUNE_COUNT = RouteTemplate("GET", "/guilds/{guild_id}/prune")
+BEGIN_GUILD_PRUNE = RouteTemplate("POST", "/guilds/{guild_id}/prune")
+GET_GUILD_VOICE_REGIONS = RouteTemplate("GET", "/guilds/{guild_id}/regions")
+GET_GUILD_INVITES = RouteTemplate("GET", "/guilds/{guild_id}/invites")
+GET_GUILD_INTEGRATIONS = RouteTemplate("GET", "/guilds/{guild_id}/integrations")
+DELETE_GUILD_INTEGRATION = RouteTemplate(
+    "DELETE", "/guilds/{guild_id}/integrations/{integration_id}"
+)
+GET_GUILD_WIDGET_SETTINGS = RouteTemplate("GET", "/guilds/{guild_id}/widget")
+MODIFY_GUILD_WIDGET = RouteTemplate("PATCH", "/guilds/{guild_id}/widget")
+GET_GUILD_WIDGET = RouteTemplate("GET", "/guilds/{guild_id}/widget.json")
+GET_GUILD_VANITY_URL = RouteTemplate("GET", "/guilds/{guild_id}/vanity-url")
+GET_GUILD_WIDGET_IMAGE = RouteTemplate("GET", "/guilds/{guild_id}/widget.png")
+GET_GUILD_WELCOME_SCREEN = RouteTemplate("GET", "/guilds/{guild_id}/welcome-screen")
+MODIFY_GUILD_WELCOME_SCREEN = RouteTemplate("PATCH", "/guilds/{guild_id}/welcome-screen")
+MODIFY_CURRENT_USER_VOICE_STATE = RouteTemplate("PATCH", "/guilds/{guild_id}/voice-states/@me")
+MODIFY_USER_VOICE_STATE = RouteTemplate("PATCH", "/guilds/{guild_id}/voice-states/{user_id}")
+
 
 class GuildEndpoints(EndpointMixin):
     def create_guild(
@@ -30,7 +78,7 @@ class GuildEndpoints(EndpointMixin):
         system_channel_flags: UnsetOr[int] = Unset,
     ):
         return self.request(
-            Route("POST", "/guilds"),
+            Route(CREATE_GUILD),
             json_params={
                 "name": name,
                 "icon": icon,
@@ -48,12 +96,11 @@ class GuildEndpoints(EndpointMixin):
 
     def get_guild(self, guild_id: dt.Snowflake, *, with_counts: bool = False):
         return self.request(
-            Route("GET", "/guilds/{guild_id}", guild_id=guild_id),
-            query_params={"with_counts": with_counts},
+            Route(GET_GUILD, guild_id=guild_id), query_params={"with_counts": with_counts}
         )
 
     def get_guild_preview(self, guild_id: dt.Snowflake):
-        return self.request(Route("GET", "/guilds/{guild_id}/preview", guild_id=guild_id))
+        return self.request(Route(GET_GUILD_PREVIEW, guild_id=guild_id))
 
     def modify_guild(
         self,
@@ -83,7 +130,7 @@ class GuildEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("PATCH", "/guilds/{guild_id}", guild_id=guild_id),
+            Route(MODIFY_GUILD, guild_id=guild_id),
             json_params={
                 "name": name,
                 "icon": icon,
@@ -109,10 +156,10 @@ class GuildEndpoints(EndpointMixin):
         )
 
     def delete_guild(self, guild_id: dt.Snowflake):
-        return self.request(Route("DELETE", "/guilds/{guild_id}", guild_id=guild_id))
+        return self.request(Route(DELETE_GUILD, guild_id=guild_id))
 
     def get_guild_channels(self, guild_id: dt.Snowflake):
-        return self.request(Route("GET", "/guilds/{guild_id}/channels", guild_id=guild_id))
+        return self.request(Route(GET_GUILD_CHANNELS, guild_id=guild_id))
 
     def create_guild_channel(
         self,
@@ -137,7 +184,7 @@ class GuildEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("POST", "/guilds/{guild_id}/channels", guild_id=guild_id),
+            Route(CREATE_GUILD_CHANNEL, guild_id=guild_id),
             json_params={
                 "name": name,
                 "type": type,
@@ -169,7 +216,7 @@ class GuildEndpoints(EndpointMixin):
         parent_id: UnsetOr[t.Optional[dt.Snowflake]] = Unset,
     ):
         return self.request(
-            Route("PATCH", "/guilds/{guild_id}/channels", guild_id=guild_id),
+            Route(MODIFY_GUILD_CHANNEL_POSITIONS, guild_id=guild_id),
             json_params={
                 "id": id,
                 "position": position,
@@ -179,24 +226,22 @@ class GuildEndpoints(EndpointMixin):
         )
 
     def list_active_guild_threads(self, guild_id: dt.Snowflake):
-        return self.request(Route("GET", "/guilds/{guild_id}/threads/active", guild_id=guild_id))
+        return self.request(Route(LIST_ACTIVE_GUILD_THREADS, guild_id=guild_id))
 
     def get_guild_member(self, guild_id: dt.Snowflake, user_id: dt.Snowflake):
-        return self.request(
-            Route("GET", "/guilds/{guild_id}/members/{user_id}", guild_id=guild_id, user_id=user_id)
-        )
+        return self.request(Route(GET_GUILD_MEMBER, guild_id=guild_id, user_id=user_id))
 
     def list_guild_members(
         self, guild_id: dt.Snowflake, *, limit: int = 1, after: UnsetOr[dt.Snowflake] = Unset
     ):
         return self.request(
-            Route("GET", "/guilds/{guild_id}/members", guild_id=guild_id),
+            Route(LIST_GUILD_MEMBERS, guild_id=guild_id),
             query_params={"limit": limit, "after": after},
         )
 
     def search_guild_members(self, guild_id: dt.Snowflake, *, query: str, limit: int = 1):
         return self.request(
-            Route("GET", "/guilds/{guild_id}/members/search", guild_id=guild_id),
+            Route(SEARCH_GUILD_MEMBERS, guild_id=guild_id),
             query_params={"query": query, "limit": limit},
         )
 
@@ -212,9 +257,7 @@ class GuildEndpoints(EndpointMixin):
         deaf: UnsetOr[bool] = Unset,
     ):
         return self.request(
-            Route(
-                "PUT", "/guilds/{guild_id}/members/{user_id}", guild_id=guild_id, user_id=user_id
-            ),
+            Route(ADD_GUILD_MEMBER, guild_id=guild_id, user_id=user_id),
             json_params={
                 "access_token": access_token,
                 "nick": nick,
@@ -238,9 +281,7 @@ class GuildEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route(
-                "PATCH", "/guilds/{guild_id}/members/{user_id}", guild_id=guild_id, user_id=user_id
-            ),
+            Route(MODIFY_GUILD_MEMBER, guild_id=guild_id, user_id=user_id),
             json_params={
                 "nick": nick,
                 "roles": roles,
@@ -260,7 +301,7 @@ class GuildEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("PATCH", "/guilds/{guild_id}/members/@me", guild_id=guild_id),
+            Route(MODIFY_CURRENT_MEMBER, guild_id=guild_id),
             json_params={"nick": nick},
             reason=reason,
         )
@@ -273,13 +314,7 @@ class GuildEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route(
-                "PUT",
-                "/guilds/{guild_id}/members/{user_id}/roles/{role_id}",
-                guild_id=guild_id,
-                user_id=user_id,
-                role_id=role_id,
-            ),
+            Route(ADD_GUILD_MEMBER_ROLE, guild_id=guild_id, user_id=user_id, role_id=role_id),
             reason=reason,
         )
 
@@ -291,13 +326,7 @@ class GuildEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route(
-                "DELETE",
-                "/guilds/{guild_id}/members/{user_id}/roles/{role_id}",
-                guild_id=guild_id,
-                user_id=user_id,
-                role_id=role_id,
-            ),
+            Route(REMOVE_GUILD_MEMBER_ROLE, guild_id=guild_id, user_id=user_id, role_id=role_id),
             reason=reason,
         )
 
@@ -305,10 +334,7 @@ class GuildEndpoints(EndpointMixin):
         self, guild_id: dt.Snowflake, user_id: dt.Snowflake, reason: t.Optional[str] = None
     ):
         return self.request(
-            Route(
-                "DELETE", "/guilds/{guild_id}/members/{user_id}", guild_id=guild_id, user_id=user_id
-            ),
-            reason=reason,
+            Route(REMOVE_GUILD_MEMBER, guild_id=guild_id, user_id=user_id), reason=reason
         )
 
     def get_guild_bans(
@@ -320,14 +346,12 @@ class GuildEndpoints(EndpointMixin):
         after: UnsetOr[dt.Snowflake] = Unset,
     ):
         return self.request(
-            Route("GET", "/guilds/{guild_id}/bans", guild_id=guild_id),
+            Route(GET_GUILD_BANS, guild_id=guild_id),
             query_params={"limit": limit, "before": before, "after": after},
         )
 
     def get_guild_ban(self, guild_id: dt.Snowflake, user_id: dt.Snowflake):
-        return self.request(
-            Route("GET", "/guilds/{guild_id}/bans/{user_id}", guild_id=guild_id, user_id=user_id)
-        )
+        return self.request(Route(GET_GUILD_BAN, guild_id=guild_id, user_id=user_id))
 
     def create_guild_ban(
         self,
@@ -338,7 +362,7 @@ class GuildEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("PUT", "/guilds/{guild_id}/bans/{user_id}", guild_id=guild_id, user_id=user_id),
+            Route(CREATE_GUILD_BAN, guild_id=guild_id, user_id=user_id),
             json_params={"delete_message_seconds": delete_message_seconds},
             reason=reason,
         )
@@ -347,14 +371,11 @@ class GuildEndpoints(EndpointMixin):
         self, guild_id: dt.Snowflake, user_id: dt.Snowflake, reason: t.Optional[str] = None
     ):
         return self.request(
-            Route(
-                "DELETE", "/guilds/{guild_id}/bans/{user_id}", guild_id=guild_id, user_id=user_id
-            ),
-            reason=reason,
+            Route(REMOVE_GUILD_BAN, guild_id=guild_id, user_id=user_id), reason=reason
         )
 
     def get_guild_roles(self, guild_id: dt.Snowflake):
-        return self.request(Route("GET", "/guilds/{guild_id}/roles", guild_id=guild_id))
+        return self.request(Route(GET_GUILD_ROLES, guild_id=guild_id))
 
     def create_guild_role(
         self,
@@ -370,7 +391,7 @@ class GuildEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("POST", "/guilds/{guild_id}/roles", guild_id=guild_id),
+            Route(CREATE_GUILD_ROLE, guild_id=guild_id),
             json_params={
                 "name": name,
                 "permissions": permissions,
@@ -392,7 +413,7 @@ class GuildEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("PATCH", "/guilds/{guild_id}/roles", guild_id=guild_id),
+            Route(MODIFY_GUILD_ROLE_POSITIONS, guild_id=guild_id),
             json_params={"id": id, "position": position},
             reason=reason,
         )
@@ -412,9 +433,7 @@ class GuildEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route(
-                "PATCH", "/guilds/{guild_id}/roles/{role_id}", guild_id=guild_id, role_id=role_id
-            ),
+            Route(MODIFY_GUILD_ROLE, guild_id=guild_id, role_id=role_id),
             json_params={
                 "name": name,
                 "permissions": permissions,
@@ -431,7 +450,7 @@ class GuildEndpoints(EndpointMixin):
         self, guild_id: dt.Snowflake, *, level: dt.MFALevels, reason: t.Optional[str] = None
     ):
         return self.request(
-            Route("POST", "/guilds/{guild_id}/mfa", guild_id=guild_id),
+            Route(MODIFY_GUILD_MFA_LEVEL, guild_id=guild_id),
             json_params={"level": level},
             reason=reason,
         )
@@ -440,17 +459,14 @@ class GuildEndpoints(EndpointMixin):
         self, guild_id: dt.Snowflake, role_id: dt.Snowflake, reason: t.Optional[str] = None
     ):
         return self.request(
-            Route(
-                "DELETE", "/guilds/{guild_id}/roles/{role_id}", guild_id=guild_id, role_id=role_id
-            ),
-            reason=reason,
+            Route(DELETE_GUILD_ROLE, guild_id=guild_id, role_id=role_id), reason=reason
         )
 
     def get_guild_prune_count(
         self, guild_id: dt.Snowflake, *, days: int = 7, include_roles: UnsetOr[str] = Unset
     ):
         return self.request(
-            Route("GET", "/guilds/{guild_id}/prune", guild_id=guild_id),
+            Route(GET_GUILD_PRUNE_COUNT, guild_id=guild_id),
             query_params={"days": days, "include_roles": include_roles},
         )
 
@@ -464,7 +480,7 @@ class GuildEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("POST", "/guilds/{guild_id}/prune", guild_id=guild_id),
+            Route(BEGIN_GUILD_PRUNE, guild_id=guild_id),
             json_params={
                 "days": days,
                 "compute_prune_count": compute_prune_count,
@@ -474,29 +490,24 @@ class GuildEndpoints(EndpointMixin):
         )
 
     def get_guild_voice_regions(self, guild_id: dt.Snowflake):
-        return self.request(Route("GET", "/guilds/{guild_id}/regions", guild_id=guild_id))
+        return self.request(Route(GET_GUILD_VOICE_REGIONS, guild_id=guild_id))
 
     def get_guild_invites(self, guild_id: dt.Snowflake):
-        return self.request(Route("GET", "/guilds/{guild_id}/invites", guild_id=guild_id))
+        return self.request(Route(GET_GUILD_INVITES, guild_id=guild_id))
 
     def get_guild_integrations(self, guild_id: dt.Snowflake):
-        return self.request(Route("GET", "/guilds/{guild_id}/integrations", guild_id=guild_id))
+        return self.request(Route(GET_GUILD_INTEGRATIONS, guild_id=guild_id))
 
     def delete_guild_integration(
         self, guild_id: dt.Snowflake, integration_id: dt.Snowflake, reason: t.Optional[str] = None
     ):
         return self.request(
-            Route(
-                "DELETE",
-                "/guilds/{guild_id}/integrations/{integration_id}",
-                guild_id=guild_id,
-                integration_id=integration_id,
-            ),
+            Route(DELETE_GUILD_INTEGRATION, guild_id=guild_id, integration_id=integration_id),
             reason=reason,
         )
 
     def get_guild_widget_settings(self, guild_id: dt.Snowflake):
-        return self.request(Route("GET", "/guilds/{guild_id}/widget", guild_id=guild_id))
+        return self.request(Route(GET_GUILD_WIDGET_SETTINGS, guild_id=guild_id))
 
     def modify_guild_widget(
         self,
@@ -507,25 +518,24 @@ class GuildEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("PATCH", "/guilds/{guild_id}/widget", guild_id=guild_id),
+            Route(MODIFY_GUILD_WIDGET, guild_id=guild_id),
             json_params={"enabled": enabled, "channel_id": channel_id},
             reason=reason,
         )
 
     def get_guild_widget(self, guild_id: dt.Snowflake):
-        return self.request(Route("GET", "/guilds/{guild_id}/widget.json", guild_id=guild_id))
+        return self.request(Route(GET_GUILD_WIDGET, guild_id=guild_id))
 
     def get_guild_vanity_url(self, guild_id: dt.Snowflake):
-        return self.request(Route("GET", "/guilds/{guild_id}/vanity-url", guild_id=guild_id))
+        return self.request(Route(GET_GUILD_VANITY_URL, guild_id=guild_id))
 
     def get_guild_widget_image(self, guild_id: dt.Snowflake, *, style: UnsetOr[str] = Unset):
         return self.request(
-            Route("GET", "/guilds/{guild_id}/widget.png", guild_id=guild_id),
-            query_params={"style": style},
+            Route(GET_GUILD_WIDGET_IMAGE, guild_id=guild_id), query_params={"style": style}
         )
 
     def get_guild_welcome_screen(self, guild_id: dt.Snowflake):
-        return self.request(Route("GET", "/guilds/{guild_id}/welcome-screen", guild_id=guild_id))
+        return self.request(Route(GET_GUILD_WELCOME_SCREEN, guild_id=guild_id))
 
     def modify_guild_welcome_screen(
         self,
@@ -537,7 +547,7 @@ class GuildEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("PATCH", "/guilds/{guild_id}/welcome-screen", guild_id=guild_id),
+            Route(MODIFY_GUILD_WELCOME_SCREEN, guild_id=guild_id),
             json_params={
                 "enabled": enabled,
                 "welcome_channels": welcome_channels,
@@ -555,7 +565,7 @@ class GuildEndpoints(EndpointMixin):
         request_to_speak_timestamp: UnsetOr[t.Optional[str]] = Unset,
     ):
         return self.request(
-            Route("PATCH", "/guilds/{guild_id}/voice-states/@me", guild_id=guild_id),
+            Route(MODIFY_CURRENT_USER_VOICE_STATE, guild_id=guild_id),
             json_params={
                 "channel_id": channel_id,
                 "suppress": suppress,
@@ -572,11 +582,6 @@ class GuildEndpoints(EndpointMixin):
         suppress: UnsetOr[bool] = Unset,
     ):
         return self.request(
-            Route(
-                "PATCH",
-                "/guilds/{guild_id}/voice-states/{user_id}",
-                guild_id=guild_id,
-                user_id=user_id,
-            ),
+            Route(MODIFY_USER_VOICE_STATE, guild_id=guild_id, user_id=user_id),
             json_params={"channel_id": channel_id, "suppress": suppress},
         )
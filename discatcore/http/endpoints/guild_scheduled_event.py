@@ -7,18 +7,33 @@ import typing as t
 import discord_typings as dt
 
 from ...types import Unset, UnsetOr
-from ..route import Route
+from ..route import Route, RouteTemplate
 from .core import EndpointMixin
 
 __all__ = ("GuildScheduledEventEndpoints",)
 
+LIST_SCHEDULED_EVENTS_FOR_GUILD = RouteTemplate("GET", "/guilds/{guild_id}/scheduled-events")
+CREATE_GUILD_SCHEDULED_EVENT = RouteTemplate("POST", "/guilds/{guild_id}/scheduled-events")
+GET_GUILD_SCHEDULED_EVENT = RouteTemplate(
+    "GET", "/guilds/{guild_id}/scheduled-events/{guild_scheduled_event_id}"
+)
+MODIFY_GUILD_SCHEDULED_EVENT = RouteTemplate(
+    "PATCH", "/guilds/{guild_id}/scheduled-events/{guild_scheduled_event_id}"
+)
+DELETE_GUILD_SCHEDULED_EVENT = RouteTemplate(
+    "DELETE", "/guilds/{guild_id}/scheduled-events/{guild_scheduled_event_id}"
+)
+GET_GUILD_SCHEDULED_EVENT_USERS = RouteTemplate(
+    "GET", "/guilds/{guild_id}/scheduled-events/{guild_scheduled_event_id}/users"
+)
+
 
 class GuildScheduledEventEndpoints(EndpointMixin):
     def list_scheduled_events_for_guild(
         self, guild_id: dt.Snowflake, *, with_user_count: UnsetOr[bool] = Unset
     ):
         return self.request(
-            Route("GET", "/guilds/{guild_id}/scheduled-events", guild_id=guild_id),
+            Route(LIST_SCHEDULED_EVENTS_FOR_GUILD, guild_id=guild_id),
             query_params={"with_user_count": with_user_count},
         )
 
@@ -38,7 +53,7 @@ class GuildScheduledEventEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("POST", "/guilds/{guild_id}/scheduled-events", guild_id=guild_id),
+            Route(CREATE_GUILD_SCHEDULED_EVENT, guild_id=guild_id),
             json_params={
                 "channel_id": channel_id,
                 "entity_metadata": entity_metadata,
@@ -62,8 +77,7 @@ class GuildScheduledEventEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "GET",
-                "/guilds/{guild_id}/scheduled-events/{guild_scheduled_event_id}",
+                GET_GUILD_SCHEDULED_EVENT,
                 guild_id=guild_id,
                 guild_scheduled_event_id=guild_scheduled_event_id,
             ),
@@ -89,8 +103,7 @@ class GuildScheduledEventEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "PATCH",
-                "/guilds/{guild_id}/scheduled-events/{guild_scheduled_event_id}",
+                MODIFY_GUILD_SCHEDULED_EVENT,
                 guild_id=guild_id,
                 guild_scheduled_event_id=guild_scheduled_event_id,
             ),
@@ -114,8 +127,7 @@ class GuildScheduledEventEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "DELETE",
-                "/guilds/{guild_id}/scheduled-events/{guild_scheduled_event_id}",
+                DELETE_GUILD_SCHEDULED_EVENT,
                 guild_id=guild_id,
                 guild_scheduled_event_id=guild_scheduled_event_id,
             )
@@ -133,8 +145,7 @@ class GuildScheduledEventEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "GET",
-                "/guilds/{guild_id}/scheduled-events/{guild_scheduled_event_id}/users",
+                GET_GUILD_SCHEDULED_EVENT_USERS,
                 guild_id=guild_id,
                 guild_scheduled_event_id=guild_scheduled_event_id,
             ),
@@ -7,45 +7,46 @@ import typing as t
 import discord_typings as dt
 
 from ...types import Unset, UnsetOr
-from ..route import Route
+from ..route import Route, RouteTemplate
 from .core import EndpointMixin
 
 __all__ = ("GuildTemplateEndpoints",)
 
+GET_GUILD_TEMPLATE = RouteTemplate("GET", "/guilds/templates/{template_code}")
+CREATE_GUILD_FROM_GUILD_TEMPLATE = RouteTemplate("POST", "/guilds/templates/{template_code}")
+GET_GUILD_TEMPLATES = RouteTemplate("GET", "/guilds/{guild_id}/templates")
+CREATE_GUILD_TEMPLATE = RouteTemplate("POST", "/guilds/{guild_id}/templates")
+SYNC_GUILD_TEMPLATE = RouteTemplate("PUT", "/guilds/{guild_id}/templates/{template_code}")
+MODIFY_GUILD_TEMPLATE = RouteTemplate("PATCH", "/guilds/{guild_id}/templates/{template_code}")
+DELETE_GUILD_TEMPLATE = RouteTemplate("DELETE", "/guilds/{guild_id}/templates/{template_code}")
+
 
 class GuildTemplateEndpoints(EndpointMixin):
     def get_guild_template(self, template_code: dt.Snowflake):
-        return self.request(
-            Route("GET", "/guilds/templates/{template_code}", template_code=template_code)
-        )
+        return self.request(Route(GET_GUILD_TEMPLATE, template_code=template_code))
 
     def create_guild_from_guild_template(
         self, template_code: dt.Snowflake, *, name: str, icon: UnsetOr[str] = Unset
     ):
         return self.request(
-            Route("POST", "/guilds/templates/{template_code}", template_code=template_code),
+            Route(CREATE_GUILD_FROM_GUILD_TEMPLATE, template_code=template_code),
             json_params={"name": name, "icon": icon},
         )
 
     def get_guild_templates(self, guild_id: dt.Snowflake):
-        return self.request(Route("GET", "/guilds/{guild_id}/templates", guild_id=guild_id))
+        return self.request(Route(GET_GUILD_TEMPLATES, guild_id=guild_id))
 
     def create_guild_template(
         self, guild_id: dt.Snowflake, *, name: str, description: UnsetOr[t.Optional[str]] = Unset
     ):
         return self.request(
-            Route("POST", "/guilds/{guild_id}/templates", guild_id=guild_id),
+            Route(CREATE_GUILD_TEMPLATE, guild_id=guild_id),
             json_params={"name": name, "description": description},
         )
 
     def sync_guild_template(self, guild_id: dt.Snowflake, template_code: dt.Snowflake):
         return self.request(
-            Route(
-                "PUT",
-                "/guilds/{guild_id}/templates/{template_code}",
-                guild_id=guild_id,
-                template_code=template_code,
-            )
+            Route(SYNC_GUILD_TEMPLATE, guild_id=guild_id, template_code=template_code)
         )
 
     def modify_guild_template(
@@ -57,21 +58,11 @@ class GuildTemplateEndpoints(EndpointMixin):
         description: UnsetOr[t.Optional[str]] = Unset,
     ):
         return self.request(
-            Route(
-                "PATCH",
-                "/guilds/{guild_id}/templates/{template_code}",
-                guild_id=guild_id,
-                template_code=template_code,
-            ),
+            Route(MODIFY_GUILD_TEMPLATE, guild_id=guild_id, template_code=template_code),
             json_params={"name": name, "description": description},
         )
 
     def delete_guild_template(self, guild_id: dt.Snowflake, template_code: dt.Snowflake):
         return self.request(
-            Route(
-                "DELETE",
-                "/guilds/{guild_id}/templates/{template_code}",
-                guild_id=guild_id,
-                template_code=template_code,
-            )
+            Route(DELETE_GUILD_TEMPLATE, guild_id=guild_id, template_code=template_code)
         )
@@ -8,11 +8,34 @@ import discord_typings as dt
 
 from ...file import BasicFile
 from ...types import Unset, UnsetOr
-from ..route import Route
+from ..route import Route, RouteTemplate
 from .core import EndpointMixin
 
 __all__ = ("InteractionEndpoints",)
 
+CREATE_INTERACTION_RESPONSE = RouteTemplate(
+    "POST", "/interactions/{interaction_id}/{interaction_token}/callback"
+)
+GET_ORIGINAL_INTERACTION_RESPONSE = RouteTemplate(
+    "GET", "/webhooks/{application_id}/{interaction_token}/messages/@original"
+)
+EDIT_ORIGINAL_INTERACTION_RESPONSE = RouteTemplate(
+    "PATCH", "/webhooks/{application_id}/{interaction_token}/messages/@original"
+)
+DELETE_ORIGINAL_INTERACTION_RESPONSE = RouteTemplate(
+    "DELETE", "/webhooks/{application_id}/{interaction_token}/messages/@original"
+)
+CREATE_FOLLOWUP_MESSAGE = RouteTemplate("POST", "/webhooks/{application_id}/{interaction_token}")
+GET_FOLLOWUP_MESSAGE = RouteTemplate(
+    "GET", "/webhooks/{application_id}/{interaction_token}/messages/{message_id}"
+)
+EDIT_FOLLOWUP_MESSAGE = RouteTemplate(
+    "PATCH", "/webhooks/{application_id}/{interaction_token}/messages/{message_id}"
+)
+DELETE_FOLLOWUP_MESSAGE = RouteTemplate(
+    "DELETE", "/webhooks/{application_id}/{interaction_token}/messages/{message_id}"
+)
+
 
 class InteractionEndpoints(EndpointMixin):
     def create_interaction_response(
@@ -26,8 +49,7 @@ class InteractionEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "POST",
-                "/interactions/{interaction_id}/{interaction_token}/callback",
+                CREATE_INTERACTION_RESPONSE,
                 interaction_id=interaction_id,
                 interaction_token=interaction_token,
             ),
@@ -40,8 +62,7 @@ class InteractionEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "GET",
-                "/webhooks/{application_id}/{interaction_token}/messages/@original",
+                GET_ORIGINAL_INTERACTION_RESPONSE,
                 application_id=application_id,
                 interaction_token=interaction_token,
             )
@@ -61,8 +82,7 @@ class InteractionEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "PATCH",
-                "/webhooks/{application_id}/{interaction_token}/messages/@original",
+                EDIT_ORIGINAL_INTERACTION_RESPONSE,
                 application_id=application_id,
                 interaction_token=interaction_token,
             ),
@@ -81,8 +101,7 @@ class InteractionEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "DELETE",
-                "/webhooks/{application_id}/{interaction_token}/messages/@original",
+                DELETE_ORIGINAL_INTERACTION_RESPONSE,
                 application_id=application_id,
                 interaction_token=interaction_token,
             )
@@ -105,8 +124,7 @@ class InteractionEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "POST",
-                "/webhooks/{application_id}/{interaction_token}",
+                CREATE_FOLLOWUP_MESSAGE,
                 application_id=application_id,
                 interaction_token=interaction_token,
             ),
@@ -128,8 +146,7 @@ class InteractionEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "GET",
-                "/webhooks/{application_id}/{interaction_token}/messages/{message_id}",
+                GET_FOLLOWUP_MESSAGE,
                 application_id=application_id,
                 interaction_token=interaction_token,
                 message_id=message_id,
@@ -151,8 +168,7 @@ class InteractionEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "PATCH",
-                "/webhooks/{application_id}/{interaction_token}/messages/{message_id}",
+                EDIT_FOLLOWUP_MESSAGE,
                 application_id=application_id,
                 interaction_token=interaction_token,
                 message_id=message_id,
@@ -172,8 +188,7 @@ class InteractionEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "DELETE",
-                "/webhooks/{application_id}/{interaction_token}/messages/{message_id}",
+                DELETE_FOLLOWUP_MESSAGE,
                 application_id=application_id,
                 interaction_token=interaction_token,
                 message_id=message_id,
@@ -7,11 +7,14 @@ import typing as t
 import discord_typings as dt
 
 from ...types import Unset, UnsetOr
-from ..route import Route
+from ..route import Route, RouteTemplate
 from .core import EndpointMixin
 
 __all__ = ("InviteEndpoints",)
 
+GET_INVITE = RouteTemplate("GET", "/invites/{invite_code}")
+DELETE_INVITE = RouteTemplate("DELETE", "/invites/{invite_code}")
+
 
 class InviteEndpoints(EndpointMixin):
     def get_invite(
@@ -23,7 +26,7 @@ class InviteEndpoints(EndpointMixin):
         guild_scheduled_event_id: UnsetOr[dt.Snowflake] = Unset,
     ):
         return self.request(
-            Route("GET", "/invites/{invite_code}", invite_code=invite_code),
+            Route(GET_INVITE, invite_code=invite_code),
             query_params={
                 "with_counts": with_counts,
                 "with_expiration": with_expiration,
@@ -32,6 +35,4 @@ class InviteEndpoints(EndpointMixin):
         )
 
     def delete_invite(self, invite_code: dt.Snowflake, reason: t.Optional[str] = None):
-        return self.request(
-            Route("DELETE", "/invites/{invite_code}", invite_code=invite_code), reason=reason
-        )
+        return self.request(Route(DELETE_INVITE, invite_code=invite_code), reason=reason)
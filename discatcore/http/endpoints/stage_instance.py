@@ -7,11 +7,16 @@ import typing as t
 import discord_typings as dt
 
 from ...types import Unset, UnsetOr
-from ..route import Route
+from ..route import Route, RouteTemplate
 from .core import EndpointMixin
 
 __all__ = ("StageInstanceEndpoints",)
 
+CREATE_STAGE_INSTANCE = RouteTemplate("POST", "/stage-instances")
+GET_STAGE_INSTANCE = RouteTemplate("GET", "/stage-instances/{channel_id}")
+MODIFY_STAGE_INSTANCE = RouteTemplate("PATCH", "/stage-instances/{channel_id}")
+DELETE_STAGE_INSTANCE = RouteTemplate("DELETE", "/stage-instances/{channel_id}")
+
 
 class StageInstanceEndpoints(EndpointMixin):
     def create_stage_instance(
@@ -24,7 +29,7 @@ class StageInstanceEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("POST", "/stage-instances"),
+            Route(CREATE_STAGE_INSTANCE),
             json_params={
                 "channel_id": channel_id,
                 "topic": topic,
@@ -35,7 +40,7 @@ class StageInstanceEndpoints(EndpointMixin):
         )
 
     def get_stage_instance(self, channel_id: dt.Snowflake):
-        return self.request(Route("GET", "/stage-instances/{channel_id}", channel_id=channel_id))
+        return self.request(Route(GET_STAGE_INSTANCE, channel_id=channel_id))
 
     def modify_stage_instance(
         self,
@@ -46,12 +51,10 @@ class StageInstanceEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("PATCH", "/stage-instances/{channel_id}", channel_id=channel_id),
+            Route(MODIFY_STAGE_INSTANCE, channel_id=channel_id),
             json_params={"topic": topic, "privacy_level": privacy_level},
             reason=reason,
         )
 
     def delete_stage_instance(self, channel_id: dt.Snowflake, reason: t.Optional[str] = None):
-        return self.request(
-            Route("DELETE", "/stage-instances/{channel_id}", channel_id=channel_id), reason=reason
-        )
+        return self.request(Route(DELETE_STAGE_INSTANCE, channel_id=channel_id), reason=reason)
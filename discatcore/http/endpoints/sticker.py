@@ -8,31 +8,32 @@ import discord_typings as dt
 
 from ...file import BasicFile
 from ...types import Unset, UnsetOr
-from ..route import Route
+from ..route import Route, RouteTemplate
 from .core import EndpointMixin
 
 __all__ = ("StickerEndpoints",)
 
+GET_STICKER = RouteTemplate("GET", "/stickers/{sticker_id}")
+LIST_NITRO_STICKER_PACKS = RouteTemplate("GET", "/sticker-packs")
+LIST_GUILD_STICKERS = RouteTemplate("GET", "/guilds/{guild_id}/stickers")
+GET_GUILD_STICKER = RouteTemplate("GET", "/guilds/{guild_id}/stickers/{sticker_id}")
+CREATE_GUILD_STICKER = RouteTemplate("POST", "/guilds/{guild_id}/stickers")
+MODIFY_GUILD_STICKER = RouteTemplate("PATCH", "/guilds/{guild_id}/stickers/{sticker_id}")
+DELETE_GUILD_STICKER = RouteTemplate("DELETE", "/guilds/{guild_id}/stickers/{sticker_id}")
+
 
 class StickerEndpoints(EndpointMixin):
     def get_sticker(self, sticker_id: dt.Snowflake):
-        return self.request(Route("GET", "/stickers/{sticker_id}", sticker_id=sticker_id))
+        return self.request(Route(GET_STICKER, sticker_id=sticker_id))
 
     def list_nitro_sticker_packs(self):
-        return self.request(Route("GET", "/sticker-packs"))
+        return self.request(Route(LIST_NITRO_STICKER_PACKS))
 
     def list_guild_stickers(self, guild_id: dt.Snowflake):
-        return self.request(Route("GET", "/guilds/{guild_id}/stickers", guild_id=guild_id))
+        return self.request(Route(LIST_GUILD_STICKERS, guild_id=guild_id))
 
     def get_guild_sticker(self, guild_id: dt.Snowflake, sticker_id: dt.Snowflake):
-        return self.request(
-            Route(
-                "GET",
-                "/guilds/{guild_id}/stickers/{sticker_id}",
-                guild_id=guild_id,
-                sticker_id=sticker_id,
-            )
-        )
+        return self.request(Route(GET_GUILD_STICKER, guild_id=guild_id, sticker_id=sticker_id))
 
     def create_guild_sticker(
         self,
@@ -50,9 +51,7 @@ class StickerEndpoints(EndpointMixin):
         form_data.add_field("description", description)
         form_data.add_field("tags", tags)
         form_data.add_field("file", file.fp, content_type=file.content_type)
-        return self.request(
-            Route("POST", "/guilds/{guild_id}/stickers", guild_id=guild_id), data=form_data
-        )
+        return self.request(Route(CREATE_GUILD_STICKER, guild_id=guild_id), data=form_data)
 
     def modify_guild_sticker(
         self,
@@ -65,12 +64,7 @@ class StickerEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route(
-                "PATCH",
-                "/guilds/{guild_id}/stickers/{sticker_id}",
-                guild_id=guild_id,
-                sticker_id=sticker_id,
-            ),
+            Route(MODIFY_GUILD_STICKER, guild_id=guild_id, sticker_id=sticker_id),
             json_params={"name": name, "description": description, "tags": tags},
             reason=reason,
         )
@@ -79,11 +73,5 @@ class StickerEndpoints(EndpointMixin):
         self, guild_id: dt.Snowflake, sticker_id: dt.Snowflake, reason: t.Optional[str] = None
     ):
         return self.request(
-            Route(
-                "DELETE",
-                "/guilds/{guild_id}/stickers/{sticker_id}",
-                guild_id=guild_id,
-                sticker_id=sticker_id,
-            ),
-            reason=reason,
+            Route(DELETE_GUILD_STICKER, guild_id=guild_id, sticker_id=sticker_id), reason=reason
         )
@@ -7,24 +7,33 @@ import typing as t
 import discord_typings as dt
 
 from ...types import Unset, UnsetOr
-from ..route import Route
+from ..route import Route, RouteTemplate
 from .core import EndpointMixin
 
 __all__ = ("UserEndpoints",)
 
+GET_CURRENT_USER = RouteTemplate("GET", "/users/@me")
+GET_USER = RouteTemplate("GET", "/users/{user_id}")
+MODIFY_CURRENT_USER = RouteTemplate("PATCH", "/users/@me")
+GET_CURRENT_USER_GUILDS = RouteTemplate("GET", "/users/@me/guilds")
+GET_CURRENT_USER_GUILD_MEMBER = RouteTemplate("GET", "/users/@me/guilds/{guild_id}/member")
+LEAVE_GUILD = RouteTemplate("DELETE", "/users/@me/guilds/{guild_id}")
+CREATE_DM = RouteTemplate("POST", "/users/@me/channels")
+GET_USER_CONNECTIONS = RouteTemplate("GET", "/users/@me/connections")
+
 
 class UserEndpoints(EndpointMixin):
     def get_current_user(self):
-        return self.request(Route("GET", "/users/@me"))
+        return self.request(Route(GET_CURRENT_USER))
 
     def get_user(self, user_id: dt.Snowflake):
-        return self.request(Route("GET", "/users/{user_id}", user_id=user_id))
+        return self.request(Route(GET_USER, user_id=user_id))
 
     def modify_current_user(
         self, *, username: UnsetOr[str] = Unset, avatar: UnsetOr[t.Optional[str]] = Unset
     ):
         return self.request(
-            Route("PATCH", "/users/@me"), json_params={"username": username, "avatar": avatar}
+            Route(MODIFY_CURRENT_USER), json_params={"username": username, "avatar": avatar}
         )
 
     def get_current_user_guilds(
@@ -35,20 +44,18 @@ class UserEndpoints(EndpointMixin):
         limit: int = 200,
     ):
         return self.request(
-            Route("GET", "/users/@me/guilds"),
+            Route(GET_CURRENT_USER_GUILDS),
             query_params={"before": before, "after": after, "limit": limit},
         )
 
     def get_current_user_guild_member(self, guild_id: dt.Snowflake):
-        return self.request(Route("GET", "/users/@me/guilds/{guild_id}/member", guild_id=guild_id))
+        return self.request(Route(GET_CURRENT_USER_GUILD_MEMBER, guild_id=guild_id))
 
     def leave_guild(self, guild_id: dt.Snowflake):
-        return self.request(Route("DELETE", "/users/@me/guilds/{guild_id}", guild_id=guild_id))
+        return self.request(Route(LEAVE_GUILD, guild_id=guild_id))
 
     def create_dm(self, *, recipient_id: dt.Snowflake):
-        return self.request(
-            Route("POST", "/users/@me/channels"), json_params={"recipient_id": recipient_id}
-        )
+        return self.request(Route(CREATE_DM), json_params={"recipient_id": recipient_id})
 
     def get_user_connections(self):
-        return self.request(Route("GET", "/users/@me/connections"))
+        return self.request(Route(GET_USER_CONNECTIONS))
@@ -3,12 +3,14 @@
 # this file was auto-generated by scripts/generate_endpoints.py
 
 
-from ..route import Route
+from ..route import Route, RouteTemplate
 from .core import EndpointMixin
 
 __all__ = ("VoiceEndpoints",)
 
+LIST_VOICE_REGIONS = RouteTemplate("GET", "/voice/regions")
+
 
 class VoiceEndpoints(EndpointMixin):
     def list_voice_regions(self):
-        return self.request(Route("GET", "/voice/regions"))
+        return self.request(Route(LIST_VOICE_REGIONS))
@@ -8,11 +8,31 @@ import discord_typings as dt
 
 from ...file import BasicFile
 from ...types import Unset, UnsetOr
-from ..route import Route
+from ..route import Route, RouteTemplate
 from .core import EndpointMixin
 
 __all__ = ("WebhookEndpoints",)
 
+CREATE_WEBHOOK = RouteTemplate("POST", "/channels/{channel_id}/webhooks")
+GET_CHANNEL_WEBHOOKS = RouteTemplate("GET", "/channels/{channel_id}/webhooks")
+GET_GUILD_WEBHOOKS = RouteTemplate("GET", "/guilds/{guild_id}/webhooks")
+GET_WEBHOOK = RouteTemplate("GET", "/webhooks/{webhook_id}")
+GET_WEBHOOK_WITH_TOKEN = RouteTemplate("GET", "/webhooks/{webhook_id}/{webhook_token}")
+MODIFY_WEBHOOK = RouteTemplate("PATCH", "/webhooks/{webhook_id}")
+MODIFY_WEBHOOK_WITH_TOKEN = RouteTemplate("PATCH", "/webhooks/{webhook_id}/{webhook_token}")
+DELETE_WEBHOOK = RouteTemplate("DELETE", "/webhooks/{webhook_id}")
+DELETE_WEBHOOK_WITH_TOKEN = RouteTemplate("DELETE", "/webhooks/{webhook_id}/{webhook_token}")
+EXECUTE_WEBHOOK = RouteTemplate("POST", "/webhooks/{webhook_id}/{webhook_token}")
+GET_WEBHOOK_MESSAGE = RouteTemplate(
+    "GET", "/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}"
+)
+EDIT_WEBHOOK_MESSAGE = RouteTemplate(
+    "PATCH", "/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}"
+)
+DELETE_WEBHOOK_MESSAGE = RouteTemplate(
+    "DELETE", "/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}"
+)
+
 
 class WebhookEndpoints(EndpointMixin):
     def create_webhook(
@@ -24,28 +44,23 @@ class WebhookEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("POST", "/channels/{channel_id}/webhooks", channel_id=channel_id),
+            Route(CREATE_WEBHOOK, channel_id=channel_id),
             json_params={"name": name, "avatar": avatar},
             reason=reason,
         )
 
     def get_channel_webhooks(self, channel_id: dt.Snowflake):
-        return self.request(Route("GET", "/channels/{channel_id}/webhooks", channel_id=channel_id))
+        return self.request(Route(GET_CHANNEL_WEBHOOKS, channel_id=channel_id))
 
     def get_guild_webhooks(self, guild_id: dt.Snowflake):
-        return self.request(Route("GET", "/guilds/{guild_id}/webhooks", guild_id=guild_id))
+        return self.request(Route(GET_GUILD_WEBHOOKS, guild_id=guild_id))
 
     def get_webhook(self, webhook_id: dt.Snowflake):
-        return self.request(Route("GET", "/webhooks/{webhook_id}", webhook_id=webhook_id))
+        return self.request(Route(GET_WEBHOOK, webhook_id=webhook_id))
 
     def get_webhook_with_token(self, webhook_id: dt.Snowflake, webhook_token: str):
         return self.request(
-            Route(
-                "GET",
-                "/webhooks/{webhook_id}/{webhook_token}",
-                webhook_id=webhook_id,
-                webhook_token=webhook_token,
-            )
+            Route(GET_WEBHOOK_WITH_TOKEN, webhook_id=webhook_id, webhook_token=webhook_token)
         )
 
     def modify_webhook(
@@ -58,7 +73,7 @@ class WebhookEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route("PATCH", "/webhooks/{webhook_id}", webhook_id=webhook_id),
+            Route(MODIFY_WEBHOOK, webhook_id=webhook_id),
             json_params={"name": name, "avatar": avatar, "channel_id": channel_id},
             reason=reason,
         )
@@ -73,31 +88,19 @@ class WebhookEndpoints(EndpointMixin):
         reason: t.Optional[str] = None,
     ):
         return self.request(
-            Route(
-                "PATCH",
-                "/webhooks/{webhook_id}/{webhook_token}",
-                webhook_id=webhook_id,
-                webhook_token=webhook_token,
-            ),
+            Route(MODIFY_WEBHOOK_WITH_TOKEN, webhook_id=webhook_id, webhook_token=webhook_token),
             json_params={"name": name, "avatar": avatar},
             reason=reason,
         )
 
     def delete_webhook(self, webhook_id: dt.Snowflake, reason: t.Optional[str] = None):
-        return self.request(
-            Route("DELETE", "/webhooks/{webhook_id}", webhook_id=webhook_id), reason=reason
-        )
+        return self.request(Route(DELETE_WEBHOOK, webhook_id=webhook_id), reason=reason)
 
     def delete_webhook_with_token(
         self, webhook_id: dt.Snowflake, webhook_token: str, reason: t.Optional[str] = None
     ):
         return self.request(
-            Route(
-                "DELETE",
-                "/webhooks/{webhook_id}/{webhook_token}",
-                webhook_id=webhook_id,
-                webhook_token=webhook_token,
-            ),
+            Route(DELETE_WEBHOOK_WITH_TOKEN, webhook_id=webhook_id, webhook_token=webhook_token),
             reason=reason,
         )
 
@@ -121,12 +124,7 @@ class WebhookEndpoints(EndpointMixin):
         files: UnsetOr[list[BasicFile]] = Unset,
     ):
         return self.request(
-            Route(
-                "POST",
-                "/webhooks/{webhook_id}/{webhook_token}",
-                webhook_id=webhook_id,
-                webhook_token=webhook_token,
-            ),
+            Route(EXECUTE_WEBHOOK, webhook_id=webhook_id, webhook_token=webhook_token),
             json_params={
                 "content": content,
                 "username": username,
@@ -153,8 +151,7 @@ class WebhookEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "GET",
-                "/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}",
+                GET_WEBHOOK_MESSAGE,
                 webhook_id=webhook_id,
                 webhook_token=webhook_token,
                 message_id=message_id,
@@ -178,8 +175,7 @@ class WebhookEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "PATCH",
-                "/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}",
+                EDIT_WEBHOOK_MESSAGE,
                 webhook_id=webhook_id,
                 webhook_token=webhook_token,
                 message_id=message_id,
@@ -205,8 +201,7 @@ class WebhookEndpoints(EndpointMixin):
     ):
         return self.request(
             Route(
-                "DELETE",
-                "/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}",
+                DELETE_WEBHOOK_MESSAGE,
                 webhook_id=webhook_id,
                 webhook_token=webhook_token,
                 message_id=message_id,
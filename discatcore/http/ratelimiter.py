@@ -1,40 +1,59 @@
 # SPDX-License-Identifier: MIT
 
+import asyncio
+import logging
+import time
 import typing as t
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from aiohttp import ClientResponse
 
-from ..utils.ratelimit import BurstRatelimiter, ManualRatelimiter
+from ..utils.ratelimit import PermitRatelimiter
+from .bucket_store import BaseBucketHashStore
 
 __all__ = (
     "Bucket",
+    "GlobalRatelimiter",
+    "RatelimiterStats",
     "Ratelimiter",
 )
 
+_log = logging.getLogger(__name__)
 
-class Bucket(BurstRatelimiter):
+BucketKey = tuple[str, tuple[str, ...]]
+
+
+class Bucket(PermitRatelimiter):
     """Represents a bucket in the Discord API.
 
+    Every request takes a permit from the bucket before it is sent, so a bucket never lets more requests
+    through than Discord allows in one window. Until the first response arrives, only one request is sent
+    at a time.
+
     Attributes:
         reset (t.Optional[datetime.datetime]): The raw timestamp (processed into a datetime) when the bucket will reset.
             Defaults to None.
         bucket (t.Optional[str]): The hash denoting this bucket. This value is straight from the Discord API.
             Defaults to None.
+        last_used (float): When (in :func:`time.monotonic` seconds) this bucket was last handed out by
+            :class:`Ratelimiter`.
     """
 
     __slots__ = (
         "reset",
         "bucket",
-        "_first_update",
+        "last_used",
     )
 
     def __init__(self) -> None:
-        BurstRatelimiter.__init__(self)
+        PermitRatelimiter.__init__(self)
 
         self.reset: t.Optional[datetime] = None
         self.bucket: t.Optional[str] = None
-        self._first_update: bool = True
+        self.last_used: float = time.monotonic()
 
     def update_info(self, response: ClientResponse) -> None:
         """Updates the bucket's underlying information via the new headers.
@@ -42,68 +61,408 @@ class Bucket(BurstRatelimiter):
         Args:
             response (aiohttp.ClientResponse): The response to update the bucket information with.
         """
-        self.limit = int(response.headers.get("X-RateLimit-Limit", 1))
-        raw_remaining = response.headers.get("X-RateLimit-Remaining")
-
-        if response.status == 429:
-            self.remaining = 0
-        elif raw_remaining is None:
-            self.remaining = 1
-        else:
-            converted_remaining = int(raw_remaining)
-
-            if self._first_update:
-                self.remaining = converted_remaining
-            elif self.remaining is not None:
-                self.remaining = (
-                    converted_remaining if converted_remaining < self.remaining else self.remaining
-                )
-
-        raw_reset = response.headers.get("X-RateLimit-Reset")
+        self.update_headers(response.status, response.headers)
+
+    def update_headers(self, status: int, headers: Mapping[str, str]) -> None:
+        """Updates the bucket's underlying information via the headers of a response.
+
+        Args:
+            status (int): The status code of the response.
+            headers (Mapping[str, str]): The headers of the response. Only the ``X-RateLimit-*`` headers are used.
+        """
+        raw_limit = headers.get("X-RateLimit-Limit")
+        if raw_limit is None:
+            # successful responses without ratelimit headers come from routes that are not ratelimited
+            if 200 <= status < 300:
+                self.update(None, None, None)
+            return
+
+        raw_remaining = headers.get("X-RateLimit-Remaining")
+        remaining = int(raw_remaining) if raw_remaining is not None else None
+        if status == 429:
+            remaining = 0
+
+        raw_reset = headers.get("X-RateLimit-Reset")
         if raw_reset is not None:
             self.reset = datetime.fromtimestamp(float(raw_reset), timezone.utc)
 
-        raw_reset_after = response.headers.get("X-RateLimit-Reset-After")
-        if raw_reset_after is not None:
-            raw_reset_after = float(raw_reset_after)
+        raw_reset_after = headers.get("X-RateLimit-Reset-After")
+        reset_after = float(raw_reset_after) if raw_reset_after is not None else None
+
+        raw_bucket = headers.get("X-RateLimit-Bucket")
+        if raw_bucket is not None:
+            self.bucket = raw_bucket
+
+        self.update(int(raw_limit), remaining, reset_after)
+
+
+class GlobalRatelimiter:
+    """Represents the global ratelimit of a bot, which applies to every request no matter the bucket.
+
+    Discord allows 50 requests per second by default, although large bots can have this limit raised. Every
+    request takes a permit before it is sent and gives it back once the response arrives (see
+    :meth:`.release`). A request is only let through if fewer than ``limit`` permits were taken in the last
+    ``per`` seconds. If a global 429 comes in anyway (for example because other processes use the same
+    token), :meth:`.lock_for` holds back every request. Waiters are served in FIFO order.
+
+    The time every request spends waiting is kept, so it is visible when the global limit becomes the
+    bottleneck.
+
+    Args:
+        limit (int): The amount of requests that can be sent every ``per`` seconds. Defaults to 50.
+        per (float): How long (in seconds) the window of the limit lasts. Defaults to 1 second.
+        window (int): The amount of recent queueing delays to keep. Defaults to 100.
+
+    Attributes:
+        limit (int): The amount of requests that can be sent every ``per`` seconds.
+        per (float): How long (in seconds) the window of the limit lasts.
+        delays (deque[float]): The queueing delays (in seconds) of the most recent requests.
+        max_delay (float): The longest queueing delay (in seconds) seen so far.
+    """
+
+    __slots__ = (
+        "limit",
+        "per",
+        "delays",
+        "max_delay",
+        "_in_flight",
+        "_taken",
+        "_locked_until",
+        "_waiters",
+        "_task",
+    )
+
+    def __init__(self, limit: int = 50, per: float = 1.0, *, window: int = 100) -> None:
+        if limit <= 0:
+            raise ValueError("limit parameter cannot be negative or 0!")
+
+        self.limit: int = limit
+        self.per: float = per
+        self.delays: deque[float] = deque(maxlen=window)
+        self.max_delay: float = 0.0
+        self._in_flight: int = 0
+        # when the permits of the current window were taken, oldest first
+        self._taken: deque[float] = deque()
+        self._locked_until: float = 0.0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._task: t.Optional[asyncio.Task[None]] = None
+
+    @property
+    def in_flight(self) -> int:
+        """The amount of permits that have been taken and not given back yet."""
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        """The amount of requests waiting for a permit."""
+        return len(self._waiters)
+
+    @property
+    def delay(self) -> float:
+        """The average queueing delay (in seconds) of the most recent requests."""
+        if not self.delays:
+            return 0.0
+        return sum(self.delays) / len(self.delays)
+
+    def _next_send(self, now: float) -> float:
+        while self._taken and self._taken[0] + self.per <= now:
+            self._taken.popleft()
+
+        if self._locked_until > now:
+            return self._locked_until
+        if len(self._taken) < self.limit:
+            return now
+        return self._taken[0] + self.per
+
+    def _take(self, now: float) -> None:
+        self._in_flight += 1
+        self._taken.append(now)
+
+    def is_locked(self) -> bool:
+        """Returns whether a request would have to wait for a permit."""
+        now = time.monotonic()
+        return bool(self._waiters) or self._next_send(now) != now
+
+    def lock_for(self, delay: float) -> None:
+        """Holds back every request for ``delay`` seconds, after a global 429.
+
+        Args:
+            delay (float): How long (in seconds) to hold back requests for.
+        """
+        self._locked_until = max(self._locked_until, time.monotonic() + delay)
+
+    async def acquire(self) -> None:
+        """Waits until a request can be sent without going over the global limit, and takes a permit."""
+        start = time.monotonic()
+        if not self._waiters and self._next_send(start) == start:
+            self._take(start)
+            self.delays.append(0.0)
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._wake_waiters())
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # the permit was handed out right before the acquire was cancelled
+                self._in_flight -= 1
+            raise
+
+        delay = time.monotonic() - start
+        self.delays.append(delay)
+        if delay > self.max_delay:
+            self.max_delay = delay
+        _log.debug("Waited %f seconds for the global ratelimit.", delay)
+
+    def release(self) -> None:
+        """Gives a permit back once the request it was taken for is done.
+        The permit keeps counting against the window it was taken in.
+        """
+        self._in_flight -= 1
+
+    async def _wake_waiters(self) -> None:
+        while self._waiters:
+            future = self._waiters[0]
+            if future.done():
+                # the waiter was cancelled
+                self._waiters.popleft()
+                continue
 
-            if self.reset_after is None:
-                self.reset_after = raw_reset_after
-            else:
-                self.reset_after = (
-                    raw_reset_after if self.reset_after < raw_reset_after else self.reset_after
-                )
+            now = time.monotonic()
+            next_send = self._next_send(now)
+            if next_send == now:
+                self._waiters.popleft()
+                self._take(now)
+                future.set_result(None)
+                continue
 
-        raw_bucket = response.headers.get("X-RateLimit-Bucket")
-        self.bucket = raw_bucket
+            await asyncio.sleep(next_send - now)
 
-        if self._first_update:
-            self._first_update = False
+    async def __aenter__(self) -> None:
+        await self.acquire()
+        return None
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        self.release()
+
+
+@dataclass
+class RatelimiterStats:
+    """A snapshot of the buckets of a :class:`Ratelimiter`.
+
+    Attributes:
+        buckets (int): The amount of buckets that are tracked.
+        active (int): The amount of buckets with requests that are in flight or waiting.
+        waiting (int): The amount of requests waiting for a permit across every bucket.
+        created (int): The amount of buckets created since the ratelimiter was created.
+        evicted (int): The amount of idle buckets thrown away since the ratelimiter was created.
+        global_waiting (int): The amount of requests waiting for the global ratelimit.
+        global_delay (float): The average time (in seconds) recent requests waited for the global ratelimit.
+        global_max_delay (float): The longest time (in seconds) a request waited for the global ratelimit.
+    """
+
+    buckets: int
+    active: int
+    waiting: int
+    created: int
+    evicted: int
+    global_waiting: int
+    global_delay: float
+    global_max_delay: float
 
 
 class Ratelimiter:
     """Represents the global ratelimiter.
 
+    Buckets are created on demand, which means a bot in a lot of guilds would keep on adding buckets. To keep
+    memory in check, buckets that have not been used for ``idle_timeout`` seconds are thrown away, as long
+    as they are idle (see :meth:`PermitRatelimiter.is_idle`). If there are more than ``max_buckets`` buckets,
+    then the least recently used idle buckets are thrown away first.
+
+    Discord groups routes into buckets, which are identified by the hash in ``X-RateLimit-Bucket``. Every
+    route key (see :attr:`RouteTemplate.key`) is mapped to the hash it was last seen with, and every bucket
+    hash and set of major parameters (see :attr:`Route.major_params`) is mapped to a bucket. This way,
+    routes that share a bucket also share its ratelimit. Routes without a known hash get a bucket of their own
+    until the first response comes in.
+
+    Args:
+        global_limit (int): The amount of requests that can be sent every second, no matter the bucket.
+            Defaults to 50, which is the limit Discord sets unless it was raised for the bot.
+        idle_timeout (float): How long (in seconds) a bucket has to be unused before it can be thrown away.
+            Defaults to 300 seconds.
+        max_buckets (t.Optional[int]): The amount of buckets to keep at most. Buckets that are in use are
+            never thrown away, so this can be exceeded temporarily. Set this to None to only throw away
+            buckets based on ``idle_timeout``. Defaults to 10000.
+        hash_store (t.Optional[BaseBucketHashStore]): The store to keep the bucket hashes in, so they are
+            known after a restart. Defaults to None.
+
     Attributes:
-        buckets: A mapping of route urls and bucket hashes to buckets.
-        global_bucket: The global bucket. Used for requests that involve global 429s.
+        buckets: A mapping of bucket hashes (or route keys if the hash is unknown) and major parameters to buckets.
+        hashes (dict[str, str]): A mapping of route keys to bucket hashes.
+        global_bucket (GlobalRatelimiter): The global ratelimit, which every request passes through.
+        idle_timeout (float): How long (in seconds) a bucket has to be unused before it can be thrown away.
+        max_buckets (t.Optional[int]): The amount of buckets to keep at most.
+        hash_store (t.Optional[BaseBucketHashStore]): The store to keep the bucket hashes in.
     """
 
-    __slots__ = ("buckets", "global_bucket")
+    __slots__ = (
+        "buckets",
+        "hashes",
+        "global_bucket",
+        "idle_timeout",
+        "max_buckets",
+        "hash_store",
+        "_next_sweep",
+        "_created",
+        "_evicted",
+    )
 
-    def __init__(self) -> None:
-        self.buckets: dict[tuple[str, t.Optional[str]], Bucket] = {}
-        self.global_bucket = ManualRatelimiter()
+    def __init__(
+        self,
+        *,
+        global_limit: int = 50,
+        idle_timeout: float = 300.0,
+        max_buckets: t.Optional[int] = 10000,
+        hash_store: t.Optional[BaseBucketHashStore] = None,
+    ) -> None:
+        self.buckets: dict[BucketKey, Bucket] = {}
+        self.hashes: dict[str, str] = hash_store.load() if hash_store is not None else {}
+        self.global_bucket: GlobalRatelimiter = GlobalRatelimiter(global_limit)
+        self.idle_timeout: float = idle_timeout
+        self.max_buckets: t.Optional[int] = max_buckets
+        self.hash_store: t.Optional[BaseBucketHashStore] = hash_store
+        self._next_sweep: float = time.monotonic() + idle_timeout
+        self._created: int = 0
+        self._evicted: int = 0
 
-    def get_bucket(self, key: tuple[str, t.Optional[str]]) -> Bucket:
+    def get_bucket(self, key: BucketKey) -> Bucket:
         """Gets a bucket object with the provided key.
 
         Args:
-            key: The key to grab the bucket with. This key is in the format (route_url, bucket_hash).
+            key: The key to grab the bucket with. This key is in the format (bucket_hash, major_params),
+                or (route_key, major_params) if the bucket hash of the route is unknown.
+        """
+        now = time.monotonic()
+        bucket = self.buckets.get(key)
+
+        if bucket is None:
+            # sweep before the new bucket is added, since it is idle and could be thrown away right away
+            if now >= self._next_sweep or (
+                self.max_buckets is not None and len(self.buckets) > self.max_buckets
+            ):
+                self.sweep()
+
+            bucket = Bucket()
+            self.buckets[key] = bucket
+            self._created += 1
+
+        bucket.last_used = now
+        return bucket
+
+    def get_route_bucket(self, route_key: str, major_params: tuple[str, ...]) -> Bucket:
+        """Gets the bucket a route belongs to.
+
+        Args:
+            route_key (str): The key of the route (see :attr:`RouteTemplate.key`).
+            major_params (tuple[str, ...]): The major parameters of the route (see :attr:`Route.major_params`).
         """
-        if key not in self.buckets:
-            new_bucket = Bucket()
-            self.buckets[key] = new_bucket
-            new_bucket.bucket = key[1]
+        bucket_hash = self.hashes.get(route_key)
+        if bucket_hash is None:
+            return self.get_bucket((route_key, major_params))
+
+        bucket = self.get_bucket((bucket_hash, major_params))
+        bucket.bucket = bucket_hash
+        return bucket
+
+    async def acquire(self, route_key: str, major_params: tuple[str, ...]) -> Bucket:
+        """Takes a permit from the bucket a route belongs to. The permit has to be given back with
+        :meth:`Bucket.release` once the request is done.
+
+        Args:
+            route_key (str): The key of the route (see :attr:`RouteTemplate.key`).
+            major_params (tuple[str, ...]): The major parameters of the route (see :attr:`Route.major_params`).
+
+        Returns:
+            The bucket the permit was taken from.
+        """
+        while True:
+            bucket = self.get_route_bucket(route_key, major_params)
+            await bucket.acquire()
+            if self.get_route_bucket(route_key, major_params) is bucket:
+                return bucket
+
+            # the bucket hash of the route was learned while waiting, so the permit belongs to the shared bucket
+            bucket.release(used=False)
+
+    def learn_hash(self, route_key: str, major_params: tuple[str, ...], bucket_hash: str) -> Bucket:
+        """Maps a route to the bucket hash Discord responded with.
+
+        Args:
+            route_key (str): The key of the route (see :attr:`RouteTemplate.key`).
+            major_params (tuple[str, ...]): The major parameters of the route (see :attr:`Route.major_params`).
+            bucket_hash (str): The value of the ``X-RateLimit-Bucket`` header.
+
+        Returns:
+            The bucket the route belongs to from now on.
+        """
+        if self.hashes.get(route_key) != bucket_hash:
+            _log.debug("Route %s belongs to bucket %s.", route_key, bucket_hash)
+            self.hashes[route_key] = bucket_hash
+            if self.hash_store is not None:
+                # this only happens the first time a route is requested, or if Discord moves it
+                self.hash_store.save(self.hashes)
+
+        return self.get_route_bucket(route_key, major_params)
+
+    def sweep(self) -> int:
+        """Throws away buckets that have been idle for too long. If there are more than :attr:`max_buckets`
+        buckets, then the least recently used idle buckets are thrown away too, until there is some room
+        for new buckets again. This is done automatically when buckets are created.
+
+        Returns:
+            The amount of buckets thrown away.
+        """
+        now = time.monotonic()
+        cutoff = now - self.idle_timeout
+        self._next_sweep = now + self.idle_timeout
+
+        idle = [(bucket.last_used, key) for key, bucket in self.buckets.items() if bucket.is_idle()]
+        evicted = [key for last_used, key in idle if last_used <= cutoff]
+
+        if self.max_buckets is not None and len(self.buckets) - len(evicted) > self.max_buckets:
+            # leave some room, so the next few new buckets don't cause another sweep each
+            over = len(self.buckets) - len(evicted) - self.max_buckets * 9 // 10
+            recent = sorted((item for item in idle if item[0] > cutoff), key=lambda item: item[0])
+            evicted.extend(key for _, key in recent[:over])
+
+        for key in evicted:
+            del self.buckets[key]
+
+        self._evicted += len(evicted)
+        if evicted:
+            _log.debug("Evicted %d idle buckets, %d are left.", len(evicted), len(self.buckets))
+        return len(evicted)
+
+    def stats(self) -> RatelimiterStats:
+        """Returns a snapshot of the buckets of this ratelimiter."""
+        active = 0
+        waiting = 0
+        for bucket in self.buckets.values():
+            if bucket.in_flight or bucket.waiting:
+                active += 1
+                waiting += bucket.waiting
 
-        return self.buckets[key]
+        return RatelimiterStats(
+            buckets=len(self.buckets),
+            active=active,
+            waiting=waiting,
+            created=self._created,
+            evicted=self._evicted,
+            global_waiting=self.global_bucket.waiting,
+            global_delay=self.global_bucket.delay,
+            global_max_delay=self.global_bucket.max_delay,
+        )
@@ -1,25 +1,126 @@
 # SPDX-License-Identifier: MIT
 
+import functools
+import string
 import typing as t
 from urllib.parse import quote as _urlquote
 
 import discord_typings as dt
 
-__all__ = ("Route",)
+__all__ = (
+    "RouteTemplate",
+    "Route",
+)
 
+# the parameters that split a route into separate buckets
+_TOP_LEVEL_PARAMS: t.Final[frozenset[str]] = frozenset(
+    ("guild_id", "channel_id", "webhook_id", "webhook_token")
+)
 
-class Route:
-    """Represents a Discord API route. This implements helpful methods that the internals use.
+
+class RouteTemplate:
+    """Represents the raw, unformatted url of a Discord API route, compiled once so routes created from it
+    don't have to parse the url again.
 
     Args:
         method (str): The method of this REST API route.
         url (str): The raw, unformatted url of this REST API route.
+
+    Attributes:
+        method (str): The method of this REST API route.
+        url (str): The raw, unformatted url of this REST API route.
+        key (str): The method and the raw url of this route, which identifies the route. For example,
+            ``"GET /channels/{channel_id}"``.
+        params (tuple[str, ...]): The names of the parameters in the url, in order.
+        top_level_params (tuple[str, ...]): The names of the top-level parameters in the url, in order.
+    """
+
+    __slots__ = ("method", "url", "key", "params", "top_level_params", "_segments", "_tail")
+
+    def __init__(self, method: str, url: str) -> None:
+        self.method: str = method
+        self.url: str = url
+        self.key: str = f"{method} {url}"
+
+        # the url split into (literal, parameter name, is top-level) slots, followed by the literal tail
+        segments: list[tuple[str, str, bool]] = []
+        tail = ""
+        for literal, name, _, _ in string.Formatter().parse(url):
+            if name is None:
+                tail = literal
+            else:
+                segments.append((literal, name, name in _TOP_LEVEL_PARAMS))
+
+        self._segments: tuple[tuple[str, str, bool], ...] = tuple(segments)
+        self._tail: str = tail
+        self.params: tuple[str, ...] = tuple(name for _, name, _ in segments)
+        self.top_level_params: tuple[str, ...] = tuple(
+            name for _, name, top_level in segments if top_level
+        )
+
+    def format(self, params: dict[str, t.Any]) -> tuple[str, str, tuple[str, ...]]:
+        """Fills parameters into this template. The formatted url, the pseudo-bucket and the values of the
+        top-level parameters are built in one pass.
+
+        Args:
+            params (dict[str, t.Any]): The parameters for the raw, unformatted url.
+
+        Returns:
+            The formatted url, the pseudo-bucket and the values of the top-level parameters.
+        """
+        endpoint: list[str] = []
+        bucket: list[str] = [self.method, ":"]
+        major: list[str] = []
+
+        for literal, name, top_level in self._segments:
+            value = params[name]
+            # snowflakes are the most common parameter, and they never need to be quoted
+            value = str(value) if top_level or type(value) is int else _urlquote(str(value))
+
+            endpoint.append(literal)
+            endpoint.append(value)
+            bucket.append(literal)
+            # only the top-level parameters are filled into the pseudo-bucket
+            if top_level:
+                bucket.append(value)
+                major.append(value)
+            else:
+                bucket.append("None")
+
+        endpoint.append(self._tail)
+        bucket.append(self._tail)
+        return "".join(endpoint), "".join(bucket), tuple(major)
+
+    def __repr__(self) -> str:
+        return f"<RouteTemplate method={self.method!r} url={self.url!r}>"
+
+
+@functools.lru_cache(maxsize=512)
+def _get_template(method: str, url: str) -> RouteTemplate:
+    return RouteTemplate(method, url)
+
+
+class Route:
+    """Represents a Discord API route. This implements helpful methods that the internals use.
+
+    The formatted url and the pseudo-bucket are generated once, when the route is created.
+
+    Args:
+        method (t.Union[str, RouteTemplate]): The method of this REST API route, or the template to create
+            this route from. If a template is provided, then ``url`` must be left out.
+        url (t.Optional[str]): The raw, unformatted url of this REST API route. Defaults to None.
         **params (t.Any): The parameters for the raw, unformatted url.
 
     Attributes:
+        template (RouteTemplate): The template of this route.
         params (dict[str, t.Any]): The parameters for the raw, unformatted url.
         method (str): The method of this REST API route.
         url (str): The raw, unformatted url of this REST API route.
+        endpoint (str): The formatted url for this route.
+        bucket (str): The pseudo-bucket that represents this route.
+            This is generated with the method and top level parameters filled into the raw url.
+        major_params (tuple[str, ...]): The values of the top-level parameters, in the order of the url.
+            Routes with the same bucket hash only share their ratelimit if these are the same.
         guild_id (t.Optional[dt.Snowflake]): If included, the guild id parameter.
             This is a top-level parameter, which influences the pseudo-bucket generated.
         channel_id (t.Optional[dt.Snowflake]): If included, the channel id parameter.
@@ -30,37 +131,49 @@ class Route:
             This is a top-level parameter, which influences the pseudo-bucket generated.
     """
 
-    def __init__(self, method: str, url: str, **params: t.Any) -> None:
-        self.params: dict[str, t.Any] = params
-        self.method: str = method
-        self.url: str = url
+    __slots__ = (
+        "template",
+        "params",
+        "endpoint",
+        "bucket",
+        "major_params",
+        "guild_id",
+        "channel_id",
+        "webhook_id",
+        "webhook_token",
+    )
+
+    def __init__(
+        self, method: t.Union[str, RouteTemplate], url: t.Optional[str] = None, **params: t.Any
+    ) -> None:
+        if isinstance(method, RouteTemplate):
+            self.template: RouteTemplate = method
+        elif url is not None:
+            self.template = _get_template(method, url)
+        else:
+            raise TypeError("url is required when a method is provided instead of a template!")
+
+        self.endpoint: str
+        self.bucket: str
+        self.major_params: tuple[str, ...]
+        self.endpoint, self.bucket, self.major_params = self.template.format(params)
 
         # top-level resource parameters
         self.guild_id: t.Optional[dt.Snowflake] = params.pop("guild_id", None)
         self.channel_id: t.Optional[dt.Snowflake] = params.pop("channel_id", None)
         self.webhook_id: t.Optional[dt.Snowflake] = params.pop("webhook_id", None)
         self.webhook_token: t.Optional[str] = params.pop("webhook_token", None)
+        self.params: dict[str, t.Any] = params
 
     @property
-    def endpoint(self) -> str:
-        """The formatted url for this route."""
-        top_level_params = {
-            k: getattr(self, k)
-            for k in ("guild_id", "channel_id", "webhook_id", "webhook_token")
-            if getattr(self, k) is not None
-        }
-        other_params = {k: _urlquote(str(v)) for k, v in self.params.items()}
-
-        return self.url.format_map({**top_level_params, **other_params})
+    def method(self) -> str:
+        """The method of this REST API route."""
+        return self.template.method
 
     @property
-    def bucket(self) -> str:
-        """The pseudo-bucket that represents this route. This is generated with the method and top level parameters filled into the raw url."""
-        top_level_params = {
-            k: getattr(self, k)
-            for k in ("guild_id", "channel_id", "webhook_id", "webhook_token")
-            if getattr(self, k) is not None
-        }
-        other_params = {k: None for k in self.params.keys()}
-
-        return f"{self.method}:{self.url.format_map({**top_level_params, **other_params})}"
+    def url(self) -> str:
+        """The raw, unformatted url of this REST API route."""
+        return self.template.url
+
+    def __repr__(self) -> str:
+        return f"<Route method={self.method!r} endpoint={self.endpoint!r}>"
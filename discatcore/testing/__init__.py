@@ -0,0 +1,14 @@
+"""
+discatcore.testing
+~~~~~~~~~~~~~~~~~~~~~
+
+Local stand-ins for the Discord API, used to test and benchmark `discatcore` without a network connection.
+This package is not imported by `discatcore` itself.
+"""
+
+from .gateway import *
+from .rest import *
+
+__all__ = ()
+__all__ += gateway.__all__
+__all__ += rest.__all__
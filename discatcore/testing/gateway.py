@@ -0,0 +1,348 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import pathlib
+import secrets
+import socket
+import time
+import typing as t
+import zlib
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+from aiohttp import WSMsgType, web
+
+from ..utils import etf
+from ..utils.json import dumps_bytes, loads
+
+__all__ = ("FakeGateway",)
+
+_log = logging.getLogger(__name__)
+
+DISPATCH = 0
+HEARTBEAT = 1
+IDENTIFY = 2
+RESUME = 6
+RECONNECT = 7
+INVALID_SESSION = 9
+HELLO = 10
+HEARTBEAT_ACK = 11
+
+
+@dataclass
+class _Session:
+    session_id: str
+    sequence: int = 0
+    # the index of the next dispatch to replay
+    position: int = 0
+
+
+class _Connection:
+    __slots__ = ("ws", "encoding", "compressor", "session", "replay_task", "close_code")
+
+    def __init__(self, ws: web.WebSocketResponse, encoding: str, compress: bool) -> None:
+        self.ws: web.WebSocketResponse = ws
+        self.encoding: str = encoding
+        self.compressor: t.Optional[t.Any] = zlib.compressobj() if compress else None
+        self.session: t.Optional[_Session] = None
+        self.replay_task: t.Optional[asyncio.Task[None]] = None
+        self.close_code: int = 1000
+
+    async def send(self, payload: Mapping[str, t.Any]) -> None:
+        data = etf.dumps(payload) if self.encoding == "etf" else dumps_bytes(payload)
+        if self.compressor is not None:
+            await self.ws.send_bytes(
+                self.compressor.compress(data) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+            )
+        elif self.encoding == "etf":
+            await self.ws.send_bytes(data)
+        else:
+            await self.ws.send_str(data.decode("utf-8"))
+
+
+class FakeGateway:
+    """A local stand-in for the Discord Gateway.
+
+    Clients connect to :attr:`.url` like they would to the real Gateway. The server sends HELLO, answers
+    IDENTIFY with READY and RESUME with RESUMED, acknowledges heartbeats, and then replays the dispatches
+    it was given. Sessions remember how far they were replayed, so a resumed session picks up where it left off.
+    The ``compress`` and ``encoding`` query parameters are honored (only zlib-stream is supported).
+
+    Args:
+        dispatches (Sequence[Mapping[str, t.Any]]): The dispatch payloads to replay after READY. Only the ``t``
+            and ``d`` keys are used, the sequence numbers are generated by the server. Defaults to no dispatches.
+        rate (t.Optional[float]): How many dispatches to send per second. Set this to None to send them as fast
+            as possible. Defaults to None.
+        heartbeat_interval (float): The heartbeat interval (in seconds) to send in HELLO. Defaults to 41.25 seconds.
+        ack_heartbeats (bool): Whether heartbeats should be acknowledged. Turn this off to simulate a zombified
+            connection. Defaults to True.
+        token (t.Optional[str]): The token clients have to identify with. If this is not provided, then every
+            token is accepted. Defaults to None.
+        host (str): The host to listen on. Defaults to "127.0.0.1".
+        port (int): The port to listen on. Defaults to 0, which picks a free port.
+
+    Attributes:
+        dispatches (Sequence[Mapping[str, t.Any]]): The dispatch payloads to replay after READY.
+        rate (t.Optional[float]): How many dispatches to send per second.
+        heartbeat_interval (float): The heartbeat interval (in seconds) to send in HELLO.
+        ack_heartbeats (bool): Whether heartbeats should be acknowledged.
+        token (t.Optional[str]): The token clients have to identify with.
+        connections (int): The amount of websocket connections made.
+        identifies (int): The amount of IDENTIFY payloads received.
+        resumes (int): The amount of RESUME payloads received.
+        heartbeats (int): The amount of HEARTBEAT payloads received.
+        dispatched (int): The amount of dispatch payloads sent.
+    """
+
+    __slots__ = (
+        "dispatches",
+        "rate",
+        "heartbeat_interval",
+        "ack_heartbeats",
+        "token",
+        "connections",
+        "identifies",
+        "resumes",
+        "heartbeats",
+        "dispatched",
+        "_host",
+        "_port",
+        "_runner",
+        "_sessions",
+        "_connections",
+        "_replayed",
+    )
+
+    def __init__(
+        self,
+        dispatches: Sequence[Mapping[str, t.Any]] = (),
+        *,
+        rate: t.Optional[float] = None,
+        heartbeat_interval: float = 41.25,
+        ack_heartbeats: bool = True,
+        token: t.Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.dispatches: Sequence[Mapping[str, t.Any]] = dispatches
+        self.rate: t.Optional[float] = rate
+        self.heartbeat_interval: float = heartbeat_interval
+        self.ack_heartbeats: bool = ack_heartbeats
+        self.token: t.Optional[str] = token
+        self.connections: int = 0
+        self.identifies: int = 0
+        self.resumes: int = 0
+        self.heartbeats: int = 0
+        self.dispatched: int = 0
+        self._host: str = host
+        self._port: int = port
+        self._runner: t.Optional[web.AppRunner] = None
+        self._sessions: dict[str, _Session] = {}
+        self._connections: set[_Connection] = set()
+        self._replayed: asyncio.Event = asyncio.Event()
+
+    @classmethod
+    def from_file(cls, path: t.Union[str, "pathlib.Path"], **kwargs: t.Any) -> FakeGateway:
+        """Creates a fake Gateway that replays recorded dispatches.
+
+        Args:
+            path (t.Union[str, pathlib.Path]): A JSON lines file with one Gateway payload per line.
+                Payloads that are not dispatches are ignored.
+            **kwargs (t.Any): Keyword arguments to pass into the constructor.
+
+        Returns:
+            The new fake Gateway.
+        """
+        payloads = [loads(line) for line in pathlib.Path(path).read_bytes().splitlines() if line]
+        return cls([payload for payload in payloads if payload.get("op") == DISPATCH], **kwargs)
+
+    @property
+    def url(self) -> str:
+        """The url to connect to. This is only available after :meth:`.start` is called."""
+        return f"ws://{self._host}:{self._port}/"
+
+    async def start(self) -> None:
+        """Starts listening for connections."""
+        app = web.Application()
+        app.router.add_get("/", self._handle)
+
+        # the socket is bound here so the port the OS picks is known
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind((self._host, self._port))
+        self._port = sock.getsockname()[1]
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.SockSite(self._runner, sock).start()
+        _log.info("Fake Gateway listening on %s.", self.url)
+
+    async def close(self) -> None:
+        """Closes every connection and stops listening."""
+        for connection in list(self._connections):
+            await connection.ws.close()
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> FakeGateway:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        await self.close()
+
+    async def wait_replayed(self) -> None:
+        """Waits until a connection has replayed every dispatch."""
+        await self._replayed.wait()
+
+    # Commands to every connected client
+
+    async def send_reconnect(self) -> None:
+        """Asks every connected client to reconnect."""
+        for connection in list(self._connections):
+            await connection.send({"op": RECONNECT, "d": None})
+
+    async def send_invalid_session(self, resumable: bool = False) -> None:
+        """Invalidates the session of every connected client.
+
+        Args:
+            resumable (bool): Whether the sessions can be resumed. Defaults to False.
+        """
+        for connection in list(self._connections):
+            if not resumable and connection.session is not None:
+                self._sessions.pop(connection.session.session_id, None)
+            await connection.send({"op": INVALID_SESSION, "d": resumable})
+
+    async def send_close(self, code: int = 4000) -> None:
+        """Closes the connection of every connected client.
+
+        Args:
+            code (int): The close code to close the connections with. Defaults to 4000.
+        """
+        for connection in list(self._connections):
+            connection.close_code = code
+            await connection.ws.close(code=code)
+
+    # Connection handling
+
+    async def _handle(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        connection = _Connection(
+            ws,
+            request.query.get("encoding", "json"),
+            request.query.get("compress") == "zlib-stream",
+        )
+        self._connections.add(connection)
+        self.connections += 1
+
+        try:
+            await connection.send(
+                {"op": HELLO, "d": {"heartbeat_interval": int(self.heartbeat_interval * 1000)}}
+            )
+
+            async for msg in ws:
+                msg_type = t.cast(WSMsgType, msg[0])
+                if msg_type == WSMsgType.TEXT:
+                    payload = loads(t.cast(str, msg[1]))
+                elif msg_type == WSMsgType.BINARY:
+                    payload = etf.loads(t.cast(bytes, msg[1]))
+                else:
+                    break
+
+                await self._handle_payload(connection, payload)
+        finally:
+            if connection.replay_task is not None:
+                connection.replay_task.cancel()
+            self._connections.discard(connection)
+
+        # the handler can finish before send_close() does, so it has to close with the same code
+        await ws.close(code=connection.close_code)
+
+        return ws
+
+    async def _handle_payload(self, connection: _Connection, payload: Mapping[str, t.Any]) -> None:
+        op = payload.get("op")
+        # only the data of identifies and resumes is read
+        data = t.cast(Mapping[str, t.Any], payload.get("d") or {})
+
+        if op == HEARTBEAT:
+            self.heartbeats += 1
+            if self.ack_heartbeats:
+                await connection.send({"op": HEARTBEAT_ACK})
+
+        elif op == IDENTIFY:
+            self.identifies += 1
+            if self.token is not None and data["token"] != self.token:
+                await connection.ws.close(code=4004, message=b"Authentication failed.")
+                return
+
+            session = _Session(secrets.token_hex(16))
+            self._sessions[session.session_id] = session
+            connection.session = session
+            session.sequence += 1
+            await connection.send(
+                {
+                    "op": DISPATCH,
+                    "t": "READY",
+                    "s": session.sequence,
+                    "d": {
+                        "v": 10,
+                        "user": {"id": "0", "username": "fake", "discriminator": "0000"},
+                        "guilds": [],
+                        "session_id": session.session_id,
+                        "resume_gateway_url": self.url,
+                        "shard": data.get("shard", [0, 1]),
+                        "application": {"id": "0", "flags": 0},
+                    },
+                }
+            )
+            self._start_replay(connection)
+
+        elif op == RESUME:
+            self.resumes += 1
+            session = self._sessions.get(data["session_id"])
+            if session is None:
+                await connection.send({"op": INVALID_SESSION, "d": False})
+                return
+
+            connection.session = session
+            session.sequence += 1
+            await connection.send({"op": DISPATCH, "t": "RESUMED", "s": session.sequence, "d": {}})
+            self._start_replay(connection)
+
+    def _start_replay(self, connection: _Connection) -> None:
+        if connection.replay_task is None:
+            connection.replay_task = asyncio.create_task(self._replay(connection))
+
+    async def _replay(self, connection: _Connection) -> None:
+        session = t.cast(_Session, connection.session)
+        start = time.monotonic()
+        sent = 0
+
+        while session.position < len(self.dispatches) and not connection.ws.closed:
+            if self.rate is not None:
+                delay = start + sent / self.rate - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            dispatch = self.dispatches[session.position]
+            session.position += 1
+            session.sequence += 1
+            await connection.send(
+                {"op": DISPATCH, "t": dispatch["t"], "s": session.sequence, "d": dispatch["d"]}
+            )
+            self.dispatched += 1
+            sent += 1
+
+            if self.rate is None and not sent % 100:
+                # let the other connections (and the heartbeats) through
+                await asyncio.sleep(0)
+
+        if not connection.ws.closed:
+            self._replayed.set()
@@ -0,0 +1,327 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import random
+import re
+import socket
+import time
+import typing as t
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+from aiohttp import web
+
+from ..utils.json import dumps
+
+__all__ = (
+    "BucketConfig",
+    "FakeREST",
+)
+
+_log = logging.getLogger(__name__)
+
+_PARAM = re.compile(r"{(\w+)}")
+# the parameters that split a route into separate buckets
+_MAJOR_PARAMS = ("guild_id", "channel_id", "webhook_id", "webhook_token")
+
+
+@dataclass
+class BucketConfig:
+    """The ratelimit of a route (or a group of routes) of :class:`FakeREST`.
+
+    Attributes:
+        limit (int): The amount of requests that can be made before the bucket resets. Defaults to 5.
+        reset_after (float): How long (in seconds) it takes for the bucket to reset. Defaults to 1 second.
+        hash (t.Optional[str]): The bucket hash sent in ``X-RateLimit-Bucket``. Routes with the same hash share
+            their ratelimit (for the same major parameters). If this is not provided, then a hash is generated
+            from the route. Defaults to None.
+    """
+
+    limit: int = 5
+    reset_after: float = 1.0
+    hash: t.Optional[str] = None
+
+
+@dataclass
+class _BucketState:
+    limit: int
+    remaining: int
+    reset_at: float
+
+
+class _Route:
+    __slots__ = ("key", "method", "pattern", "config", "hash")
+
+    def __init__(self, key: str, config: BucketConfig) -> None:
+        method, _, path = key.partition(" ")
+        self.key: str = key
+        self.method: str = method.upper()
+        # split() alternates between literal parts and parameter names
+        parts = _PARAM.split(path)
+        self.pattern: re.Pattern[str] = re.compile(
+            "".join(
+                re.escape(part) if i % 2 == 0 else f"(?P<{part}>[^/]+)"
+                for i, part in enumerate(parts)
+            )
+            + "$"
+        )
+        self.config: BucketConfig = config
+        self.hash: str = config.hash or hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+class FakeREST:
+    """A local stand-in for the Discord REST API that emulates its ratelimits.
+
+    Routes are declared as ``"METHOD /path/{param}"`` keys that map to a :class:`BucketConfig`. Every response
+    has the ``X-RateLimit-*`` headers Discord sends, and going over a limit returns a 429 with ``Retry-After``
+    and ``X-RateLimit-Scope``. Routes that are not declared use ``default_bucket``, with one bucket per path.
+
+    Point :class:`HTTPClient` at the server with ``HTTPClient(token, api_url=server.url)``.
+
+    Args:
+        routes (t.Optional[Mapping[str, BucketConfig]]): The declared routes. Defaults to None.
+        default_bucket (t.Optional[BucketConfig]): The ratelimit of routes that are not declared.
+            If this is not provided, then 5 requests per second are allowed. Defaults to None.
+        global_limit (t.Optional[int]): The amount of requests allowed per second across every route.
+            Set this to None to disable the global limit. Defaults to 50.
+        responses (t.Optional[Mapping[str, t.Any]]): The JSON bodies to respond with, by route key.
+            Routes without a response return an empty object. Defaults to None.
+        error_rate (float): The chance (between 0 and 1) of a request failing with a server error. Defaults to 0.
+        error_statuses (Sequence[int]): The server errors to fail requests with. Defaults to 500 and 502.
+        via_header (bool): Whether responses have a ``Via`` header. Without it, 429s look like Cloudflare bans.
+            Defaults to True.
+        gateway_url (str): The url returned from ``GET /gateway/bot``, for example the url of a
+            :class:`FakeGateway`. Defaults to "wss://gateway.discord.gg".
+        seed (t.Optional[int]): The seed for the server errors, so test runs can be repeated. Defaults to None.
+        host (str): The host to listen on. Defaults to "127.0.0.1".
+        port (int): The port to listen on. Defaults to 0, which picks a free port.
+
+    Attributes:
+        default_bucket (BucketConfig): The ratelimit of routes that are not declared.
+        global_limit (t.Optional[int]): The amount of requests allowed per second across every route.
+        error_rate (float): The chance (between 0 and 1) of a request failing with a server error.
+        error_statuses (Sequence[int]): The server errors to fail requests with.
+        via_header (bool): Whether responses have a ``Via`` header.
+        gateway_url (str): The url returned from ``GET /gateway/bot``.
+        requests (collections.Counter[str]): The amount of requests per route key.
+        ratelimited (collections.Counter[str]): The amount of 429s per scope ("user", "shared" or "global").
+        errors (int): The amount of server errors injected.
+    """
+
+    __slots__ = (
+        "default_bucket",
+        "global_limit",
+        "error_rate",
+        "error_statuses",
+        "via_header",
+        "gateway_url",
+        "requests",
+        "ratelimited",
+        "errors",
+        "_routes",
+        "_responses",
+        "_buckets",
+        "_global_window",
+        "_global_count",
+        "_random",
+        "_host",
+        "_port",
+        "_runner",
+    )
+
+    def __init__(
+        self,
+        routes: t.Optional[Mapping[str, BucketConfig]] = None,
+        *,
+        default_bucket: t.Optional[BucketConfig] = None,
+        global_limit: t.Optional[int] = 50,
+        responses: t.Optional[Mapping[str, t.Any]] = None,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = (500, 502),
+        via_header: bool = True,
+        gateway_url: str = "wss://gateway.discord.gg",
+        seed: t.Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self._routes: list[_Route] = [_Route(key, config) for key, config in (routes or {}).items()]
+        self.default_bucket: BucketConfig = default_bucket or BucketConfig()
+        self.global_limit: t.Optional[int] = global_limit
+        self._responses: Mapping[str, t.Any] = responses or {}
+        self.error_rate: float = error_rate
+        self.error_statuses: Sequence[int] = error_statuses
+        self.via_header: bool = via_header
+        self.gateway_url: str = gateway_url
+        self.requests: Counter[str] = Counter()
+        self.ratelimited: Counter[str] = Counter()
+        self.errors: int = 0
+        self._buckets: dict[tuple[str, tuple[str, ...]], _BucketState] = {}
+        self._global_window: float = 0.0
+        self._global_count: int = 0
+        self._random: random.Random = random.Random(seed)
+        self._host: str = host
+        self._port: int = port
+        self._runner: t.Optional[web.AppRunner] = None
+
+    @property
+    def routes(self) -> list[str]:
+        """The keys of the declared routes."""
+        return [route.key for route in self._routes]
+
+    @property
+    def url(self) -> str:
+        """The api url to pass into :class:`HTTPClient`. This is only available after :meth:`.start` is called."""
+        return f"http://{self._host}:{self._port}/api/v10"
+
+    async def start(self) -> None:
+        """Starts listening for requests."""
+        app = web.Application()
+        app.router.add_route("*", "/api/v{version}/{path:.*}", self._handle)
+
+        # the socket is bound here so the port the OS picks is known
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind((self._host, self._port))
+        self._port = sock.getsockname()[1]
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.SockSite(self._runner, sock).start()
+        _log.info("Fake REST API listening on %s.", self.url)
+
+    async def close(self) -> None:
+        """Stops listening for requests."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> FakeREST:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        await self.close()
+
+    # Request handling
+
+    def _match(self, method: str, path: str) -> tuple[str, BucketConfig, str, tuple[str, ...]]:
+        for route in self._routes:
+            if route.method != method:
+                continue
+
+            match = route.pattern.match(path)
+            if match is not None:
+                params = match.groupdict()
+                major = tuple(params[name] for name in _MAJOR_PARAMS if name in params)
+                return route.key, route.config, route.hash, major
+
+        key = f"{method} {path}"
+        return (
+            key,
+            self.default_bucket,
+            self.default_bucket.hash or hashlib.sha1(key.encode("utf-8")).hexdigest()[:16],
+            (),
+        )
+
+    def _headers(self, **headers: str) -> dict[str, str]:
+        if self.via_header:
+            headers["Via"] = "1.1 google"
+        return headers
+
+    def _ratelimited(self, scope: str, retry_after: float, **headers: str) -> web.Response:
+        self.ratelimited[scope] += 1
+        headers["Retry-After"] = f"{retry_after:.3f}"
+        headers["X-RateLimit-Scope"] = scope
+        if scope == "global":
+            headers["X-RateLimit-Global"] = "true"
+
+        return web.Response(
+            status=429,
+            text=dumps(
+                {
+                    "message": "You are being rate limited.",
+                    "retry_after": retry_after,
+                    "global": scope == "global",
+                }
+            ),
+            content_type="application/json",
+            headers=self._headers(**headers),
+        )
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        now = time.monotonic()
+        key, config, bucket_hash, major = self._match(
+            request.method, "/" + request.match_info["path"]
+        )
+        self.requests[key] += 1
+
+        if self.global_limit is not None:
+            if now - self._global_window >= 1.0:
+                self._global_window = now
+                self._global_count = 0
+
+            self._global_count += 1
+            if self._global_count > self.global_limit:
+                return self._ratelimited("global", self._global_window + 1.0 - now)
+
+        state = self._buckets.get((bucket_hash, major))
+        if state is None or now >= state.reset_at:
+            state = self._buckets[(bucket_hash, major)] = _BucketState(
+                config.limit, config.limit, now + config.reset_after
+            )
+
+        reset_after = state.reset_at - now
+        ratelimit_headers = {
+            "X-RateLimit-Limit": str(state.limit),
+            "X-RateLimit-Bucket": bucket_hash,
+            "X-RateLimit-Reset": f"{time.time() + reset_after:.3f}",
+            "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+        }
+
+        if state.remaining <= 0:
+            # buckets declared with an explicit hash are shared between routes
+            scope = "shared" if config.hash is not None else "user"
+            return self._ratelimited(
+                scope, reset_after, **ratelimit_headers, **{"X-RateLimit-Remaining": "0"}
+            )
+
+        state.remaining -= 1
+        ratelimit_headers["X-RateLimit-Remaining"] = str(state.remaining)
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.errors += 1
+            return web.Response(
+                status=self._random.choice(self.error_statuses),
+                text="upstream connect error",
+                headers=self._headers(**ratelimit_headers),
+            )
+
+        # let other requests interleave like they would over the network
+        await asyncio.sleep(0)
+        return web.Response(
+            text=dumps(self._response_for(key)),
+            content_type="application/json",
+            headers=self._headers(**ratelimit_headers),
+        )
+
+    def _response_for(self, key: str) -> t.Any:
+        if key in self._responses:
+            return self._responses[key]
+
+        if key == "GET /gateway/bot":
+            return {
+                "url": self.gateway_url,
+                "shards": 1,
+                "session_start_limit": {
+                    "total": 1000,
+                    "remaining": 1000,
+                    "reset_after": 0,
+                    "max_concurrency": 1,
+                },
+            }
+
+        return {}
@@ -88,6 +88,19 @@ class Dispatcher:
         """
         return name in self.events
 
+    def has_callbacks(self, name: str) -> bool:
+        """Check if an event of this dispatcher has any callbacks.
+        Dispatching an event without callbacks does nothing.
+
+        Args:
+            name (str): The name of the event.
+
+        Returns:
+            A bool correlating to if the event exists and has callbacks or not.
+        """
+        event = self.events.get(name)
+        return event is not None and bool(event.callbacks)
+
     def callback_for(
         self, event: str, *, one_shot: bool = False, force_parent: bool = False
     ) -> Callable[[CoroFunc], Event]:
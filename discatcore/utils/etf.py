@@ -0,0 +1,235 @@
+# SPDX-License-Identifier: MIT
+
+# The subset of the Erlang External Term Format used by the Discord Gateway.
+# Binaries and atoms are decoded into strings (except for nil, true and false) and big integers
+# are decoded into ints, so snowflakes sent as integers never go through a string.
+# This is pure Python, so decoding is many times slower than decoding JSON with orjson
+# (see benchmarks/encoding.py).
+
+import struct
+import typing as t
+import zlib
+from collections.abc import Mapping
+
+__all__ = ("ETFError", "dumps", "loads")
+
+VERSION = 131
+
+NEW_FLOAT_EXT = 70
+COMPRESSED = 80
+SMALL_INTEGER_EXT = 97
+INTEGER_EXT = 98
+FLOAT_EXT = 99
+ATOM_EXT = 100
+SMALL_TUPLE_EXT = 104
+LARGE_TUPLE_EXT = 105
+NIL_EXT = 106
+STRING_EXT = 107
+LIST_EXT = 108
+BINARY_EXT = 109
+SMALL_BIG_EXT = 110
+LARGE_BIG_EXT = 111
+MAP_EXT = 116
+ATOM_UTF8_EXT = 118
+SMALL_ATOM_UTF8_EXT = 119
+SMALL_ATOM_EXT = 115
+
+_ATOMS: dict[str, t.Any] = {"nil": None, "true": True, "false": False}
+
+_UINT16 = struct.Struct(">H")
+_UINT32 = struct.Struct(">I")
+_INT32 = struct.Struct(">i")
+_DOUBLE = struct.Struct(">d")
+
+
+class ETFError(ValueError):
+    """Represents an error while encoding or decoding an ETF term."""
+
+    pass
+
+
+def _decode(data: bytes, i: int) -> tuple[t.Any, int]:
+    # returns the decoded term and the offset after it, the most common tags are checked first
+    tag = data[i]
+    i += 1
+
+    if tag == BINARY_EXT:
+        end = i + 4 + _UINT32.unpack_from(data, i)[0]
+        return data[i + 4 : end].decode("utf-8"), end
+
+    if tag == MAP_EXT:
+        (arity,) = _UINT32.unpack_from(data, i)
+        i += 4
+        out: dict[t.Any, t.Any] = {}
+        for _ in range(arity):
+            key, i = _decode(data, i)
+            out[key], i = _decode(data, i)
+        return out, i
+
+    if tag == SMALL_INTEGER_EXT:
+        return data[i], i + 1
+
+    if tag == SMALL_ATOM_UTF8_EXT or tag == SMALL_ATOM_EXT:
+        end = i + 1 + data[i]
+        atom = data[i + 1 : end].decode("utf-8")
+        return _ATOMS.get(atom, atom), end
+
+    if tag == LIST_EXT:
+        (length,) = _UINT32.unpack_from(data, i)
+        i += 4
+        items: list[t.Any] = []
+        for _ in range(length):
+            item, i = _decode(data, i)
+            items.append(item)
+        # proper lists end with a NIL_EXT tail
+        if data[i] == NIL_EXT:
+            i += 1
+        else:
+            item, i = _decode(data, i)
+            items.append(item)
+        return items, i
+
+    if tag == NIL_EXT:
+        return [], i
+
+    if tag == SMALL_BIG_EXT or tag == LARGE_BIG_EXT:
+        if tag == SMALL_BIG_EXT:
+            length = data[i]
+            i += 1
+        else:
+            (length,) = _UINT32.unpack_from(data, i)
+            i += 4
+        end = i + 1 + length
+        value = int.from_bytes(data[i + 1 : end], "little")
+        return -value if data[i] else value, end
+
+    if tag == INTEGER_EXT:
+        return _INT32.unpack_from(data, i)[0], i + 4
+
+    if tag == ATOM_EXT or tag == ATOM_UTF8_EXT:
+        end = i + 2 + _UINT16.unpack_from(data, i)[0]
+        atom = data[i + 2 : end].decode("utf-8")
+        return _ATOMS.get(atom, atom), end
+
+    if tag == NEW_FLOAT_EXT:
+        return _DOUBLE.unpack_from(data, i)[0], i + 8
+
+    if tag == FLOAT_EXT:
+        end = i + 31
+        return float(data[i:end].rstrip(b"\x00")), end
+
+    if tag == STRING_EXT:
+        # strings are lists of bytes
+        end = i + 2 + _UINT16.unpack_from(data, i)[0]
+        return list(data[i + 2 : end]), end
+
+    if tag == SMALL_TUPLE_EXT or tag == LARGE_TUPLE_EXT:
+        if tag == SMALL_TUPLE_EXT:
+            arity = data[i]
+            i += 1
+        else:
+            (arity,) = _UINT32.unpack_from(data, i)
+            i += 4
+        elements: list[t.Any] = []
+        for _ in range(arity):
+            item, i = _decode(data, i)
+            elements.append(item)
+        return elements, i
+
+    raise ETFError(f"Unknown ETF tag {tag} at offset {i - 1}!")
+
+
+def loads(obj: t.Union[bytes, bytearray, memoryview]) -> t.Any:
+    """Decodes an ETF term.
+
+    Args:
+        obj (t.Union[bytes, bytearray, memoryview]): The raw ETF data. This has to start with the version byte.
+
+    Returns:
+        The decoded term.
+    """
+    data = bytes(obj)
+    if not data or data[0] != VERSION:
+        raise ETFError("ETF data does not start with the version byte!")
+
+    try:
+        if len(data) > 1 and data[1] == COMPRESSED:
+            (size,) = _UINT32.unpack_from(data, 2)
+            inflated = zlib.decompress(data[6:])
+            if len(inflated) != size:
+                raise ETFError("Compressed ETF term has the wrong size!")
+            return _decode(inflated, 0)[0]
+
+        return _decode(data, 1)[0]
+    except (IndexError, struct.error, zlib.error) as e:
+        raise ETFError("ETF data is malformed!") from e
+
+
+def _encode(obj: t.Any, out: bytearray) -> None:
+    if obj is None:
+        out += b"\x77\x03nil"
+    elif obj is True:
+        out += b"\x77\x04true"
+    elif obj is False:
+        out += b"\x77\x05false"
+    elif isinstance(obj, str):
+        raw = obj.encode("utf-8")
+        out.append(BINARY_EXT)
+        out += _UINT32.pack(len(raw))
+        out += raw
+    elif isinstance(obj, int):
+        if 0 <= obj <= 255:
+            out.append(SMALL_INTEGER_EXT)
+            out.append(obj)
+        elif -(2**31) <= obj < 2**31:
+            out.append(INTEGER_EXT)
+            out += _INT32.pack(obj)
+        else:
+            value = abs(obj)
+            raw = value.to_bytes((value.bit_length() + 7) // 8, "little")
+            if len(raw) > 255:
+                out.append(LARGE_BIG_EXT)
+                out += _UINT32.pack(len(raw))
+            else:
+                out.append(SMALL_BIG_EXT)
+                out.append(len(raw))
+            out.append(1 if obj < 0 else 0)
+            out += raw
+    elif isinstance(obj, float):
+        out.append(NEW_FLOAT_EXT)
+        out += _DOUBLE.pack(obj)
+    elif isinstance(obj, Mapping):
+        obj = t.cast(Mapping[t.Any, t.Any], obj)
+        out.append(MAP_EXT)
+        out += _UINT32.pack(len(obj))
+        for key, value in obj.items():
+            _encode(key, out)
+            _encode(value, out)
+    elif isinstance(obj, (list, tuple)):
+        obj = t.cast(t.Union[list[t.Any], tuple[t.Any, ...]], obj)
+        if obj:
+            out.append(LIST_EXT)
+            out += _UINT32.pack(len(obj))
+            for item in obj:
+                _encode(item, out)
+        out.append(NIL_EXT)
+    elif isinstance(obj, (bytes, bytearray)):
+        out.append(BINARY_EXT)
+        out += _UINT32.pack(len(obj))
+        out += obj
+    else:
+        raise ETFError(f"Object of type {type(obj).__name__} cannot be encoded into ETF!")
+
+
+def dumps(obj: t.Any) -> bytes:
+    """Encodes an object into an ETF term.
+
+    Args:
+        obj (t.Any): The object to encode. Strings are encoded as binaries.
+
+    Returns:
+        The raw ETF data.
+    """
+    out = bytearray((VERSION,))
+    _encode(obj, out)
+    return bytes(out)
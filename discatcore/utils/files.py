@@ -0,0 +1,23 @@
+# SPDX-License-Identifier: MIT
+
+import os
+import pathlib
+
+__all__ = ("write_atomic",)
+
+
+def write_atomic(path: pathlib.Path, data: bytes) -> None:
+    """Replaces the contents of a file, creating its directory if it does not exist.
+
+    The data is written to a temporary file next to it first, which then replaces the file,
+    so a crash never leaves a half written file behind.
+
+    Args:
+        path (pathlib.Path): The file to write to.
+        data (bytes): The new contents of the file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
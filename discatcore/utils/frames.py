@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import struct
+import typing as t
+
+from .json import dumps_bytes, loads
+
+__all__ = ("read_frame", "encode_frame", "write_frame")
+
+# Frames are a 1 byte frame type and a 4 byte payload length followed by the JSON payload.
+_FRAME_HEADER = struct.Struct(">BI")
+
+
+async def read_frame(
+    reader: asyncio.StreamReader, max_length: t.Optional[int] = None
+) -> tuple[int, t.Any]:
+    """Reads a frame from a stream between local processes.
+
+    Args:
+        reader (asyncio.StreamReader): The stream to read from.
+        max_length (t.Optional[int]): The maximum length (in bytes) of the payload. Defaults to None.
+
+    Raises:
+        ValueError: The payload is longer than the maximum length.
+
+    Returns:
+        The frame type and the decoded payload.
+    """
+    frame_type, length = _FRAME_HEADER.unpack(await reader.readexactly(_FRAME_HEADER.size))
+    if max_length is not None and length > max_length:
+        raise ValueError(f"Frame of {length} bytes is larger than {max_length} bytes.")
+
+    payload = await reader.readexactly(length)
+    return frame_type, loads(payload)
+
+
+def encode_frame(frame_type: int, payload: t.Any) -> bytes:
+    """Encodes a frame for a stream between local processes.
+
+    Args:
+        frame_type (int): The frame type.
+        payload (t.Any): The payload. This must be JSON serializable.
+
+    Returns:
+        The encoded frame.
+    """
+    raw = dumps_bytes(payload)
+    return _FRAME_HEADER.pack(frame_type, len(raw)) + raw
+
+
+def write_frame(writer: asyncio.StreamWriter, frame_type: int, payload: t.Any) -> None:
+    """Writes a frame to a stream between local processes.
+
+    Args:
+        writer (asyncio.StreamWriter): The stream to write to.
+        frame_type (int): The frame type.
+        payload (t.Any): The payload. This must be JSON serializable.
+    """
+    writer.write(encode_frame(frame_type, payload))
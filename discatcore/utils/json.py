@@ -10,7 +10,7 @@ try:
 except ImportError:
     import json
 
-__all__ = ("dumps", "loads")
+__all__ = ("dumps", "dumps_bytes", "loads")
 
 
 def dumps(obj: t.Any) -> str:
@@ -19,7 +19,15 @@ def dumps(obj: t.Any) -> str:
     return json.dumps(obj)
 
 
-def loads(obj: str) -> t.Any:
+def dumps_bytes(obj: t.Any) -> bytes:
+    if has_orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def loads(obj: t.Union[str, bytes, bytearray, memoryview]) -> t.Any:
     if has_orjson:
         return orjson.loads(obj)
+    if isinstance(obj, memoryview):
+        obj = obj.tobytes()
     return json.loads(obj)
@@ -1,13 +1,18 @@
 # SPDX-License-Identifier: MIT
 
 import asyncio
+import heapq
 import logging
+import time
 import typing as t
+from collections import deque
 
 __all__ = (
     "BaseRatelimiter",
     "ManualRatelimiter",
     "BurstRatelimiter",
+    "TokenBucketRatelimiter",
+    "PermitRatelimiter",
 )
 
 _log = logging.getLogger(__name__)
@@ -81,3 +86,343 @@ class BurstRatelimiter(ManualRatelimiter):
             self.lock_for(self.reset_after)
 
         return await super().acquire()
+
+
+class TokenBucketRatelimiter:
+    """A ratelimiter that allows ``limit`` acquires in any ``per`` second window. Every acquire uses up a
+    token, which comes back ``per`` seconds after it was taken, so the limit can never be exceeded, not even
+    right after a burst.
+
+    Waiters are served by priority (lower values go first) and in FIFO order within the same priority.
+    ``reserved`` tokens are held back for acquires with a priority of ``reserved_priority`` or lower.
+
+    Args:
+        limit (int): The maximum amount of tokens.
+        per (float): How long (in seconds) it takes for a token to come back after it was taken.
+        reserved (int): The amount of tokens only high priority acquires can use. Defaults to 0.
+        reserved_priority (int): The highest priority value that can use the reserved tokens. Defaults to 0.
+
+    Attributes:
+        limit (int): The maximum amount of tokens.
+        per (float): How long (in seconds) it takes for a token to come back after it was taken.
+        reserved (int): The amount of tokens only high priority acquires can use.
+        reserved_priority (int): The highest priority value that can use the reserved tokens.
+    """
+
+    __slots__ = (
+        "limit",
+        "per",
+        "reserved",
+        "reserved_priority",
+        "_taken",
+        "_waiters",
+        "_counter",
+        "_task",
+    )
+
+    def __init__(
+        self, limit: int, per: float, *, reserved: int = 0, reserved_priority: int = 0
+    ) -> None:
+        if limit <= 0:
+            raise ValueError("limit parameter cannot be negative or 0!")
+        if not 0 <= reserved < limit:
+            raise ValueError(f"reserved parameter must be between 0 and {limit - 1}!")
+
+        self.limit: int = limit
+        self.per: float = per
+        self.reserved: int = reserved
+        self.reserved_priority: int = reserved_priority
+        # when the tokens of the current window were taken, oldest first
+        self._taken: deque[float] = deque()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter: int = 0
+        self._task: t.Optional[asyncio.Task[None]] = None
+
+    @property
+    def tokens(self) -> int:
+        """The amount of tokens that are currently available, including the reserved ones."""
+        self._refill(time.monotonic())
+        return self.limit - len(self._taken)
+
+    def _refill(self, now: float) -> None:
+        while self._taken and self._taken[0] + self.per <= now:
+            self._taken.popleft()
+
+    def _available(self, priority: int) -> int:
+        if priority <= self.reserved_priority:
+            return self.limit - len(self._taken)
+        return self.limit - len(self._taken) - self.reserved
+
+    def reset(self) -> None:
+        """Gives every token back at once."""
+        self._taken.clear()
+
+    async def acquire(self, priority: int = 0) -> None:
+        """Waits until a token is available and takes it.
+
+        Args:
+            priority (int): The priority of this acquire. Lower values are served first. Defaults to 0.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        # only skip the queue if nobody with the same or a higher priority is waiting
+        if (not self._waiters or self._waiters[0][0] > priority) and self._available(priority) >= 1:
+            self._taken.append(now)
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._counter += 1
+        heapq.heappush(self._waiters, (priority, self._counter, future))
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._wake_waiters())
+
+        await future
+
+    async def _wake_waiters(self) -> None:
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.done():
+                # the waiter was cancelled
+                heapq.heappop(self._waiters)
+                continue
+
+            now = time.monotonic()
+            self._refill(now)
+            available = self._available(priority)
+            if available >= 1:
+                heapq.heappop(self._waiters)
+                self._taken.append(now)
+                future.set_result(None)
+                continue
+
+            # the tokens needed come back when the oldest ones taken leave the window
+            delay = self._taken[-available] + self.per - now
+            _log.debug("Waiting %f seconds for a token with priority %d.", delay, priority)
+            await asyncio.sleep(delay)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+        return None
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        pass
+
+
+class PermitRatelimiter:
+    """A ratelimiter that hands out a permit for every acquire, and at most ``limit`` permits per window.
+
+    Permits are taken before the ratelimited action happens, so concurrent acquires can never go over the
+    limit. Waiters are served in FIFO order, and exactly as many waiters as there are permits are woken up
+    when the window resets. Until :meth:`.update` is called for the first time, the limit is unknown and
+    only one acquire is let through at a time.
+
+    Use this ratelimiter as an async context manager, which gives the permit back to the ratelimiter
+    (see :meth:`.release`) once the action is over.
+
+    Attributes:
+        limit (t.Optional[int]): The amount of permits per window. This is None if the limit is unknown or if
+            there is no limit.
+        remaining (t.Optional[int]): The amount of permits left in the current window.
+        reset_after (t.Optional[float]): How long (in seconds) a window lasts.
+    """
+
+    __slots__ = (
+        "limit",
+        "remaining",
+        "reset_after",
+        "_known",
+        "_reset_at",
+        "_window",
+        "_in_flight",
+        "_blind",
+        "_waiters",
+        "_timer",
+    )
+
+    def __init__(self) -> None:
+        self.limit: t.Optional[int] = None
+        self.remaining: t.Optional[int] = None
+        self.reset_after: t.Optional[float] = None
+        self._known: bool = False
+        self._reset_at: t.Optional[float] = None
+        self._window: int = 0
+        self._in_flight: int = 0
+        self._blind: bool = False
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._timer: t.Optional[asyncio.TimerHandle] = None
+
+    @property
+    def in_flight(self) -> int:
+        """The amount of permits that have been handed out, but not released yet."""
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        """The amount of acquires waiting for a permit."""
+        return len(self._waiters)
+
+    @property
+    def window(self) -> int:
+        """A counter that goes up every time the window resets. Permits taken in an earlier window are not
+        counted by the ratelimited resource anymore.
+        """
+        self._maybe_reset()
+        return self._window
+
+    def is_locked(self) -> bool:
+        """Returns whether an acquire would have to wait for a permit."""
+        return bool(self._waiters) or not self._can_take()
+
+    def is_idle(self) -> bool:
+        """Returns whether nothing is using or waiting on this ratelimiter, and its last window is over.
+        Idle ratelimiters can be thrown away without losing track of a limit.
+        """
+        if self._waiters or self._in_flight:
+            return False
+        return self._reset_at is None or time.monotonic() >= self._reset_at
+
+    def _maybe_reset(self) -> None:
+        if not self._known or self.limit is None:
+            return
+
+        now = time.monotonic()
+        if self._reset_at is not None and now >= self._reset_at:
+            self.remaining = self.limit
+            self._window += 1
+            # an estimate until the next update tells us when the new window resets
+            self._reset_at = now + self.reset_after if self.reset_after is not None else None
+        elif self._reset_at is None and not self.remaining and not self._in_flight:
+            # nothing is left that could tell us when the window resets
+            self.remaining = self.limit
+            self._window += 1
+
+    def _can_take(self) -> bool:
+        if not self._known:
+            return not self._blind
+        if self.limit is None:
+            return True
+
+        self._maybe_reset()
+        return bool(self.remaining)
+
+    def _take(self) -> None:
+        self._in_flight += 1
+        if not self._known:
+            self._blind = True
+        elif self.limit is not None and self.remaining is not None:
+            self.remaining -= 1
+
+    def _wake(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._waiters:
+            future = self._waiters[0]
+            if future.done():
+                # the waiter was cancelled
+                self._waiters.popleft()
+                continue
+            if not self._can_take():
+                break
+
+            self._waiters.popleft()
+            self._take()
+            future.set_result(None)
+
+        if self._waiters and self._reset_at is not None:
+            self._timer = asyncio.get_running_loop().call_later(
+                max(0.0, self._reset_at - time.monotonic()), self._wake
+            )
+
+    async def acquire(self) -> None:
+        """Waits until a permit is available and takes it."""
+        if not self._waiters and self._can_take():
+            self._take()
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        self._wake()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # the permit was handed out right before the waiter was cancelled, so it is unused
+                self.release(used=False)
+            raise
+
+    def release(self, *, used: bool = True) -> None:
+        """Gives a permit back to the ratelimiter once the ratelimited action is over.
+
+        Args:
+            used (bool): Whether the permit was used. Unused permits can be handed out again in
+                the same window. Defaults to True.
+        """
+        self._in_flight = max(0, self._in_flight - 1)
+        self._blind = False
+        if not used and self.limit is not None and self.remaining is not None:
+            self.remaining = min(self.limit, self.remaining + 1)
+
+        self._wake()
+
+    def update(
+        self, limit: t.Optional[int], remaining: t.Optional[int], reset_after: t.Optional[float]
+    ) -> None:
+        """Updates the limit of this ratelimiter with the information from the ratelimited resource.
+
+        Args:
+            limit (t.Optional[int]): The amount of permits per window. Set this to None if there is no limit.
+            remaining (t.Optional[int]): The amount of permits left in the current window.
+            reset_after (t.Optional[float]): How long (in seconds) it takes for the current window to reset.
+        """
+        first_update = not self._known
+        self._known = True
+        self._maybe_reset()
+        self.limit = limit
+
+        if limit is None:
+            self.remaining = None
+            self._reset_at = None
+        elif remaining is not None:
+            if first_update or self.remaining is None:
+                # only the permit of the update itself was handed out so far
+                self.remaining = remaining
+            else:
+                # the local count already includes the permits that the resource has not seen yet
+                self.remaining = min(self.remaining, remaining)
+
+        if reset_after is not None:
+            reset_at = time.monotonic() + reset_after
+            if self._reset_at is None or reset_at > self._reset_at:
+                self._reset_at = reset_at
+            if self.reset_after is None or reset_after > self.reset_after:
+                self.reset_after = reset_after
+
+        self._wake()
+
+    def lock_for(self, delay: float) -> None:
+        """Takes every remaining permit away until a given amount of time has passed.
+
+        Args:
+            delay (float): How long (in seconds) to wait before the next window.
+        """
+        self._known = True
+        if self.limit is None:
+            # the limit is unknown, so only one permit is handed out per window
+            self.limit = 1
+        self.remaining = 0
+
+        reset_at = time.monotonic() + delay
+        if self._reset_at is None or reset_at > self._reset_at:
+            self._reset_at = reset_at
+        self._wake()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+        return None
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        self.release()
@@ -30,10 +30,12 @@ FILE_TEMPLATE: t.Final[
 
 {{0}}
 from .core import EndpointMixin
-from ..route import Route
+from ..route import Route, RouteTemplate
 
 __all__ = ("{{1}}",)
 
+{{3}}
+
 class {{1}}(EndpointMixin):
 {{2}}
 
@@ -324,7 +326,11 @@ def _generate_func_args(
             _generate_func_args_json_query(func_gen, extra_params)
 
 
-def parse_endpoint_func(name: str, func: dict[str, t.Any]) -> tuple[str, list[str]]:
+def route_constant_name(name: str) -> str:
+    return name.upper()
+
+
+def parse_endpoint_func(name: str, func: dict[str, t.Any]) -> tuple[str, str, list[str]]:
     method = _dict_type_check(func, "method", str)
     if method not in VALID_METHODS:
         raise ValueError(f"Invalid method {method}!")
@@ -400,14 +406,17 @@ def parse_endpoint_func(name: str, func: dict[str, t.Any]) -> tuple[str, list[st
     if extra_code:
         func_generator.print(*extra_code)
     func_generator.print(
-        f'return self.request(Route("{method}", "{url}"{fmted_url_params}){fmted_extra_params})'
+        f"return self.request(Route({route_constant_name(name)}{fmted_url_params}){fmted_extra_params})"
     )
 
-    return func_generator.generate_raw(), needed_imports
+    # the url is compiled once when the module is imported, instead of on every request
+    route_constant = f'{route_constant_name(name)} = RouteTemplate("{method}", "{url}")'
+    return func_generator.generate_raw(), route_constant, needed_imports
 
 
 def parse_json_file(file: dict[str, t.Any]) -> str:
     funcs: list[str] = []
+    route_constants: list[str] = []
     name = _dict_type_check(file, "name", str)
     methods: dict[str, t.Any] = _dict_type_check(file, "methods", dict[str, t.Any])
     requires: UnsetOr[list[str]] = _dict_type_check(file, "requires", list[str], is_required=False)
@@ -420,14 +429,20 @@ def parse_json_file(file: dict[str, t.Any]) -> str:
             used_imports.append(IMPORTS[requirement])
 
     for func_name, func_metadata in methods.items():
-        func, needed_imports = parse_endpoint_func(func_name, func_metadata)
+        func, route_constant, needed_imports = parse_endpoint_func(func_name, func_metadata)
+        route_constants.append(route_constant)
         funcs.append("\n".join([indent(line) for line in func.splitlines()]))
         for import_ in needed_imports:
             if import_ not in used_imports:
                 imports += f"{IMPORTS[import_]}\n"
                 used_imports.append(import_)
 
-    return FILE_TEMPLATE.format(imports, name, "\n\n".join(funcs) if len(funcs) else indent("pass"))
+    return FILE_TEMPLATE.format(
+        imports,
+        name,
+        "\n\n".join(funcs) if len(funcs) else indent("pass"),
+        "\n".join(route_constants),
+    )
 
 
 #